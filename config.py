@@ -200,11 +200,13 @@ LOG_LEVELS = {
     "CRITICAL": 4
 }
 
+LOG_LEVEL = "DEBUG"  # Minimum level BotLogger emits
 LOG_FORMAT = "[{timestamp}] {level}: {message}"
 LOG_DIR = "logs"
 LOG_FILE_PREFIX = "trading_bot"
 MAX_LOG_FILE_SIZE = 10 * 1024 * 1024  # 10MB
 MAX_LOG_FILES = 5
+FORCE_CONSOLE_LOG = False  # Echo logs to stdout even when it is not a terminal
 
 # === INDICATOR CONFIGURATION ===
 INDICATOR_PERIODS = {
@@ -217,7 +219,9 @@ INDICATOR_PERIODS = {
     "ATR": 14,
     "BB": 20,
     "Stochastic_K": 14,
-    "Stochastic_D": 3
+    "Stochastic_D": 3,
+    "Williams": 14,
+    "Momentum": 14
 }
 
 # === NOTIFICATION CONFIGURATION ===
@@ -106,6 +106,10 @@ class TradingBot:
             if self.main_thread and self.main_thread.is_alive():
                 self.main_thread.join(timeout=5.0)
             
+            # Stop the order close pool
+            if self.strategy_manager.order_manager:
+                self.strategy_manager.order_manager.shutdown()
+            
             # Cleanup resources
             cleanup_resources()
             
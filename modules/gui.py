@@ -71,9 +71,21 @@ class TradingBotGUI:
             # Bind close event
             self.root.protocol("WM_DELETE_WINDOW", self._on_closing)
             
+            # Pull queued log lines onto the Tk thread
+            self.root.after(100, self._pump_logs)
+            
         except Exception as e:
             self.logger.log(f"❌ Error creating main window: {str(e)}")
     
+    def _pump_logs(self) -> None:
+        """Deliver queued log messages from the Tk thread and reschedule."""
+        try:
+            if self.root:
+                self.logger.pump_gui()
+                self.root.after(100, self._pump_logs)
+        except Exception:
+            pass  # Window is being destroyed
+    
     def _create_main_frames(self) -> None:
         """Create main container frames."""
         try:
@@ -7,23 +7,312 @@ import numpy as np
 import pandas as pd
 from typing import Dict, Any, List, Optional, Tuple
 import datetime
+from functools import lru_cache
 
 from config import *
+from .streaming_indicators import StreamingIndicatorSet, PRICE_EPSILON
+
+# Numba is optional; the scalar kernels run as plain Python without it
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit that returns the function unchanged."""
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+# CuPy is optional; batch mode falls back to NumPy without it
+try:
+    import cupy as cp
+    CUPY_AVAILABLE = True
+except ImportError:
+    cp = None
+    CUPY_AVAILABLE = False
+
+
+# Output buffers kept per (symbol, timeframe) for the array path
+SCRATCH_BUFFERS = (
+    'ema_fast', 'ema_slow', 'sma', 'rsi', 'macd', 'macd_signal', 'macd_hist',
+    'bb_upper', 'bb_middle', 'bb_lower', 'atr', 'stoch_k', 'stoch_d',
+    'williams_r', 'momentum', 'tmp_a', 'tmp_b'
+)
+
+
+def _windows(x: np.ndarray, period: int) -> np.ndarray:
+    """Right-aligned rolling windows of x as a zero-copy view."""
+    return np.lib.stride_tricks.sliding_window_view(x, period)
+
+
+@njit(cache=True)
+def _ema_recurrence(x: np.ndarray, period: int, out: np.ndarray) -> np.ndarray:
+    """EMA seeded with x[0] (same as ewm(span=period, adjust=False)) written into out."""
+    alpha = 2.0 / (period + 1)
+    value = x[0]
+    out[0] = value
+    for i in range(1, x.shape[0]):
+        value = alpha * x[i] + (1.0 - alpha) * value
+        out[i] = value
+    return out
+
+
+def _ema_ewm_into(x: np.ndarray, period: int, out: np.ndarray) -> np.ndarray:
+    """EMA from pandas' compiled ewm(span=period, adjust=False) written into out."""
+    np.copyto(out, pd.Series(x).ewm(span=period, adjust=False).mean().to_numpy())
+    return out
+
+
+# The recurrence only pays off when numba compiles it; as a Python loop it is
+# an order of magnitude slower than pandas' ewm
+_ema_into = _ema_recurrence if NUMBA_AVAILABLE else _ema_ewm_into
+
+
+def _rolling_mean_into(x: np.ndarray, period: int, out: np.ndarray) -> np.ndarray:
+    """Rolling mean written into out, NaN until the window fills."""
+    out[:period - 1] = np.nan
+    if x.shape[0] >= period:
+        np.mean(_windows(x, period), axis=1, out=out[period - 1:])
+    return out
+
+
+def _rolling_max_into(x: np.ndarray, period: int, out: np.ndarray) -> np.ndarray:
+    """Rolling max written into out, NaN until the window fills."""
+    out[:period - 1] = np.nan
+    if x.shape[0] >= period:
+        np.max(_windows(x, period), axis=1, out=out[period - 1:])
+    return out
+
+
+def _rolling_min_into(x: np.ndarray, period: int, out: np.ndarray) -> np.ndarray:
+    """Rolling min written into out, NaN until the window fills."""
+    out[:period - 1] = np.nan
+    if x.shape[0] >= period:
+        np.min(_windows(x, period), axis=1, out=out[period - 1:])
+    return out
+
+
+def _rsi_into(x: np.ndarray, period: int, out: np.ndarray,
+              gain: np.ndarray, loss: np.ndarray) -> np.ndarray:
+    """RSI with simple-average smoothing written into out (gain/loss are scratch)."""
+    # gain holds the price delta first, then both are clipped in place
+    gain[0] = 0.0
+    np.subtract(x[1:], x[:-1], out=gain[1:])
+    np.negative(gain, out=loss)
+    np.maximum(gain, 0.0, out=gain)
+    np.maximum(loss, 0.0, out=loss)
+    _rolling_mean_into(gain, period, out)
+    _rolling_mean_into(loss, period, gain)
+    # out = average gain, gain = average loss; loss becomes RS scratch
+    flat = gain < PRICE_EPSILON
+    rising = out > PRICE_EPSILON
+    with np.errstate(divide='ignore', invalid='ignore'):
+        np.divide(out, gain, out=loss)
+        np.add(loss, 1.0, out=loss)
+        np.divide(100.0, loss, out=loss)
+        np.subtract(100.0, loss, out=out)
+    # No losses in the window: 100 if price rose, 50 if it was flat
+    out[flat] = 50.0
+    out[flat & rising] = 100.0
+    out[np.isnan(out)] = 50.0
+    return out
+
+
+def _bollinger_into(x: np.ndarray, period: int, std_dev: float, upper: np.ndarray,
+                    middle: np.ndarray, lower: np.ndarray) -> None:
+    """Bollinger Bands (sample std) written into upper/middle/lower."""
+    _rolling_mean_into(x, period, middle)
+    lower[:period - 1] = np.nan
+    if x.shape[0] >= period:
+        np.std(_windows(x, period), axis=1, ddof=1, out=lower[period - 1:])
+    np.multiply(lower, std_dev, out=lower)
+    np.add(middle, lower, out=upper)
+    np.subtract(middle, lower, out=lower)
+
+
+def _atr_into(high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int,
+              out: np.ndarray, true_range: np.ndarray) -> np.ndarray:
+    """ATR as a rolling mean of true range written into out (true_range is scratch)."""
+    np.subtract(high, low, out=true_range)
+    prev_close = close[:-1]
+    np.maximum(true_range[1:], np.abs(high[1:] - prev_close), out=true_range[1:])
+    np.maximum(true_range[1:], np.abs(low[1:] - prev_close), out=true_range[1:])
+    _rolling_mean_into(true_range, period, out)
+    out[np.isnan(out)] = 0.0008
+    return out
+
+
+def _stochastic_into(high: np.ndarray, low: np.ndarray, close: np.ndarray,
+                     k_period: int, d_period: int, k_out: np.ndarray, d_out: np.ndarray,
+                     highest: np.ndarray, lowest: np.ndarray) -> None:
+    """Stochastic %K/%D written into k_out/d_out (highest/lowest are scratch)."""
+    _rolling_max_into(high, k_period, highest)
+    _rolling_min_into(low, k_period, lowest)
+    np.subtract(close, lowest, out=k_out)
+    np.subtract(highest, lowest, out=highest)
+    flat = highest < PRICE_EPSILON
+    with np.errstate(divide='ignore', invalid='ignore'):
+        np.divide(k_out, highest, out=k_out)
+    np.multiply(k_out, 100.0, out=k_out)
+    # Zero high-low range: price is mid-range by definition
+    k_out[flat] = 50.0
+    _rolling_mean_into(k_out, d_period, d_out)
+
+
+def _williams_r_into(high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int,
+                     out: np.ndarray, highest: np.ndarray, lowest: np.ndarray) -> np.ndarray:
+    """Williams %R written into out (highest/lowest are scratch)."""
+    _rolling_max_into(high, period, highest)
+    _rolling_min_into(low, period, lowest)
+    np.subtract(highest, close, out=out)
+    np.subtract(highest, lowest, out=highest)
+    flat = highest < PRICE_EPSILON
+    with np.errstate(divide='ignore', invalid='ignore'):
+        np.divide(out, highest, out=out)
+    np.multiply(out, -100.0, out=out)
+    out[flat] = -50.0
+    return out
+
+
+def _momentum_into(x: np.ndarray, period: int, out: np.ndarray) -> np.ndarray:
+    """x[i] - x[i - period] written into out, NaN for the first period bars."""
+    out[:period] = np.nan
+    np.subtract(x[period:], x[:-period], out=out[period:])
+    return out
+
+
+def compute_indicators_batch(closes, ema_fast: int = 12, ema_slow: int = 26, rsi_period: int = 14,
+                             bb_period: int = 20, bb_std: float = 2.0,
+                             use_cuda: bool = False) -> Dict[str, np.ndarray]:
+    """
+    Latest EMA/RSI/Bollinger values for many symbols at once.
+    
+    Args:
+        closes: (symbols, bars) array of close prices
+        ema_fast: Fast EMA period
+        ema_slow: Slow EMA period
+        rsi_period: RSI period
+        bb_period: Bollinger Bands period
+        bb_std: Bollinger Bands standard deviation multiplier
+        use_cuda: Run on the GPU with CuPy when it is installed
+        
+    Returns:
+        Dict of per-symbol (symbols,) NumPy arrays for the last bar
+    """
+    xp = cp if use_cuda and CUPY_AVAILABLE else np
+    c = xp.asarray(closes, dtype=xp.float64)
+    if c.ndim != 2 or c.shape[1] <= max(rsi_period, bb_period):
+        raise ValueError(f"closes must be (symbols, bars) with more than "
+                         f"{max(rsi_period, bb_period)} bars, got {c.shape}")
+    
+    # EMA recurrences, vectorised across the symbol axis
+    alpha_fast = 2.0 / (ema_fast + 1)
+    alpha_slow = 2.0 / (ema_slow + 1)
+    fast = c[:, 0].copy()
+    slow = c[:, 0].copy()
+    for i in range(1, c.shape[1]):
+        fast = alpha_fast * c[:, i] + (1.0 - alpha_fast) * fast
+        slow = alpha_slow * c[:, i] + (1.0 - alpha_slow) * slow
+    
+    # Only the last window is needed for RSI and the bands
+    delta = xp.diff(c[:, -(rsi_period + 1):], axis=1)
+    avg_gain = xp.maximum(delta, 0.0).mean(axis=1)
+    avg_loss = xp.maximum(-delta, 0.0).mean(axis=1)
+    flat = avg_loss < PRICE_EPSILON
+    rs = avg_gain / xp.where(flat, 1.0, avg_loss)
+    rsi = xp.where(flat, xp.where(avg_gain > PRICE_EPSILON, 100.0, 50.0), 100.0 - 100.0 / (1.0 + rs))
+    
+    window = c[:, -bb_period:]
+    middle = window.mean(axis=1)
+    std = window.std(axis=1, ddof=1)
+    
+    result = {
+        'EMA_fast': fast,
+        'EMA_slow': slow,
+        'RSI': rsi,
+        'BB_upper': middle + std * bb_std,
+        'BB_middle': middle,
+        'BB_lower': middle - std * bb_std
+    }
+    if xp is not np:
+        result = {name: cp.asnumpy(values) for name, values in result.items()}
+    return result
+
+
+@lru_cache(maxsize=None)
+def _make_kernel(ema_fast: int, ema_slow: int, rsi: int, macd_fast: int, macd_slow: int,
+                 macd_signal: int, bb: int, atr: int, stoch_k: int, stoch_d: int,
+                 williams: int, momentum: int, sma: int = 20, bb_std: float = 2.0):
+    """
+    Build the legacy indicator pass with its periods bound as constants.
+    
+    One kernel is built per distinct period set and shared by every calculator.
+    
+    Returns:
+        kernel(high, low, close, buf) filling the SCRATCH_BUFFERS arrays in buf
+    """
+    def kernel(high: np.ndarray, low: np.ndarray, close: np.ndarray,
+               buf: Dict[str, np.ndarray]) -> None:
+        # Moving Averages
+        _ema_into(close, ema_fast, buf['ema_fast'])
+        _ema_into(close, ema_slow, buf['ema_slow'])
+        _rolling_mean_into(close, sma, buf['sma'])
+        
+        # Oscillators
+        _rsi_into(close, rsi, buf['rsi'], buf['tmp_a'], buf['tmp_b'])
+        
+        # MACD
+        _ema_into(close, macd_fast, buf['tmp_a'])
+        _ema_into(close, macd_slow, buf['tmp_b'])
+        np.subtract(buf['tmp_a'], buf['tmp_b'], out=buf['macd'])
+        _ema_into(buf['macd'], macd_signal, buf['macd_signal'])
+        np.subtract(buf['macd'], buf['macd_signal'], out=buf['macd_hist'])
+        
+        # Bollinger Bands
+        _bollinger_into(close, bb, bb_std, buf['bb_upper'], buf['bb_middle'], buf['bb_lower'])
+        
+        # ATR
+        _atr_into(high, low, close, atr, buf['atr'], buf['tmp_a'])
+        
+        # Stochastic
+        _stochastic_into(high, low, close, stoch_k, stoch_d,
+                         buf['stoch_k'], buf['stoch_d'], buf['tmp_a'], buf['tmp_b'])
+        
+        # Williams %R
+        _williams_r_into(high, low, close, williams, buf['williams_r'], buf['tmp_a'], buf['tmp_b'])
+        
+        # Momentum
+        _momentum_into(close, momentum, buf['momentum'])
+    
+    return kernel
 
 
 class IndicatorCalculator:
     """Calculates technical indicators from market data."""
     
-    def __init__(self, logger, mt5_instance):
+    def __init__(self, logger, mt5_instance, use_cuda: bool = False):
         """Initialize indicator calculator."""
         self.logger = logger
         self.mt5 = mt5_instance
+        self.use_cuda = use_cuda and CUPY_AVAILABLE
+        if use_cuda and not CUPY_AVAILABLE:
+            self.logger.log("⚠️ CuPy not available - batch indicators will run on CPU")
         self.indicator_cache = {}
         self.cache_duration = 60  # Cache for 60 seconds
+        self._states: Dict[str, StreamingIndicatorSet] = {}
+        self._scratch: Dict[Tuple[str, int], Dict[str, np.ndarray]] = {}
+        self._kernel = _make_kernel(
+            INDICATOR_PERIODS['EMA_fast'], INDICATOR_PERIODS['EMA_slow'], INDICATOR_PERIODS['RSI'],
+            INDICATOR_PERIODS['MACD_fast'], INDICATOR_PERIODS['MACD_slow'], INDICATOR_PERIODS['MACD_signal'],
+            INDICATOR_PERIODS['BB'], INDICATOR_PERIODS['ATR'],
+            INDICATOR_PERIODS['Stochastic_K'], INDICATOR_PERIODS['Stochastic_D'],
+            INDICATOR_PERIODS['Williams'], INDICATOR_PERIODS['Momentum'])
         
-    def get_symbol_data(self, symbol: str, timeframe: int = None, count: int = 100) -> Optional[pd.DataFrame]:
+    def get_symbol_rates_raw(self, symbol: str, timeframe: int = None, count: int = 100) -> Optional[np.ndarray]:
         """
-        Get historical data for symbol.
+        Get historical rates for symbol as the structured array MT5 returns.
         
         Args:
             symbol: Trading symbol
@@ -31,7 +320,7 @@ class IndicatorCalculator:
             count: Number of bars to retrieve
             
         Returns:
-            DataFrame with OHLCV data or None
+            Structured array with time/open/high/low/close/tick_volume fields or None
         """
         try:
             if not self.mt5:
@@ -46,6 +335,36 @@ class IndicatorCalculator:
                 self.logger.log(f"❌ No rate data for {symbol}")
                 return None
             
+            if not isinstance(rates, np.ndarray):
+                # Mock/alternate backends may return a list of dicts
+                rates = pd.DataFrame(rates).to_records(index=False)
+            
+            return rates
+            
+        except Exception as e:
+            self.logger.log(f"❌ Error getting rates for {symbol}: {str(e)}")
+            return None
+    
+    def get_symbol_data(self, symbol: str, timeframe: int = None, count: int = 100) -> Optional[pd.DataFrame]:
+        """
+        Get historical data for symbol as a DataFrame (for strategies/GUI).
+        
+        Indicator-only callers should prefer get_symbol_rates_raw, which skips
+        the DataFrame and datetime index construction.
+        
+        Args:
+            symbol: Trading symbol
+            timeframe: MT5 timeframe (default M1)
+            count: Number of bars to retrieve
+            
+        Returns:
+            DataFrame with OHLCV data or None
+        """
+        try:
+            rates = self.get_symbol_rates_raw(symbol, timeframe, count)
+            if rates is None:
+                return None
+            
             # Convert to DataFrame
             df = pd.DataFrame(rates)
             df['time'] = pd.to_datetime(df['time'], unit='s')
@@ -56,7 +375,76 @@ class IndicatorCalculator:
         except Exception as e:
             self.logger.log(f"❌ Error getting symbol data for {symbol}: {str(e)}")
             return None
-    
+
+    def update_symbol(self, symbol: str, new_bar, timeframe: int = None) -> Dict[str, Any]:
+        """
+        Update streaming indicators for symbol with one new closed bar.
+
+        The first call for a symbol primes the states from history (full
+        recompute); later calls cost O(1) per indicator.
+
+        Args:
+            symbol: Trading symbol
+            new_bar: Rates record or dict with open/high/low/close/time
+            timeframe: MT5 timeframe used for priming (default M1)
+
+        Returns:
+            Dict with latest indicator values or empty dict
+        """
+        try:
+            states = self._states.get(symbol)
+            if states is None:
+                states = self._prime_streaming_state(symbol, timeframe, new_bar)
+                if states is None:
+                    return {}
+                self._states[symbol] = states
+
+            return states.update(new_bar)
+
+        except Exception as e:
+            self.logger.log(f"❌ Error updating streaming indicators for {symbol}: {str(e)}")
+            return {}
+
+    def _prime_streaming_state(self, symbol: str, timeframe: int, new_bar,
+                               count: int = 300) -> Optional[StreamingIndicatorSet]:
+        """Build streaming states for symbol by replaying bars older than new_bar."""
+        if not self.mt5:
+            return None
+
+        states = StreamingIndicatorSet(
+            macd_fast=INDICATOR_PERIODS['MACD_fast'],
+            macd_slow=INDICATOR_PERIODS['MACD_slow'],
+            macd_signal=INDICATOR_PERIODS['MACD_signal'],
+            bb_period=INDICATOR_PERIODS['BB'],
+            atr_period=INDICATOR_PERIODS['ATR'],
+            stoch_k=INDICATOR_PERIODS['Stochastic_K'],
+            stoch_d=INDICATOR_PERIODS['Stochastic_D']
+        )
+
+        rates = self.get_symbol_rates_raw(symbol, timeframe, count)
+        if rates is None:
+            # No history: start cold from the new bar
+            return states
+
+        try:
+            new_time = int(new_bar['time'])
+        except (KeyError, ValueError, IndexError, TypeError):
+            new_time = None
+
+        for bar in rates:
+            if new_time is not None and int(bar['time']) >= new_time:
+                break
+            states.update(bar)
+
+        return states
+
+    def reset_streaming_state(self, symbol: str = None) -> None:
+        """Drop streaming states for symbol (or all symbols) to force a re-prime."""
+        if symbol is None:
+            self._states.clear()
+        else:
+            self._states.pop(symbol, None)
+
     def calculate_ema(self, data: pd.Series, period: int) -> pd.Series:
         """
         Calculate Exponential Moving Average.
@@ -68,11 +456,17 @@ class IndicatorCalculator:
         Returns:
             EMA series
         """
-        try:
+        if not NUMBA_AVAILABLE:
             return data.ewm(span=period, adjust=False).mean()
-        except Exception as e:
-            self.logger.log(f"❌ Error calculating EMA: {str(e)}")
-            return pd.Series()
+        
+        values = data.to_numpy(dtype=np.float64)
+        if values.shape[0] == 0 or np.isnan(values).any():
+            # Gaps need pandas' NaN-skipping semantics
+            return data.ewm(span=period, adjust=False).mean()
+        
+        ema = np.empty(values.shape[0])
+        _ema_into(values, period, ema)
+        return pd.Series(ema, index=data.index)
     
     def calculate_sma(self, data: pd.Series, period: int) -> pd.Series:
         """
@@ -85,11 +479,7 @@ class IndicatorCalculator:
         Returns:
             SMA series
         """
-        try:
-            return data.rolling(window=period).mean()
-        except Exception as e:
-            self.logger.log(f"❌ Error calculating SMA: {str(e)}")
-            return pd.Series()
+        return data.rolling(window=period).mean()
     
     def calculate_rsi(self, data: pd.Series, period: int = 14) -> pd.Series:
         """
@@ -102,19 +492,13 @@ class IndicatorCalculator:
         Returns:
             RSI series
         """
-        try:
-            delta = data.diff()
-            gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
-            loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
-            
-            rs = gain / loss
-            rsi = 100 - (100 / (1 + rs))
-            
-            return rsi.fillna(50)
-            
-        except Exception as e:
-            self.logger.log(f"❌ Error calculating RSI: {str(e)}")
-            return pd.Series()
+        values = data.to_numpy(dtype=np.float64)
+        n = values.shape[0]
+        rsi = np.empty(n)
+        if n:
+            _rsi_into(values, period, rsi, np.empty(n), np.empty(n))
+        
+        return pd.Series(rsi, index=data.index)
     
     def calculate_macd(self, data: pd.Series, fast: int = 12, slow: int = 26, signal: int = 9) -> Dict[str, pd.Series]:
         """
@@ -129,23 +513,18 @@ class IndicatorCalculator:
         Returns:
             Dict with MACD, signal, and histogram series
         """
-        try:
-            ema_fast = self.calculate_ema(data, fast)
-            ema_slow = self.calculate_ema(data, slow)
-            
-            macd_line = ema_fast - ema_slow
-            signal_line = self.calculate_ema(macd_line, signal)
-            histogram = macd_line - signal_line
-            
-            return {
-                'macd': macd_line,
-                'signal': signal_line,
-                'histogram': histogram
-            }
-            
-        except Exception as e:
-            self.logger.log(f"❌ Error calculating MACD: {str(e)}")
-            return {}
+        ema_fast = self.calculate_ema(data, fast)
+        ema_slow = self.calculate_ema(data, slow)
+        
+        macd_line = ema_fast - ema_slow
+        signal_line = self.calculate_ema(macd_line, signal)
+        histogram = macd_line - signal_line
+        
+        return {
+            'macd': macd_line,
+            'signal': signal_line,
+            'histogram': histogram
+        }
     
     def calculate_bollinger_bands(self, data: pd.Series, period: int = 20, std_dev: float = 2.0) -> Dict[str, pd.Series]:
         """
@@ -159,22 +538,17 @@ class IndicatorCalculator:
         Returns:
             Dict with upper, middle, and lower bands
         """
-        try:
-            middle = self.calculate_sma(data, period)
-            std = data.rolling(window=period).std()
-            
-            upper = middle + (std * std_dev)
-            lower = middle - (std * std_dev)
-            
-            return {
-                'upper': upper,
-                'middle': middle,
-                'lower': lower
-            }
-            
-        except Exception as e:
-            self.logger.log(f"❌ Error calculating Bollinger Bands: {str(e)}")
-            return {}
+        middle = self.calculate_sma(data, period)
+        std = data.rolling(window=period).std()
+        
+        upper = middle + (std * std_dev)
+        lower = middle - (std * std_dev)
+        
+        return {
+            'upper': upper,
+            'middle': middle,
+            'lower': lower
+        }
     
     def calculate_atr(self, data: pd.DataFrame, period: int = 14) -> pd.Series:
         """
@@ -189,25 +563,20 @@ class IndicatorCalculator:
         Returns:
             ATR series
         """
-        try:
-            high = data['high']
-            low = data['low']
-            close = data['close']
-            
-            prev_close = close.shift(1)
-            
-            tr1 = high - low
-            tr2 = abs(high - prev_close)
-            tr3 = abs(low - prev_close)
-            
-            true_range = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
-            atr = true_range.rolling(window=period).mean()
-            
-            return atr.fillna(0.0008)
-            
-        except Exception as e:
-            self.logger.log(f"❌ Error calculating ATR: {str(e)}")
-            return pd.Series()
+        high = data['high']
+        low = data['low']
+        close = data['close']
+        
+        prev_close = close.shift(1)
+        
+        tr1 = high - low
+        tr2 = abs(high - prev_close)
+        tr3 = abs(low - prev_close)
+        
+        true_range = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
+        atr = true_range.rolling(window=period).mean()
+        
+        return atr.fillna(0.0008)
     
     def calculate_stochastic(self, high: pd.Series, low: pd.Series, close: pd.Series, 
                            k_period: int = 14, d_period: int = 3) -> Dict[str, pd.Series]:
@@ -224,21 +593,24 @@ class IndicatorCalculator:
         Returns:
             Dict with %K and %D series
         """
-        try:
-            lowest_low = low.rolling(window=k_period).min()
-            highest_high = high.rolling(window=k_period).max()
-            
-            k_percent = 100 * ((close - lowest_low) / (highest_high - lowest_low))
-            d_percent = k_percent.rolling(window=d_period).mean()
-            
-            return {
-                'k': k_percent,
-                'd': d_percent
-            }
-            
-        except Exception as e:
-            self.logger.log(f"❌ Error calculating Stochastic: {str(e)}")
-            return {}
+        k_values, d_values = self._stochastic_arrays(
+            high.to_numpy(dtype=np.float64), low.to_numpy(dtype=np.float64),
+            close.to_numpy(dtype=np.float64), k_period, d_period)
+        
+        return {
+            'k': pd.Series(k_values, index=close.index),
+            'd': pd.Series(d_values, index=close.index)
+        }
+    
+    def _stochastic_arrays(self, high: np.ndarray, low: np.ndarray, close: np.ndarray,
+                           k_period: int, d_period: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Run the windowed max/min Stochastic kernel on fresh output arrays."""
+        n = close.shape[0]
+        k_values = np.empty(n)
+        d_values = np.empty(n)
+        _stochastic_into(high, low, close, k_period, d_period,
+                         k_values, d_values, np.empty(n), np.empty(n))
+        return k_values, d_values
     
     def calculate_williams_r(self, high: pd.Series, low: pd.Series, close: pd.Series, period: int = 14) -> pd.Series:
         """
@@ -253,17 +625,13 @@ class IndicatorCalculator:
         Returns:
             Williams %R series
         """
-        try:
-            highest_high = high.rolling(window=period).max()
-            lowest_low = low.rolling(window=period).min()
-            
-            williams_r = -100 * ((highest_high - close) / (highest_high - lowest_low))
-            
-            return williams_r
-            
-        except Exception as e:
-            self.logger.log(f"❌ Error calculating Williams %R: {str(e)}")
-            return pd.Series()
+        close_values = close.to_numpy(dtype=np.float64)
+        n = close_values.shape[0]
+        williams_r = np.empty(n)
+        _williams_r_into(high.to_numpy(dtype=np.float64), low.to_numpy(dtype=np.float64),
+                         close_values, period, williams_r, np.empty(n), np.empty(n))
+        
+        return pd.Series(williams_r, index=close.index)
     
     def calculate_momentum(self, data: pd.Series, period: int = 14) -> pd.Series:
         """
@@ -276,11 +644,10 @@ class IndicatorCalculator:
         Returns:
             Momentum series
         """
-        try:
-            return data.diff(period)
-        except Exception as e:
-            self.logger.log(f"❌ Error calculating Momentum: {str(e)}")
-            return pd.Series()
+        values = data.to_numpy(dtype=np.float64)
+        momentum = np.empty(values.shape[0])
+        _momentum_into(values, period, momentum)
+        return pd.Series(momentum, index=data.index)
     
     def calculate_wma(self, data: pd.Series, period: int) -> pd.Series:
         """
@@ -317,13 +684,7 @@ class IndicatorCalculator:
             
             # Calculate RSI for different periods (like bobot2.py)
             for p in [7, 9, 14]:
-                delta = data.diff()
-                gain = (delta.where(delta > 0, 0)).rolling(window=p).mean()
-                loss = (-delta.where(delta < 0, 0)).rolling(window=p).mean()
-                
-                rs = gain / loss
-                rsi = 100 - (100 / (1 + rs))
-                result[f'RSI{p}'] = rsi.fillna(50)
+                result[f'RSI{p}'] = self.calculate_rsi(data, p)
             
             # Default RSI (RSI9 for scalping like bobot2.py)
             result['RSI'] = result['RSI9']
@@ -385,6 +746,10 @@ class IndicatorCalculator:
             if data is None or len(data) < 50:
                 return data
             
+            if __debug__:
+                assert isinstance(data, pd.DataFrame), f"expected DataFrame, got {type(data).__name__}"
+                assert data['close'].dtype.kind == 'f', f"expected float closes, got {data['close'].dtype}"
+            
             # EMAs - Multiple periods for different strategies (exact bobot2.py match)
             data['EMA5'] = self.calculate_ema(data['close'], 5)
             data['EMA8'] = self.calculate_ema(data['close'], 8)
@@ -451,11 +816,11 @@ class IndicatorCalculator:
     def calculate_stochastic_df(self, data: pd.DataFrame, k_period: int = 14, d_period: int = 3) -> Dict[str, pd.Series]:
         """Calculate Stochastic Oscillator for DataFrame."""
         try:
-            low_min = data['low'].rolling(window=k_period).min()
-            high_max = data['high'].rolling(window=k_period).max()
-            
-            k_percent = 100 * ((data['close'] - low_min) / (high_max - low_min))
-            d_percent = k_percent.rolling(window=d_period).mean()
+            k_values, d_values = self._stochastic_arrays(
+                data['high'].to_numpy(dtype=np.float64), data['low'].to_numpy(dtype=np.float64),
+                data['close'].to_numpy(dtype=np.float64), k_period, d_period)
+            k_percent = pd.Series(k_values, index=data.index)
+            d_percent = pd.Series(d_values, index=data.index)
             
             return {'%K': k_percent.fillna(50), '%D': d_percent.fillna(50)}
         except Exception as e:
@@ -520,116 +885,107 @@ class IndicatorCalculator:
             if cache_key in self.indicator_cache:
                 return self.indicator_cache[cache_key]
             
-            # Get market data
-            df = self.get_symbol_data(symbol, timeframe)
-            if df is None or df.empty:
+            # Get market data (no DataFrame needed on this path)
+            rates = self.get_symbol_rates_raw(symbol, timeframe)
+            if rates is None:
                 return {}
             
-            indicators = {}
-            
-            # Price data
-            close = df['close']
-            high = df['high']
-            low = df['low']
-            open_price = df['open']
-            volume = df['tick_volume']
-            
-            # Moving Averages
-            indicators['EMA_12'] = self.calculate_ema(close, INDICATOR_PERIODS['EMA_fast']).tolist()
-            indicators['EMA_26'] = self.calculate_ema(close, INDICATOR_PERIODS['EMA_slow']).tolist()
-            indicators['SMA_20'] = self.calculate_sma(close, 20).tolist()
-            
-            # Oscillators
-            indicators['RSI'] = self.calculate_rsi(close, INDICATOR_PERIODS['RSI']).tolist()
-            
-            # MACD
-            macd_result = self.calculate_macd(close, 
-                                            INDICATOR_PERIODS['MACD_fast'],
-                                            INDICATOR_PERIODS['MACD_slow'],
-                                            INDICATOR_PERIODS['MACD_signal'])
-            if macd_result:
-                indicators['MACD'] = {
-                    'macd': macd_result['macd'].tolist(),
-                    'signal': macd_result['signal'].tolist(),
-                    'histogram': macd_result['histogram'].tolist()
-                }
-            
-            # Bollinger Bands
-            bb_result = self.calculate_bollinger_bands(close, INDICATOR_PERIODS['BB'])
-            if bb_result:
-                indicators['Bollinger'] = {
-                    'upper': bb_result['upper'].tolist(),
-                    'middle': bb_result['middle'].tolist(),
-                    'lower': bb_result['lower'].tolist()
-                }
-            
-            # ATR
-            indicators['ATR'] = self.calculate_atr(df, INDICATOR_PERIODS['ATR']).tolist()
-            
-            # Stochastic
-            stoch_result = self.calculate_stochastic(high, low, close, 
-                                                   INDICATOR_PERIODS['Stoch_K'],
-                                                   INDICATOR_PERIODS['Stoch_D'])
-            if stoch_result:
-                indicators['Stochastic'] = {
-                    'K': stoch_result['%K'].tolist(),
-                    'D': stoch_result['%D'].tolist()
-                }
-            
-            # Williams %R
-            indicators['WilliamsR'] = self.calculate_williams_r(high, low, close, 
-                                                             INDICATOR_PERIODS['Williams']).tolist()
-            
-            # Momentum
-            indicators['Momentum'] = self.calculate_momentum(close, INDICATOR_PERIODS['Momentum']).tolist()
+            # Price data as float64 views of the rates columns
+            close = np.asarray(rates['close'], dtype=np.float64)
+            high = np.asarray(rates['high'], dtype=np.float64)
+            low = np.asarray(rates['low'], dtype=np.float64)
+            
+            # Reused per (symbol, timeframe) buffers
+            buf = self._get_scratch(symbol, timeframe, len(close))
+            
+            self._kernel(high, low, close, buf)
+            
+            # tolist() copies out of the shared buffers
+            indicators = {
+                'EMA_12': buf['ema_fast'].tolist(),
+                'EMA_26': buf['ema_slow'].tolist(),
+                'SMA_20': buf['sma'].tolist(),
+                'RSI': buf['rsi'].tolist(),
+                'MACD': {
+                    'macd': buf['macd'].tolist(),
+                    'signal': buf['macd_signal'].tolist(),
+                    'histogram': buf['macd_hist'].tolist()
+                },
+                'Bollinger': {
+                    'upper': buf['bb_upper'].tolist(),
+                    'middle': buf['bb_middle'].tolist(),
+                    'lower': buf['bb_lower'].tolist()
+                },
+                'ATR': buf['atr'].tolist(),
+                'Stochastic': {
+                    'K': buf['stoch_k'].tolist(),
+                    'D': buf['stoch_d'].tolist()
+                },
+                'WilliamsR': buf['williams_r'].tolist(),
+                'Momentum': buf['momentum'].tolist()
+            }
             
             # Cache result
             self.indicator_cache[cache_key] = indicators
             
+            # Clean old cache entries
+            self._clean_cache()
+            
             return indicators
             
         except Exception as e:
             self.logger.log(f"❌ Error calculating legacy indicators for {symbol}: {str(e)}")
             return {}
-            indicators['ATR'] = self.calculate_atr(high, low, close, INDICATOR_PERIODS['ATR']).tolist()
-            
-            # Stochastic
-            stoch_result = self.calculate_stochastic(high, low, close, 
-                                                   INDICATOR_PERIODS['Stochastic_K'],
-                                                   INDICATOR_PERIODS['Stochastic_D'])
-            if stoch_result:
-                indicators['Stochastic'] = {
-                    'k': stoch_result['k'].tolist(),
-                    'd': stoch_result['d'].tolist()
-                }
-            
-            # Williams %R
-            indicators['Williams_R'] = self.calculate_williams_r(high, low, close).tolist()
-            
-            # Momentum
-            indicators['Momentum'] = self.calculate_momentum(close).tolist()
-            
-            # Additional price-based indicators
-            indicators['Price_Data'] = {
-                'open': open_price.tolist(),
-                'high': high.tolist(),
-                'low': low.tolist(),
-                'close': close.tolist(),
-                'volume': volume.tolist()
-            }
+    
+    def calculate_batch_indicators(self, symbols: List[str], timeframe: int = None,
+                                   count: int = 300) -> Dict[str, Dict[str, float]]:
+        """
+        Latest EMA/RSI/Bollinger values for many symbols in one vectorised pass.
+        
+        Args:
+            symbols: Trading symbols to scan
+            timeframe: MT5 timeframe
+            count: Number of bars per symbol
             
-            # Cache result
-            self.indicator_cache[cache_key] = indicators
+        Returns:
+            Dict of symbol -> latest indicator values (symbols without full history are skipped)
+        """
+        try:
+            names = []
+            closes = []
+            for symbol in symbols:
+                rates = self.get_symbol_rates_raw(symbol, timeframe, count)
+                if rates is not None and len(rates) == count:
+                    names.append(symbol)
+                    closes.append(rates['close'])
+            
+            if not names:
+                return {}
             
-            # Clean old cache entries
-            self._clean_cache()
+            latest = compute_indicators_batch(
+                np.vstack(closes),
+                ema_fast=INDICATOR_PERIODS['EMA_fast'], ema_slow=INDICATOR_PERIODS['EMA_slow'],
+                rsi_period=INDICATOR_PERIODS['RSI'], bb_period=INDICATOR_PERIODS['BB'],
+                use_cuda=self.use_cuda)
             
-            return indicators
+            return {
+                symbol: {name: float(values[row]) for name, values in latest.items()}
+                for row, symbol in enumerate(names)
+            }
             
         except Exception as e:
-            self.logger.log(f"❌ Error calculating indicators for {symbol}: {str(e)}")
+            self.logger.log(f"❌ Error calculating batch indicators: {str(e)}")
             return {}
     
+    def _get_scratch(self, symbol: str, timeframe: int, count: int) -> Dict[str, np.ndarray]:
+        """Get preallocated output buffers for (symbol, timeframe), resizing on length change."""
+        key = (symbol, timeframe)
+        scratch = self._scratch.get(key)
+        if scratch is None or scratch['tmp_a'].shape[0] != count:
+            scratch = {name: np.empty(count, dtype=np.float64) for name in SCRATCH_BUFFERS}
+            self._scratch[key] = scratch
+        return scratch
+    
     def _clean_cache(self) -> None:
         """Clean old cache entries."""
         try:
@@ -664,7 +1020,7 @@ class IndicatorCalculator:
             str: 'BULLISH', 'BEARISH', or 'NEUTRAL'
         """
         try:
-            indicators = self.calculate_all_indicators(symbol)
+            indicators = self.calculate_legacy_indicators(symbol)
             if not indicators:
                 return 'NEUTRAL'
             
@@ -720,7 +1076,7 @@ class IndicatorCalculator:
             float: Volatility measure (ATR-based)
         """
         try:
-            indicators = self.calculate_all_indicators(symbol)
+            indicators = self.calculate_legacy_indicators(symbol)
             atr_data = indicators.get('ATR', [])
             
             if len(atr_data) >= 1:
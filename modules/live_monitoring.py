@@ -3,13 +3,68 @@ Live Monitoring & Alerting Module
 Real-time dashboard and Telegram notifications for live trading
 """
 
+import sys
 import time
 import threading
+import queue
 import json
-from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any
-from collections import defaultdict, deque
+from collections import OrderedDict, defaultdict, deque
 import requests
+from requests.adapters import HTTPAdapter
+
+from modules.utils import RunningWindow
+
+# orjson is optional; dashboard export falls back to the stdlib encoder
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# Alert thresholds; callers compare against these before calling the alert_* methods
+LATENCY_THRESHOLD_MS = 500  # 500ms
+DRAWDOWN_THRESHOLD = 100  # $100
+
+# Alert type -> message prefix
+_EMOJI_MAP = {
+    "INFO": "ℹ️",
+    "WARNING": "⚠️",
+    "ERROR": "❌",
+    "CRITICAL": "🚨",
+    "SUCCESS": "✅"
+}
+
+# Daily summary message, filled from the flattened dashboard data
+_DAILY_TEMPLATE = (
+    "📊 Daily Trading Summary\n"
+    "\n"
+    "Signals: {total_signals}\n"
+    "Executed: {executed_trades}\n"
+    "Winrate: {overall_winrate:.1f}%\n"
+    "Daily PnL: {daily_pnl:.2f}\n"
+    "\n"
+    "Performance:\n"
+    "Memory: {memory_usage}\n"
+    "CPU: {cpu_usage}\n"
+    "Uptime: {uptime}\n"
+    "\n"
+    "Health: {health_status}"
+)
+
+# Formatted wall-clock strings, reused within the same second: fmt -> (second, text)
+_fmt_cache: Dict[str, tuple] = {}
+
+
+def _now_str(fmt: str = '%H:%M:%S') -> str:
+    """Current local time formatted with fmt, cached at 1-second granularity."""
+    now = int(time.time())
+    cached = _fmt_cache.get(fmt)
+    if cached is None or cached[0] != now:
+        cached = (now, time.strftime(fmt, time.localtime(now)))
+        _fmt_cache[fmt] = cached
+    return cached[1]
 
 
 class LiveMonitoringDashboard:
@@ -32,23 +87,40 @@ class LiveMonitoringDashboard:
             'current_drawdown': 0.0
         }
         
-        # Strategy-specific metrics
-        self.strategy_metrics = defaultdict(lambda: {
-            'signals': 0,
-            'executed': 0,
-            'winrate': 0.0,
-            'avg_latency': 0.0,
-            'pnl': 0.0
-        })
+        # Strategy-specific metrics, one column per field keyed by strategy.
+        # _strategies tracks recency so a misspelled name can't grow them forever.
+        self.MAX_STRATEGIES = 64
+        self._strategies = OrderedDict()
+        self._signals = defaultdict(int)
+        self._executed = defaultdict(int)
+        self._winrate = defaultdict(float)
+        self._avg_latency = defaultdict(float)
+        self._pnl = defaultdict(float)
         
-        # Real-time tracking
-        self.signal_latencies = deque(maxlen=100)
-        self.execution_times = deque(maxlen=100)
+        # Real-time tracking (running sums keep the averages O(1))
+        self.signal_latencies = RunningWindow(maxlen=100)
+        self.execution_times = RunningWindow(maxlen=100)
         self.error_log = deque(maxlen=50)
+        self.MAX_ERROR_MESSAGE = 200  # Characters kept per error message
+        
+        # Events recorded by trading threads, folded in by _drain_events.
+        # Producers drain themselves once the queue passes the high-water
+        # mark; anything still pushed out of a full queue is counted
+        self.EVENT_QUEUE_SIZE = 4096
+        self.EVENT_HIGH_WATER = 3072
+        self._events = deque(maxlen=self.EVENT_QUEUE_SIZE)
+        self.dropped_events = 0
+        self._dropped_reported = 0
+        
+        # Serializes event draining and dashboard snapshots
+        self._lock = threading.RLock()
+        
+        # Performance summary reused for 1 second: (monotonic time, summary)
+        self._perf_cache = (0.0, None)
         
         # Dashboard state
-        self.last_update = time.time()
-        self.dashboard_active = True
+        self.DASHBOARD_INTERVAL = 60  # Print every 60 seconds
+        self._stop_event = threading.Event()
         
         # Update thread
         self.update_thread = threading.Thread(target=self._update_loop, daemon=True)
@@ -56,40 +128,97 @@ class LiveMonitoringDashboard:
         
         self.logger.log("✅ Live Monitoring Dashboard initialized")
     
-    def record_signal(self, strategy: str, symbol: str, action: str, quality_score: float):
-        """Record new signal detection."""
-        try:
-            self.trading_metrics['total_signals'] += 1
-            self.strategy_metrics[strategy]['signals'] += 1
-            
-            self.logger.log(f"📊 Signal recorded: {strategy} {symbol} {action} (quality: {quality_score})")
-            
-        except Exception as e:
-            self.logger.log(f"❌ Error recording signal: {str(e)}")
+    def _record(self, event: tuple):
+        """Queue an event, draining from the caller when the queue runs high."""
+        events = self._events
+        if len(events) >= self.EVENT_HIGH_WATER and self._lock.acquire(blocking=False):
+            try:
+                self._drain_events()
+            finally:
+                self._lock.release()
+        if len(events) == self.EVENT_QUEUE_SIZE:
+            self.dropped_events += 1  # The append below evicts the oldest event
+        events.append(event)
+    
+    def record_signal(self, strategy: str, symbol: str, action: str, quality_score: float,
+                      latency: float = None):
+        """Record new signal detection (latency in seconds, if measured)."""
+        self._record(('signal', time.time(), strategy, (symbol, action, quality_score, latency)))
     
     def record_trade_execution(self, strategy: str, symbol: str, action: str, 
                              lot_size: float, execution_time: float):
         """Record trade execution."""
-        try:
+        self._record(('execution', time.time(), strategy, (symbol, action, lot_size, execution_time)))
+    
+    def record_trade_result(self, strategy: str, pnl: float, successful: bool):
+        """Record trade result."""
+        self._record(('result', time.time(), strategy, (pnl, successful)))
+    
+    def record_error(self, error_type: str, error_message: str, strategy: str = None):
+        """Record error occurrence."""
+        # Truncate once here so neither the queue nor error_log holds huge messages
+        self._record(('error', time.time(), strategy, (error_type, str(error_message)[:self.MAX_ERROR_MESSAGE])))
+    
+    def _drain_events(self):
+        """Fold queued events into the metrics (runs off the trading threads)."""
+        with self._lock:
+            while self._events:
+                kind, timestamp, strategy, payload = self._events.popleft()
+                try:
+                    self._apply(kind, timestamp, strategy, payload)
+                except Exception as e:
+                    self.logger.log(f"❌ Error recording {kind}: {str(e)}")
+            
+            dropped = self.dropped_events
+            if dropped != self._dropped_reported:
+                self.logger.log(f"⚠️ Monitoring event queue overflowed: {dropped - self._dropped_reported} "
+                                f"events dropped ({dropped} total), metrics are incomplete", "WARNING")
+                self._dropped_reported = dropped
+    
+    def _get_strategy(self, name: str) -> str:
+        """Mark strategy as recently used, evicting the least recent one when full."""
+        if name in self._strategies:
+            self._strategies.move_to_end(name)
+            return name
+        
+        if len(self._strategies) >= self.MAX_STRATEGIES:
+            evicted, _ = self._strategies.popitem(last=False)
+            for column in (self._signals, self._executed, self._winrate, self._avg_latency, self._pnl):
+                column.pop(evicted, None)
+        self._strategies[name] = None
+        return name
+    
+    def _apply(self, kind: str, timestamp: float, strategy: str, payload: tuple):
+        """Apply one recorded event to the metrics."""
+        if kind != 'error':
+            self._get_strategy(strategy)
+        
+        if kind == 'signal':
+            symbol, action, quality_score, latency = payload
+            self.trading_metrics['total_signals'] += 1
+            self._signals[strategy] += 1
+            if latency is not None:
+                self.signal_latencies.append(latency)
+            
+            if self.logger.is_enabled_for("INFO"):
+                self.logger.log(f"📊 Signal recorded: {strategy} {symbol} {action} (quality: {quality_score})")
+        
+        elif kind == 'execution':
+            symbol, action, lot_size, execution_time = payload
             self.trading_metrics['executed_trades'] += 1
-            self.strategy_metrics[strategy]['executed'] += 1
+            self._executed[strategy] += 1
             self.execution_times.append(execution_time)
             
             # Update winrate
-            if self.strategy_metrics[strategy]['signals'] > 0:
-                self.strategy_metrics[strategy]['winrate'] = (
-                    self.strategy_metrics[strategy]['executed'] / 
-                    self.strategy_metrics[strategy]['signals'] * 100
-                )
-            
-            self.logger.log(f"✅ Trade executed: {strategy} {symbol} {action} {lot_size} lots in {execution_time*1000:.1f}ms")
+            signals = self._signals.get(strategy, 0)
+            if signals > 0:
+                self._winrate[strategy] = self._executed[strategy] / signals * 100
             
-        except Exception as e:
-            self.logger.log(f"❌ Error recording trade execution: {str(e)}")
-    
-    def record_trade_result(self, strategy: str, pnl: float, successful: bool):
-        """Record trade result."""
-        try:
+            if self.logger.is_enabled_for("INFO"):
+                self.logger.log(f"✅ Trade executed: {strategy} {symbol} {action} {lot_size} lots in {execution_time*1000:.1f}ms")
+        
+        elif kind == 'result':
+            pnl, successful = payload
             if successful:
                 self.trading_metrics['successful_trades'] += 1
             else:
@@ -98,7 +227,7 @@ class LiveMonitoringDashboard:
             # Update PnL
             self.trading_metrics['total_pnl'] += pnl
             self.trading_metrics['daily_pnl'] += pnl
-            self.strategy_metrics[strategy]['pnl'] += pnl
+            self._pnl[strategy] += pnl
             
             # Update drawdown
             if pnl < 0:
@@ -110,71 +239,95 @@ class LiveMonitoringDashboard:
             else:
                 self.trading_metrics['current_drawdown'] = max(0, self.trading_metrics['current_drawdown'] - pnl)
             
-            self.logger.log(f"💰 Trade result: {strategy} PnL: {pnl:.2f} ({'✅' if successful else '❌'})")
-            
-        except Exception as e:
-            self.logger.log(f"❌ Error recording trade result: {str(e)}")
-    
-    def record_error(self, error_type: str, error_message: str, strategy: str = None):
-        """Record error occurrence."""
-        try:
-            error_entry = {
-                'timestamp': datetime.now(),
+            if self.logger.is_enabled_for("INFO"):
+                self.logger.log(f"💰 Trade result: {strategy} PnL: {pnl:.2f} ({'✅' if successful else '❌'})")
+        
+        elif kind == 'error':
+            error_type, error_message = payload
+            self.error_log.append({
+                'timestamp': timestamp,
                 'type': error_type,
                 'message': error_message,
                 'strategy': strategy
+            })
+            if self.logger.is_enabled_for("INFO"):
+                self.logger.log(f"❌ Error recorded: {error_type} - {error_message}")
+    
+    @property
+    def strategy_metrics(self) -> Dict[str, Dict[str, Any]]:
+        """Per-strategy metrics as one dict per strategy (built on demand)."""
+        with self._lock:
+            self._drain_events()
+            return {
+                name: {
+                    'signals': self._signals.get(name, 0),
+                    'executed': self._executed.get(name, 0),
+                    'winrate': self._winrate.get(name, 0.0),
+                    'avg_latency': self._avg_latency.get(name, 0.0),
+                    'pnl': self._pnl.get(name, 0.0)
+                }
+                for name in self._strategies
             }
-            
-            self.error_log.append(error_entry)
-            self.logger.log(f"❌ Error recorded: {error_type} - {error_message}")
-            
-        except Exception as e:
-            self.logger.log(f"❌ Error recording error: {str(e)}")
     
     def get_dashboard_data(self) -> Dict:
-        """Get comprehensive dashboard data."""
+        """
+        Get comprehensive dashboard data.
+        
+        Summary values are plain numbers (winrate in %, latencies in ms);
+        use get_formatted_dashboard_data for the display strings.
+        """
         try:
-            # Get performance data
-            perf_summary = self.performance_monitor.get_performance_summary()
-            
-            # Calculate averages
-            avg_signal_latency = sum(self.signal_latencies) / len(self.signal_latencies) if self.signal_latencies else 0
-            avg_execution_time = sum(self.execution_times) / len(self.execution_times) if self.execution_times else 0
+            # Get performance data (shared by calls within the same second)
+            now = time.monotonic()
+            if self._perf_cache[1] is None or now - self._perf_cache[0] > 1.0:
+                self._perf_cache = (now, self.performance_monitor.get_performance_summary())
+            perf_summary = self._perf_cache[1]
+            
+            # Snapshot counters under the lock, format outside it
+            with self._lock:
+                self._drain_events()
+                metrics = dict(self.trading_metrics)
+                strategy_performance = self.strategy_metrics
+                avg_signal_latency = self.signal_latencies.mean()
+                avg_execution_time = self.execution_times.mean()
+                errors = list(self.error_log)[-5:]
+                dropped_events = self.dropped_events
             
             # Calculate overall winrate
-            total_executed = self.trading_metrics['executed_trades']
-            total_successful = self.trading_metrics['successful_trades']
+            total_executed = metrics['executed_trades']
+            total_successful = metrics['successful_trades']
             overall_winrate = (total_successful / total_executed * 100) if total_executed > 0 else 0
             
             # Recent errors
             recent_errors = [
                 {
-                    'timestamp': err['timestamp'].strftime('%H:%M:%S'),
+                    'timestamp': time.strftime('%H:%M:%S', time.localtime(err['timestamp'])),
                     'type': err['type'],
-                    'message': err['message'][:50] + '...' if len(err['message']) > 50 else err['message']
+                    'message': err['message']
                 }
-                for err in list(self.error_log)[-5:]
+                for err in errors
             ]
             
             return {
-                'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+                'timestamp': _now_str('%Y-%m-%d %H:%M:%S'),
                 'trading_summary': {
-                    'total_signals': self.trading_metrics['total_signals'],
-                    'executed_trades': self.trading_metrics['executed_trades'],
-                    'overall_winrate': f"{overall_winrate:.1f}%",
-                    'total_pnl': f"{self.trading_metrics['total_pnl']:.2f}",
-                    'daily_pnl': f"{self.trading_metrics['daily_pnl']:.2f}",
-                    'current_drawdown': f"{self.trading_metrics['current_drawdown']:.2f}",
-                    'max_drawdown': f"{self.trading_metrics['max_drawdown']:.2f}"
+                    'total_signals': metrics['total_signals'],
+                    'executed_trades': metrics['executed_trades'],
+                    'overall_winrate': overall_winrate,
+                    'total_pnl': metrics['total_pnl'],
+                    'daily_pnl': metrics['daily_pnl'],
+                    'current_drawdown': metrics['current_drawdown'],
+                    'max_drawdown': metrics['max_drawdown'],
+                    'dropped_events': dropped_events
                 },
                 'performance_metrics': {
-                    'avg_signal_latency': f"{avg_signal_latency*1000:.1f}ms",
-                    'avg_execution_time': f"{avg_execution_time*1000:.1f}ms",
+                    'avg_signal_latency': avg_signal_latency * 1000,
+                    'avg_execution_time': avg_execution_time * 1000,
                     'memory_usage': perf_summary['memory']['current'],
                     'cpu_usage': perf_summary['cpu']['current'],
                     'uptime': perf_summary['uptime']
                 },
-                'strategy_performance': dict(self.strategy_metrics),
+                'strategy_performance': strategy_performance,
                 'recent_errors': recent_errors,
                 'health_status': perf_summary['health_status']
             }
@@ -183,45 +336,68 @@ class LiveMonitoringDashboard:
             self.logger.log(f"❌ Error getting dashboard data: {str(e)}")
             return {'error': str(e)}
     
+    def get_formatted_dashboard_data(self) -> Dict:
+        """Get dashboard data with summary values rendered as display strings."""
+        data = self.get_dashboard_data()
+        if 'error' in data:
+            return data
+        
+        trading = data['trading_summary']
+        trading['overall_winrate'] = f"{trading['overall_winrate']:.1f}%"
+        for key in ('total_pnl', 'daily_pnl', 'current_drawdown', 'max_drawdown'):
+            trading[key] = f"{trading[key]:.2f}"
+        
+        perf = data['performance_metrics']
+        for key in ('avg_signal_latency', 'avg_execution_time'):
+            perf[key] = f"{perf[key]:.1f}ms"
+        
+        return data
+    
     def print_dashboard(self):
         """Print dashboard to console."""
         try:
             data = self.get_dashboard_data()
             
-            print("\n" + "="*60)
-            print("🚀 MT5 TRADING BOT - LIVE DASHBOARD")
-            print("="*60)
-            print(f"📅 {data['timestamp']}")
-            print(f"🏥 Health: {data['health_status']}")
+            parts = [
+                "\n" + "="*60 + "\n",
+                "🚀 MT5 TRADING BOT - LIVE DASHBOARD\n",
+                "="*60 + "\n",
+                f"📅 {data['timestamp']}\n",
+                f"🏥 Health: {data['health_status']}\n"
+            ]
             
             # Trading summary
             trading = data['trading_summary']
-            print(f"\n📊 TRADING SUMMARY:")
-            print(f"   Signals: {trading['total_signals']} | Executed: {trading['executed_trades']} | Winrate: {trading['overall_winrate']}")
-            print(f"   Total PnL: {trading['total_pnl']} | Daily: {trading['daily_pnl']} | Drawdown: {trading['current_drawdown']}")
+            parts.append("\n📊 TRADING SUMMARY:\n")
+            parts.append(f"   Signals: {trading['total_signals']} | Executed: {trading['executed_trades']} | Winrate: {trading['overall_winrate']:.1f}%\n")
+            parts.append(f"   Total PnL: {trading['total_pnl']:.2f} | Daily: {trading['daily_pnl']:.2f} | Drawdown: {trading['current_drawdown']:.2f}\n")
             
             # Performance metrics
             perf = data['performance_metrics']
-            print(f"\n⚡ PERFORMANCE:")
-            print(f"   Signal Latency: {perf['avg_signal_latency']} | Execution: {perf['avg_execution_time']}")
-            print(f"   Memory: {perf['memory_usage']} | CPU: {perf['cpu_usage']} | Uptime: {perf['uptime']}")
+            parts.append("\n⚡ PERFORMANCE:\n")
+            parts.append(f"   Signal Latency: {perf['avg_signal_latency']:.1f}ms | Execution: {perf['avg_execution_time']:.1f}ms\n")
+            parts.append(f"   Memory: {perf['memory_usage']} | CPU: {perf['cpu_usage']} | Uptime: {perf['uptime']}\n")
             
             # Strategy performance
-            print(f"\n🎯 STRATEGY PERFORMANCE:")
+            parts.append("\n🎯 STRATEGY PERFORMANCE:\n")
             for strategy, metrics in data['strategy_performance'].items():
                 winrate = metrics['winrate']
                 pnl = metrics['pnl']
                 signals = metrics['signals']
                 executed = metrics['executed']
-                print(f"   {strategy}: {signals} signals, {executed} executed, {winrate:.1f}% winrate, PnL: {pnl:.2f}")
+                parts.append(f"   {strategy}: {signals} signals, {executed} executed, {winrate:.1f}% winrate, PnL: {pnl:.2f}\n")
             
             # Recent errors
             if data['recent_errors']:
-                print(f"\n❌ RECENT ERRORS:")
+                parts.append("\n❌ RECENT ERRORS:\n")
                 for error in data['recent_errors']:
-                    print(f"   {error['timestamp']} - {error['type']}: {error['message']}")
+                    parts.append(f"   {error['timestamp']} - {error['type']}: {error['message']}\n")
+            
+            parts.append("="*60 + "\n\n")
             
-            print("="*60 + "\n")
+            # One write instead of one print() per line
+            sys.stdout.write(''.join(parts))
+            sys.stdout.flush()
             
         except Exception as e:
             self.logger.log(f"❌ Error printing dashboard: {str(e)}")
@@ -230,8 +406,14 @@ class LiveMonitoringDashboard:
         """Export dashboard data to JSON file."""
         try:
             data = self.get_dashboard_data()
-            with open(filepath, 'w') as f:
-                json.dump(data, f, indent=2, default=str)
+            if ORJSON_AVAILABLE:
+                with open(filepath, 'wb') as f:
+                    f.write(orjson.dumps(data, default=str,
+                                         option=orjson.OPT_INDENT_2 | orjson.OPT_NAIVE_UTC |
+                                         orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS))
+            else:
+                with open(filepath, 'w') as f:
+                    json.dump(data, f, indent=2, default=str)
             
             self.logger.log(f"✅ Dashboard data exported to {filepath}")
             return True
@@ -241,25 +423,22 @@ class LiveMonitoringDashboard:
             return False
     
     def _update_loop(self):
-        """Background update loop for dashboard."""
-        while self.dashboard_active:
+        """Background loop: print the dashboard once per interval.
+        
+        Producers drain at the high-water mark and readers drain before
+        reading, so the loop only needs to wake for the dashboard itself.
+        """
+        while not self._stop_event.wait(self.DASHBOARD_INTERVAL):
             try:
-                # Print dashboard every 60 seconds
-                if time.time() - self.last_update > 60:
-                    self.print_dashboard()
-                    self.last_update = time.time()
-                
-                time.sleep(10)  # Update every 10 seconds
-                
+                self.print_dashboard()
             except Exception as e:
                 self.logger.log(f"❌ Dashboard update error: {str(e)}")
-                time.sleep(30)
     
     def stop_monitoring(self):
         """Stop monitoring dashboard."""
-        self.dashboard_active = False
+        self._stop_event.set()
         if self.update_thread.is_alive():
-            self.update_thread.join(timeout=5)
+            self.update_thread.join()
 
 
 class TelegramAlerting:
@@ -272,59 +451,135 @@ class TelegramAlerting:
         self.chat_id = chat_id
         
         # Alert thresholds
-        self.LATENCY_THRESHOLD = 500  # 500ms
-        self.DRAWDOWN_THRESHOLD = 100  # $100
+        self.LATENCY_THRESHOLD = LATENCY_THRESHOLD_MS
+        self.DRAWDOWN_THRESHOLD = DRAWDOWN_THRESHOLD
         self.ERROR_COUNT_THRESHOLD = 5  # 5 errors in 10 minutes
         
-        # Rate limiting
+        # Rate limiting: cooldown starts when an alert is delivered; queued
+        # types are held in _alerts_in_flight until the worker settles them
         self.last_alert_times = defaultdict(float)
+        self._alerts_in_flight = set()
+        self._cooldown_lock = threading.Lock()
         self.ALERT_COOLDOWN = 300  # 5 minutes between similar alerts
+        self.BATCH_WINDOW = 0.5  # Coalesce non-critical alerts arriving within 500ms
         
-        # Error tracking for alerting
-        self.recent_errors = deque(maxlen=20)
+        # Error tracking for alerting: monotonic timestamps per error type
+        self.ERROR_WINDOW_SECONDS = 600  # 10 minutes
+        self._error_windows = defaultdict(deque)
         
         self.enabled = bool(bot_token and chat_id)
         
         if self.enabled:
+            # Built once; only 'text' changes per message
+            self._api_url = f"https://api.telegram.org/bot{bot_token}/sendMessage"
+            self._payload_base = {'chat_id': chat_id, 'parse_mode': 'Markdown'}
+            
+            # One keep-alive connection, fed by a background sender thread
+            self._session = requests.Session()
+            self._session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=1))
+            self._alert_queue = queue.Queue(maxsize=64)
+            self._worker = threading.Thread(target=self._alert_worker, daemon=True)
+            self._worker.start()
             self.logger.log("✅ Telegram Alerting initialized")
         else:
             self.logger.log("⚠️ Telegram Alerting disabled (no token/chat_id)")
     
     def send_alert(self, message: str, alert_type: str = "INFO") -> bool:
-        """Send Telegram alert message."""
+        """Queue Telegram alert message (returns False if suppressed or queue is full)."""
         if not self.enabled:
             return False
         
-        try:
-            # Rate limiting
-            current_time = time.time()
-            if current_time - self.last_alert_times[alert_type] < self.ALERT_COOLDOWN:
+        # Rate limiting before any formatting work
+        with self._cooldown_lock:
+            if (alert_type in self._alerts_in_flight or
+                    time.time() - self.last_alert_times[alert_type] < self.ALERT_COOLDOWN):
                 return False
-            
+            self._alerts_in_flight.add(alert_type)
+        
+        try:
             # Format message
-            emoji_map = {
-                "INFO": "ℹ️",
-                "WARNING": "⚠️",
-                "ERROR": "❌",
-                "CRITICAL": "🚨",
-                "SUCCESS": "✅"
-            }
+            emoji = _EMOJI_MAP.get(alert_type, "📢")
+            formatted_message = f"{emoji} MT5 Bot Alert\n\n{message}\n\nTime: {_now_str()}"
             
-            emoji = emoji_map.get(alert_type, "📢")
-            formatted_message = f"{emoji} MT5 Bot Alert\n\n{message}\n\nTime: {datetime.now().strftime('%H:%M:%S')}"
+            payload = {**self._payload_base, 'text': formatted_message}
             
-            # Send via Telegram API
-            url = f"https://api.telegram.org/bot{self.bot_token}/sendMessage"
-            payload = {
-                'chat_id': self.chat_id,
-                'text': formatted_message,
-                'parse_mode': 'Markdown'
-            }
+            # Hand off to the sender thread, which starts the cooldown on delivery
+            self._alert_queue.put_nowait((alert_type, payload))
+            return True
+            
+        except queue.Full:
+            self.logger.log(f"⚠️ Telegram alert queue full, dropping {alert_type} alert")
+            self._settle_alerts([alert_type], False)
+            return False
+        except Exception as e:
+            self.logger.log(f"❌ Error sending Telegram alert: {str(e)}")
+            self._settle_alerts([alert_type], False)
+            return False
+    
+    def _settle_alerts(self, alert_types: List[str], sent: bool):
+        """Release in-flight alert types, starting their cooldown only if delivered."""
+        with self._cooldown_lock:
+            now = time.time()
+            for alert_type in alert_types:
+                self._alerts_in_flight.discard(alert_type)
+                if sent:
+                    self.last_alert_times[alert_type] = now
+    
+    def _alert_worker(self):
+        """Send queued alerts over the pooled session, coalescing bursts."""
+        while True:
+            item = self._alert_queue.get()
+            if item is None:
+                self._alert_queue.task_done()
+                return
+            
+            batch = [item]
+            stopping = False
+            if item[0] != "CRITICAL":
+                # Collect whatever else arrives within the batch window
+                deadline = time.monotonic() + self.BATCH_WINDOW
+                while (remaining := deadline - time.monotonic()) > 0:
+                    try:
+                        pending = self._alert_queue.get(timeout=remaining)
+                    except queue.Empty:
+                        break
+                    if pending is None:
+                        stopping = True
+                        break
+                    batch.append(pending)
             
-            response = requests.post(url, json=payload, timeout=10)
+            try:
+                self._send_batch(batch)
+            finally:
+                for _ in range(len(batch) + stopping):
+                    self._alert_queue.task_done()
+            
+            if stopping:
+                return
+    
+    def _send_batch(self, batch: List[tuple]):
+        """Post CRITICAL alerts on their own and the rest joined into one message."""
+        critical = [item for item in batch if item[0] == "CRITICAL"]
+        regular = [item for item in batch if item[0] != "CRITICAL"]
+        
+        for alert_type, payload in critical:
+            self._settle_alerts([alert_type], self._post(alert_type, payload))
+        
+        if len(regular) == 1:
+            alert_type, payload = regular[0]
+            self._settle_alerts([alert_type], self._post(alert_type, payload))
+        elif regular:
+            alert_types = [alert_type for alert_type, _ in regular]
+            payload = dict(regular[0][1])
+            payload['text'] = "\n---\n".join(item[1]['text'] for item in regular)
+            self._settle_alerts(alert_types, self._post(", ".join(alert_types), payload))
+    
+    def _post(self, alert_type: str, payload: Dict[str, Any]) -> bool:
+        """Post one sendMessage request, returning True if Telegram accepted it."""
+        try:
+            response = self._session.post(self._api_url, json=payload, timeout=10)
             
             if response.status_code == 200:
-                self.last_alert_times[alert_type] = current_time
                 self.logger.log(f"✅ Telegram alert sent: {alert_type}")
                 return True
             else:
@@ -335,11 +590,24 @@ class TelegramAlerting:
             self.logger.log(f"❌ Error sending Telegram alert: {str(e)}")
             return False
     
+    def stop(self):
+        """Flush pending alerts and stop the sender thread."""
+        if not self.enabled:
+            return
+        
+        self._alert_queue.put(None)
+        self._worker.join(timeout=15)
+        self._session.close()
+    
     def alert_high_latency(self, strategy: str, latency_ms: float):
-        """Alert for high latency detection."""
-        if latency_ms > self.LATENCY_THRESHOLD:
-            message = f"🐌 High Latency Alert\n\nStrategy: {strategy}\nLatency: {latency_ms:.1f}ms\nThreshold: {self.LATENCY_THRESHOLD}ms"
-            self.send_alert(message, "WARNING")
+        """
+        Alert for high latency detection.
+        
+        Callers gate with `if latency_ms > LATENCY_THRESHOLD_MS:` so the
+        common under-threshold case never makes the call.
+        """
+        message = f"🐌 High Latency Alert\n\nStrategy: {strategy}\nLatency: {latency_ms:.1f}ms\nThreshold: {self.LATENCY_THRESHOLD}ms"
+        self.send_alert(message, "WARNING")
     
     def alert_repeated_errors(self, error_type: str, count: int):
         """Alert for repeated errors."""
@@ -347,14 +615,17 @@ class TelegramAlerting:
         self.send_alert(message, "ERROR")
     
     def alert_high_drawdown(self, current_drawdown: float, max_drawdown: float):
-        """Alert for high drawdown."""
-        if current_drawdown > self.DRAWDOWN_THRESHOLD:
-            message = f"📉 High Drawdown Alert\n\nCurrent: ${current_drawdown:.2f}\nMax: ${max_drawdown:.2f}\nThreshold: ${self.DRAWDOWN_THRESHOLD}"
-            self.send_alert(message, "CRITICAL")
+        """
+        Alert for high drawdown.
+        
+        Callers gate with `if current_drawdown > DRAWDOWN_THRESHOLD:`.
+        """
+        message = f"📉 High Drawdown Alert\n\nCurrent: ${current_drawdown:.2f}\nMax: ${max_drawdown:.2f}\nThreshold: ${self.DRAWDOWN_THRESHOLD}"
+        self.send_alert(message, "CRITICAL")
     
     def alert_trading_stopped(self, reason: str):
         """Alert when trading is stopped."""
-        message = f"⏹️ Trading Stopped\n\nReason: {reason}\nTime: {datetime.now().strftime('%H:%M:%S')}"
+        message = f"⏹️ Trading Stopped\n\nReason: {reason}\nTime: {_now_str()}"
         self.send_alert(message, "CRITICAL")
     
     def alert_connection_lost(self, duration_minutes: float):
@@ -365,22 +636,12 @@ class TelegramAlerting:
     def alert_daily_summary(self, dashboard_data: Dict):
         """Send daily trading summary."""
         try:
-            trading = dashboard_data['trading_summary']
-            perf = dashboard_data['performance_metrics']
-            
-            message = f"""📊 Daily Trading Summary
-            
-Signals: {trading['total_signals']}
-Executed: {trading['executed_trades']}
-Winrate: {trading['overall_winrate']}
-Daily PnL: {trading['daily_pnl']}
-
-Performance:
-Memory: {perf['memory_usage']}
-CPU: {perf['cpu_usage']}
-Uptime: {perf['uptime']}
-
-Health: {dashboard_data['health_status']}"""
+            flat = {
+                **dashboard_data['trading_summary'],
+                **dashboard_data['performance_metrics'],
+                'health_status': dashboard_data['health_status']
+            }
+            message = _DAILY_TEMPLATE.format_map(flat)
             
             self.send_alert(message, "INFO")
             
@@ -390,19 +651,17 @@ Health: {dashboard_data['health_status']}"""
     def record_error_for_alerting(self, error_type: str, error_message: str):
         """Record error for potential alerting."""
         try:
-            self.recent_errors.append({
-                'timestamp': datetime.now(),
-                'type': error_type,
-                'message': error_message
-            })
+            window = self._error_windows[error_type]
+            now = time.monotonic()
             
-            # Check for repeated errors
-            recent_count = sum(1 for err in self.recent_errors 
-                             if err['type'] == error_type and 
-                             datetime.now() - err['timestamp'] < timedelta(minutes=10))
+            # Drop errors that fell out of the window
+            while window and now - window[0] > self.ERROR_WINDOW_SECONDS:
+                window.popleft()
+            window.append(now)
             
-            if recent_count >= self.ERROR_COUNT_THRESHOLD:
-                self.alert_repeated_errors(error_type, recent_count)
+            # Check for repeated errors
+            if len(window) >= self.ERROR_COUNT_THRESHOLD:
+                self.alert_repeated_errors(error_type, len(window))
                 
         except Exception as e:
-            self.logger.log(f"❌ Error recording error for alerting: {str(e)}")
\ No newline at end of file
+            self.logger.log(f"❌ Error recording error for alerting: {str(e)}")
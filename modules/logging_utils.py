@@ -4,26 +4,48 @@ Centralized logging with file output, GUI integration, and Telegram notification
 """
 
 import os
+import re
+import sys
+import atexit
 import datetime
 import csv
+import io
+import queue
 import threading
 import requests
-from typing import Optional, List, Dict, Any
+from requests.adapters import HTTPAdapter
+from typing import Optional, List, Dict, Any, Tuple
 import time
+from collections import Counter, deque
 
 from config import *
 
+# Levels and markers that trigger a Telegram notification
+_IMPORTANT_LEVELS = frozenset(("ERROR", "CRITICAL"))
+_IMPORTANT_RE = re.compile('[✅❌]')
+
+# Telegram message framing; the limit is applied to UTF-8 bytes
+_TG_PREFIX = "🤖 Trading Bot: "
+_TG_PREFIX_B = _TG_PREFIX.encode('utf-8')
+_TG_TRUNCATED_B = "... (truncated)".encode('utf-8')
+_TG_MAX = 4096
+
 
 class BotLogger:
     """Centralized logger with multiple output channels."""
     
     def __init__(self):
         """Initialize the bot logger."""
-        self.log_lock = threading.Lock()
         self.gui_callback = None
-        self.log_buffer = []
         self.max_buffer_size = 1000
-        self.telegram_rate_limit = {}
+        self.log_buffer = deque(maxlen=self.max_buffer_size)
+        self.TELEGRAM_MIN_INTERVAL = 10.0
+        self._tg_last_send = float('-inf')
+        self.set_level(LOG_LEVEL)
+        self._ts_cache = (0, "")
+        
+        # Console echo only when someone is watching (or explicitly forced)
+        self._console_enabled = FORCE_CONSOLE_LOG or (sys.stdout is not None and sys.stdout.isatty())
         
         # Ensure log directory exists
         self._ensure_log_directory()
@@ -31,6 +53,32 @@ class BotLogger:
         # Initialize log file
         self.log_file_path = self._get_log_file_path()
         
+        # File output runs on a dedicated writer thread
+        self.FILE_QUEUE_SIZE = 10000
+        self.FILE_BATCH_SIZE = 256
+        self._file_q = queue.Queue(maxsize=self.FILE_QUEUE_SIZE)
+        self.dropped_file_lines = 0  # Lines lost to a full queue, reported by the writer
+        self._dropped_file_reported = 0
+        self._fd = None
+        self._rollover_at = 0.0
+        self._file_writer_thread = threading.Thread(target=self._file_writer, daemon=True)
+        self._file_writer_thread.start()
+        
+        # GUI messages wait here until the GUI thread pumps them (Tk is not
+        # thread-safe, so the callback must never run on a logging thread)
+        self.GUI_QUEUE_SIZE = 1000
+        self._gui_q = queue.Queue(maxsize=self.GUI_QUEUE_SIZE)
+        
+        # Telegram is sent by one worker over a pooled HTTPS connection
+        self._tg_url = f"https://api.telegram.org/bot{TELEGRAM_TOKEN}/sendMessage"
+        self._session = requests.Session()
+        self._session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=1))
+        self.TELEGRAM_QUEUE_SIZE = 100
+        self._tg_q = queue.Queue(maxsize=self.TELEGRAM_QUEUE_SIZE)
+        self._tg_thread = threading.Thread(target=self._telegram_worker, daemon=True)
+        self._tg_thread.start()
+        atexit.register(self.close)
+        
     def _ensure_log_directory(self) -> bool:
         """Ensure log directory exists."""
         try:
@@ -54,66 +102,249 @@ class BotLogger:
         """
         Set GUI callback for log display.
         
+        The callback is only invoked from pump_gui, which the GUI calls on
+        its own thread.
+        
         Args:
             callback: Function to call for GUI log updates
         """
         self.gui_callback = callback
     
+    def set_level(self, level: str) -> None:
+        """
+        Set the minimum level to emit and specialize log() for it.
+        
+        Args:
+            level: Log level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
+        """
+        self.min_level = level
+        min_rank = LOG_LEVELS.get(level, 0)
+        self._enabled_levels = frozenset(name for name, rank in LOG_LEVELS.items() if rank >= min_rank)
+        self._filtering = min_rank > 0
+        
+        # With nothing filtered, log() goes straight to _emit with no level check
+        self.log = self._log_filtered if self._filtering else self._emit
+    
+    def is_enabled_for(self, level: str) -> bool:
+        """
+        Check whether messages at level would be emitted.
+        
+        Lets callers skip building expensive messages that would be dropped.
+        
+        Args:
+            level: Log level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
+        """
+        return not self._filtering or level in self._enabled_levels
+    
     def log(self, message: str, level: str = "INFO") -> None:
         """
         Log message to all configured outputs.
         
+        Rebound per instance by set_level(); this is the generic fallback.
+        
         Args:
             message: Message to log
             level: Log level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         """
-        with self.log_lock:
-            try:
-                timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                formatted_message = f"[{timestamp}] {level}: {message}"
-                
-                # Console output
-                print(formatted_message)
+        if self.is_enabled_for(level):
+            self._emit(message, level)
+    
+    def _log_filtered(self, message: str, level: str = "INFO") -> None:
+        """log() when a threshold is set: one set lookup before any formatting."""
+        if level in self._enabled_levels:
+            self._emit(message, level)
+    
+    def _emit(self, message: str, level: str = "INFO") -> None:
+        """Format message and fan it out to all outputs."""
+        # No lock: deque.append and Queue.put_nowait are thread-safe on their own
+        try:
+            timestamp = self._timestamp()
+            formatted_message = f"[{timestamp}] {level}: {message}"
+            
+            # Console output
+            if self._console_enabled:
+                sys.stdout.write(formatted_message + '\n')
+            
+            # File output
+            self._write_to_file(formatted_message)
+            
+            # Buffer for GUI (bounded deque evicts the oldest record itself)
+            self.log_buffer.append((timestamp, level, message))
+            
+            # GUI callback
+            if self.gui_callback:
+                try:
+                    self._gui_q.put_nowait(formatted_message)
+                except queue.Full:
+                    pass  # GUI is behind; the buffer still has the message
+            
+            # Telegram notification for important messages
+            if level in _IMPORTANT_LEVELS or _IMPORTANT_RE.search(message):
+                self._send_telegram_notification(message)
                 
-                # File output
-                self._write_to_file(formatted_message)
+        except Exception as e:
+            print(f"Logging error: {str(e)}")
+    
+    def log_many(self, records: List[Tuple[str, str]]) -> None:
+        """
+        Log a batch of (level, message) pairs in one pass.
+        
+        All records share one timestamp and go to each output in a single
+        write; important records are sent to Telegram as one combined message.
+        
+        Args:
+            records: (level, message) pairs, oldest first
+        """
+        try:
+            if self._filtering:
+                records = [record for record in records if record[0] in self._enabled_levels]
+            if not records:
+                return
+            
+            timestamp = self._timestamp()
+            text = "\n".join(f"[{timestamp}] {level}: {message}" for level, message in records)
+            
+            if self._console_enabled:
+                sys.stdout.write(text + '\n')
+            
+            self._write_to_file(text)
+            self.log_buffer.extend((timestamp, level, message) for level, message in records)
+            
+            if self.gui_callback:
+                try:
+                    self._gui_q.put_nowait(text)
+                except queue.Full:
+                    pass  # GUI is behind; the buffer still has the messages
+            
+            important = [message for level, message in records
+                         if level in _IMPORTANT_LEVELS or _IMPORTANT_RE.search(message)]
+            if important:
+                self._send_telegram_notification("\n".join(important))
                 
-                # Buffer for GUI
-                self._add_to_buffer(formatted_message)
+        except Exception as e:
+            print(f"Logging error: {str(e)}")
+    
+    def _timestamp(self) -> str:
+        """Return the formatted current time, re-rendered only when the second changes."""
+        now = time.time()
+        second = int(now)
+        if second != self._ts_cache[0]:
+            self._ts_cache = (second, time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now)))
+        return self._ts_cache[1]
+    
+    def _write_to_file(self, message: str) -> None:
+        """Encode message and queue it for the file writer thread."""
+        try:
+            self._file_q.put_nowait((message + '\n').encode('utf-8'))
+        except queue.Full:
+            self.dropped_file_lines += 1
+    
+    def _file_writer(self) -> None:
+        """Drain queued lines to the log file in batches, reopening it on date rollover."""
+        running = True
+        
+        while running:
+            # Block for the first line, then take whatever else is already queued
+            batch = [self._file_q.get()]
+            while len(batch) < self.FILE_BATCH_SIZE:
+                try:
+                    batch.append(self._file_q.get_nowait())
+                except queue.Empty:
+                    break
+            
+            try:
+                if None in batch:
+                    running = False
+                    lines = [line for line in batch if line is not None]
+                else:
+                    lines = batch
                 
-                # GUI callback
-                if self.gui_callback:
-                    try:
-                        self.gui_callback(formatted_message)
-                    except Exception as e:
-                        print(f"GUI logging failed: {str(e)}")
+                notice = self._dropped_file_notice()
+                if notice:
+                    print(notice, file=sys.stderr)
+                    lines = lines + [(notice + '\n').encode('utf-8')]
                 
-                # Telegram notification for important messages
-                if level in ["ERROR", "CRITICAL"] or "✅" in message or "❌" in message:
-                    self._send_telegram_notification(message)
+                if lines:
+                    # Date check is one float compare until the next midnight
+                    if self._fd is None or time.time() >= self._rollover_at:
+                        self._open_log_file()
+                    
+                    self._write_lines(lines)
                     
             except Exception as e:
-                print(f"Logging error: {str(e)}")
+                print(f"File logging error: {str(e)}")
+            finally:
+                for _ in batch:
+                    self._file_q.task_done()
+        
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
     
-    def _write_to_file(self, message: str) -> None:
-        """Write message to log file."""
-        try:
-            with open(self.log_file_path, 'a', encoding='utf-8') as f:
-                f.write(message + '\n')
-        except Exception as e:
-            print(f"File logging error: {str(e)}")
+    def _dropped_file_notice(self) -> Optional[str]:
+        """Summarize lines dropped since the last report, or None if there were none."""
+        dropped = self.dropped_file_lines
+        if dropped == self._dropped_file_reported:
+            return None
+        count = dropped - self._dropped_file_reported
+        self._dropped_file_reported = dropped
+        return f"[{self._timestamp()}] WARNING: File logging queue full, dropped {count} lines"
     
-    def _add_to_buffer(self, message: str) -> None:
-        """Add message to internal buffer."""
-        try:
-            self.log_buffer.append(message)
+    def _write_lines(self, lines: List[bytes]) -> None:
+        """Write encoded lines with one writev where available, finishing any short write."""
+        written = os.writev(self._fd, lines) if hasattr(os, 'writev') else 0
+        if written < sum(map(len, lines)):
+            remaining = memoryview(b''.join(lines))[written:]
+            while remaining:
+                remaining = remaining[os.write(self._fd, remaining):]
+    
+    def _open_log_file(self) -> None:
+        """(Re)open today's log file on the writer thread and schedule the next rollover."""
+        if self._fd is not None:
+            os.close(self._fd)
+        self.log_file_path = self._get_log_file_path()
+        flags = os.O_WRONLY | os.O_CREAT | os.O_APPEND | getattr(os, 'O_BINARY', 0)
+        self._fd = os.open(self.log_file_path, flags, 0o644)
+        
+        tomorrow = datetime.date.today() + datetime.timedelta(days=1)
+        self._rollover_at = datetime.datetime.combine(tomorrow, datetime.time.min).timestamp()
+    
+    def pump_gui(self, max_messages: int = 200) -> int:
+        """
+        Deliver queued messages to the GUI callback on the calling thread.
+        
+        Call from the GUI thread (e.g. a Tk after() loop); pending messages
+        are joined into a single callback invocation.
+        
+        Args:
+            max_messages: Most messages to deliver in one call
             
-            # Maintain buffer size
-            if len(self.log_buffer) > self.max_buffer_size:
-                self.log_buffer = self.log_buffer[-self.max_buffer_size:]
-                
-        except Exception as e:
-            print(f"Buffer logging error: {str(e)}")
+        Returns:
+            int: Number of messages delivered
+        """
+        messages = []
+        try:
+            while len(messages) < max_messages:
+                messages.append(self._gui_q.get_nowait())
+        except queue.Empty:
+            pass
+        
+        if messages and self.gui_callback:
+            try:
+                self.gui_callback("\n".join(messages))
+            except Exception as e:
+                print(f"GUI logging failed: {str(e)}")
+        return len(messages)
+    
+    def close(self) -> None:
+        """Flush pending output and stop the sink threads."""
+        if self._file_writer_thread.is_alive():
+            self._file_q.put(None)
+            self._file_writer_thread.join()
+        if self._tg_thread.is_alive():
+            self._tg_q.put(None)
+            self._tg_thread.join()
+        self._session.close()
     
     def _send_telegram_notification(self, message: str) -> None:
         """
@@ -127,39 +358,52 @@ class BotLogger:
             if not TELEGRAM_TOKEN or TELEGRAM_TOKEN == "your_telegram_bot_token":
                 return
             
-            # Rate limiting - max 1 message per 10 seconds
-            current_time = time.time()
-            if current_time - self.telegram_rate_limit.get('last_send', 0) < 10:
+            # Rate limiting - max 1 message per 10 seconds (lock-free; a rare race may let two through)
+            current_time = time.monotonic()
+            if current_time - self._tg_last_send < self.TELEGRAM_MIN_INTERVAL:
                 return
             
-            url = f"https://api.telegram.org/bot{TELEGRAM_TOKEN}/sendMessage"
-            
-            # Truncate long messages
-            if len(message) > 4000:
-                message = message[:4000] + "... (truncated)"
+            # Truncate long messages by encoded size (at most 4 bytes per char)
+            if len(_TG_PREFIX_B) + 4 * len(message) <= _TG_MAX:
+                text = _TG_PREFIX + message
+            else:
+                body = message.encode('utf-8')
+                if len(_TG_PREFIX_B) + len(body) > _TG_MAX:
+                    body = body[:_TG_MAX - len(_TG_PREFIX_B) - len(_TG_TRUNCATED_B)] + _TG_TRUNCATED_B
+                text = (_TG_PREFIX_B + body).decode('utf-8', 'ignore')
             
             payload = {
                 'chat_id': TELEGRAM_CHAT_ID,
-                'text': f"🤖 Trading Bot: {message}",
+                'text': text,
                 'parse_mode': 'HTML'
             }
             
             # Send in background to avoid blocking
-            threading.Thread(
-                target=self._send_telegram_request,
-                args=(url, payload),
-                daemon=True
-            ).start()
+            try:
+                self._tg_q.put_nowait(payload)
+            except queue.Full:
+                return
             
-            self.telegram_rate_limit['last_send'] = current_time
+            self._tg_last_send = current_time
             
         except Exception as e:
             print(f"Telegram notification error: {str(e)}")
     
+    def _telegram_worker(self) -> None:
+        """Send queued Telegram payloads one at a time."""
+        while True:
+            payload = self._tg_q.get()
+            try:
+                if payload is None:
+                    break
+                self._send_telegram_request(self._tg_url, payload)
+            finally:
+                self._tg_q.task_done()
+    
     def _send_telegram_request(self, url: str, payload: Dict[str, Any]) -> None:
-        """Send Telegram request in background thread."""
+        """Send Telegram request from the worker thread."""
         try:
-            response = requests.post(url, json=payload, timeout=10)
+            response = self._session.post(url, json=payload, timeout=10)
             if response.status_code != 200:
                 print(f"Telegram API error: {response.status_code}")
         except Exception as e:
@@ -172,8 +416,7 @@ class BotLogger:
         Returns:
             List of log messages
         """
-        with self.log_lock:
-            return self.log_buffer.copy()
+        return [f"[{ts}] {level}: {message}" for ts, level, message in list(self.log_buffer)]
     
     def export_logs_csv(self, filename: str = None) -> str:
         """
@@ -192,35 +435,17 @@ class BotLogger:
             
             filepath = os.path.join(LOG_DIR, filename)
             
+            # Snapshot first; producers keep appending while the file is written
+            entries = list(self.log_buffer)
+            
+            # Render in memory, then write the file in one call
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            writer.writerow(['Timestamp', 'Level', 'Message'])
+            writer.writerows(entries)
+            
             with open(filepath, 'w', newline='', encoding='utf-8') as csvfile:
-                writer = csv.writer(csvfile)
-                writer.writerow(['Timestamp', 'Level', 'Message'])
-                
-                for log_entry in self.log_buffer:
-                    try:
-                        # Parse log entry
-                        parts = log_entry.split('] ', 1)
-                        if len(parts) == 2:
-                            timestamp_part = parts[0].replace('[', '')
-                            rest = parts[1]
-                            
-                            level_parts = rest.split(': ', 1)
-                            if len(level_parts) == 2:
-                                level = level_parts[0]
-                                message = level_parts[1]
-                            else:
-                                level = "INFO"
-                                message = rest
-                        else:
-                            timestamp_part = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                            level = "INFO"
-                            message = log_entry
-                        
-                        writer.writerow([timestamp_part, level, message])
-                        
-                    except Exception as e:
-                        print(f"Error parsing log entry: {str(e)}")
-                        continue
+                csvfile.write(buffer.getvalue())
             
             self.log(f"📊 Logs exported to: {filepath}")
             return filepath
@@ -246,15 +471,17 @@ class BotLogger:
             
             filepath = os.path.join(LOG_DIR, filename)
             
+            # Snapshot first; producers keep appending while the file is written
+            entries = list(self.log_buffer)
+            
             with open(filepath, 'w', encoding='utf-8') as f:
                 f.write("MT5 Trading Bot - Log Export\n")
                 f.write("=" * 50 + "\n")
                 f.write(f"Export Date: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                f.write(f"Total Entries: {len(self.log_buffer)}\n")
+                f.write(f"Total Entries: {len(entries)}\n")
                 f.write("=" * 50 + "\n\n")
                 
-                for log_entry in self.log_buffer:
-                    f.write(log_entry + '\n')
+                f.writelines(f"[{ts}] {level}: {message}\n" for ts, level, message in entries)
             
             self.log(f"📊 Logs exported to: {filepath}")
             return filepath
@@ -265,9 +492,8 @@ class BotLogger:
     
     def clear_logs(self) -> None:
         """Clear log buffer."""
-        with self.log_lock:
-            self.log_buffer.clear()
-            self.log("🧹 Log buffer cleared")
+        self.log_buffer.clear()
+        self.log("🧹 Log buffer cleared")
     
     def get_log_stats(self) -> Dict[str, Any]:
         """
@@ -277,18 +503,16 @@ class BotLogger:
             Dict with log statistics
         """
         try:
-            with self.log_lock:
-                total_logs = len(self.log_buffer)
-                error_count = sum(1 for log in self.log_buffer if "ERROR" in log)
-                warning_count = sum(1 for log in self.log_buffer if "WARNING" in log)
-                
-                return {
-                    "total_logs": total_logs,
-                    "error_count": error_count,
-                    "warning_count": warning_count,
-                    "buffer_size": self.max_buffer_size,
-                    "log_file": self.log_file_path
-                }
+            entries = list(self.log_buffer)
+            level_counts = Counter(record[1] for record in entries)
+            
+            return {
+                "total_logs": len(entries),
+                "error_count": level_counts["ERROR"],
+                "warning_count": level_counts["WARNING"],
+                "buffer_size": self.max_buffer_size,
+                "log_file": self.log_file_path
+            }
                 
         except Exception as e:
             self.log(f"❌ Error getting log stats: {str(e)}", "ERROR")
@@ -322,35 +546,41 @@ class BotLogger:
             str: Formatted performance report
         """
         try:
-            report_lines = []
-            report_lines.append("📊 TRADING BOT PERFORMANCE REPORT")
-            report_lines.append("=" * 50)
-            report_lines.append(f"Report Time: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-            report_lines.append("")
+            separator = "=" * 50
+            report_time = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            report_lines = [
+                "📊 TRADING BOT PERFORMANCE REPORT",
+                separator,
+                f"Report Time: {report_time}",
+                ""
+            ]
             
             if session_data:
-                report_lines.append("💰 SESSION STATISTICS:")
-                report_lines.append(f"  Total Trades: {session_data.get('total_trades', 0)}")
-                report_lines.append(f"  Winning Trades: {session_data.get('winning_trades', 0)}")
-                report_lines.append(f"  Losing Trades: {session_data.get('losing_trades', 0)}")
-                
                 total_trades = session_data.get('total_trades', 0)
-                if total_trades > 0:
-                    win_rate = (session_data.get('winning_trades', 0) / total_trades) * 100
-                    report_lines.append(f"  Win Rate: {win_rate:.1f}%")
+                winning_trades = session_data.get('winning_trades', 0)
+                losing_trades = session_data.get('losing_trades', 0)
+                total_profit = session_data.get('total_profit', 0)
                 
-                report_lines.append(f"  Total Profit: {session_data.get('total_profit', 0):.2f}")
-                report_lines.append("")
+                report_lines += [
+                    "💰 SESSION STATISTICS:",
+                    f"  Total Trades: {total_trades}",
+                    f"  Winning Trades: {winning_trades}",
+                    f"  Losing Trades: {losing_trades}"
+                ]
+                if total_trades > 0:
+                    report_lines.append(f"  Win Rate: {winning_trades / total_trades * 100:.1f}%")
+                report_lines += [f"  Total Profit: {total_profit:.2f}", ""]
             
             # Log statistics
             log_stats = self.get_log_stats()
-            report_lines.append("📋 LOG STATISTICS:")
-            report_lines.append(f"  Total Log Entries: {log_stats.get('total_logs', 0)}")
-            report_lines.append(f"  Error Count: {log_stats.get('error_count', 0)}")
-            report_lines.append(f"  Warning Count: {log_stats.get('warning_count', 0)}")
-            report_lines.append("")
-            
-            report_lines.append("=" * 50)
+            report_lines += [
+                "📋 LOG STATISTICS:",
+                f"  Total Log Entries: {log_stats.get('total_logs', 0)}",
+                f"  Error Count: {log_stats.get('error_count', 0)}",
+                f"  Warning Count: {log_stats.get('warning_count', 0)}",
+                "",
+                separator
+            ]
             
             report = "\n".join(report_lines)
             self.log("📊 Performance report generated")
@@ -4,223 +4,406 @@ This module provides a mock implementation of the MetaTrader5 API for testing pu
 when the actual MT5 terminal is not available.
 """
 
+import os
 import time
-import random
 import datetime
-from typing import Optional, List, Dict, Any, NamedTuple
+import functools
+import itertools
+import logging
+from types import MappingProxyType
+from typing import Optional, List, Dict, Any
+
+import numpy as np
+
+
+_REQUIRED = object()
+
+_log = logging.getLogger(__name__)
+
+_TERMINAL_INFO_FIELDS = {
+    'community_account': False,
+    'community_connection': False,
+    'dlls_allowed': True,
+    'trade_allowed': True,
+    'tradeapi_disabled': False,
+    'email_enabled': False,
+    'ftp_enabled': False,
+    'notifications_enabled': False,
+    'mqid': False,
+    'build': 4815,
+    'maxbars': 100000,
+    'codepage': 1252,
+    'ping_last': 15,
+    'community_balance': 0.0,
+    'retransmission': 0.0,
+    'company': "Mock Broker Ltd",
+    'name': "MetaTrader 5 Mock",
+    'language': 1033,
+    'path': "/mock/mt5/path",
+}
+# terminal_info() results, prebuilt for each connection state
+_TERMINAL_INFO = {
+    flag: MappingProxyType({**_TERMINAL_INFO_FIELDS, 'connected': flag}) for flag in (False, True)
+}
+
+# Simulated terminal latency in seconds (0 = no delay), overridable per instance via set_latency()
+MOCK_LATENCY = float(os.environ.get('MOCK_MT5_LATENCY', '0'))
+
+# Constants read on the order/position paths, bound at module level so those
+# paths use a global load instead of an instance -> class attribute lookup
+_TRADE_RETCODE_DONE = 10009
+_TRADE_RETCODE_ERROR = 10013
+_TRADE_RETCODE_INVALID = 10014
+_TRADE_RETCODE_CONNECTION = 10032
+_ORDER_TYPE_BUY = 0
+_TRADE_ACTION_DEAL = 1
+_TRADE_ACTION_SLTP = 2
+_POSITION_TYPE_BUY = 0
+_POSITION_TYPE_SELL = 1
+
+# Same layout as the rates arrays returned by MetaTrader5.copy_rates_*
+RATES_DTYPE = np.dtype([
+    ('time', '<i8'), ('open', '<f8'), ('high', '<f8'), ('low', '<f8'),
+    ('close', '<f8'), ('tick_volume', '<i8'), ('spread', '<i4'), ('real_volume', '<i8')
+])
+
+# Deal records kept by the mock; symbol is an index into MockMT5._symbol_names
+DEAL_DTYPE = np.dtype([
+    ('ticket', '<i8'), ('order', '<i8'), ('time', '<i8'), ('time_msc', '<i8'),
+    ('position_id', '<i8'), ('volume', '<f8'), ('price', '<f8'), ('symbol', '<i2')
+])
+
+# Per-tick price noise is drawn ahead of time into a ring buffer per symbol
+_TICK_NOISE_SIZE = 1 << 12
+_TICK_NOISE_MASK = _TICK_NOISE_SIZE - 1
+_TICK_NOISE_BASE = 0.0001
+_TICK_NOISE_SCALE = {
+    'XAUUSD': 100,   # Gold moves more
+    'BTCUSD': 1000,  # Bitcoin moves much more
+    'SPX500': 10     # Index moves more
+}
+
+
+@functools.lru_cache(maxsize=64)
+def _upper(symbol: str) -> str:
+    """Uppercase a symbol name, memoized for the handful of names in use."""
+    return symbol.upper()
+
+
+class _MockStruct:
+    """
+    Slotted stand-in for the MT5 result structs.
+    
+    Subclasses list their fields in _DEFAULTS (in MT5 order); fields without
+    a default use _REQUIRED. Supports the named-tuple API callers rely on
+    (_replace, _asdict, _fields) plus indexing, unpacking and hashing in
+    field order, without tuple indexing on every attribute access.
+    
+    Only the fields a caller passes are stored; the rest are read from the
+    class-level _DEFAULTS on access, so construction cost scales with the
+    number of overridden fields rather than the size of the MT5 struct.
+    """
+    __slots__ = ('_assigned',)
+    _DEFAULTS: Dict[str, Any] = {}
+    _required: tuple = ()
+    
+    def __init__(self, *args, **kwargs):
+        if args:
+            kwargs = {**dict(zip(self.__slots__, args)), **kwargs}
+        defaults = self._DEFAULTS
+        for name, value in kwargs.items():
+            if name not in defaults:
+                raise TypeError(f"{type(self).__name__} got unexpected fields "
+                                f"{sorted(set(kwargs) - set(defaults))}")
+            setattr(self, name, value)
+        for name in self._required:
+            if name not in kwargs:
+                raise TypeError(f"{type(self).__name__} missing required field '{name}'")
+        self._assigned = tuple(kwargs)
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._fields = cls.__slots__
+        cls._required = tuple(name for name, default in cls._DEFAULTS.items() if default is _REQUIRED)
+    
+    def __getattr__(self, name):
+        # Only reached for fields never assigned on this instance
+        value = self._DEFAULTS.get(name, _REQUIRED)
+        if value is _REQUIRED:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+        return value
+    
+    def _replace(self, **changes):
+        """Return a copy with the given fields changed."""
+        unexpected = changes.keys() - self._DEFAULTS.keys()
+        if unexpected:
+            raise ValueError(f"Got unexpected field names: {sorted(unexpected)}")
+        clone = object.__new__(type(self))
+        assigned = self._assigned
+        for name in assigned:
+            if name not in changes:
+                setattr(clone, name, getattr(self, name))
+        for name, value in changes.items():
+            setattr(clone, name, value)
+        added = tuple(name for name in changes if name not in assigned)
+        clone._assigned = assigned + added if added else assigned
+        return clone
+    
+    def _asdict(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in self.__slots__}
+    
+    def __iter__(self):
+        for name in self.__slots__:
+            yield getattr(self, name)
+    
+    def __len__(self) -> int:
+        return len(self.__slots__)
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return tuple(self)[index]
+        return getattr(self, self.__slots__[index])
+    
+    def __eq__(self, other) -> bool:
+        return type(other) is type(self) and self._asdict() == other._asdict()
+    
+    def __hash__(self) -> int:
+        return hash((type(self), tuple(self)))
+    
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{type(self).__name__}({fields})"
 
 
-class MockAccountInfo(NamedTuple):
+class MockAccountInfo(_MockStruct):
     """Mock account information structure."""
-    login: int = 12345678
-    trade_mode: int = 0
-    leverage: int = 100
-    limit_orders: int = 200
-    margin_so_mode: int = 0
-    trade_allowed: bool = True
-    trade_expert: bool = True
-    margin_mode: int = 0
-    currency_digits: int = 2
-    fifo_close: bool = False
-    balance: float = 10000.0
-    credit: float = 0.0
-    profit: float = 0.0
-    equity: float = 10000.0
-    margin: float = 0.0
-    margin_free: float = 10000.0
-    margin_level: float = 0.0
-    margin_so_call: float = 50.0
-    margin_so_so: float = 30.0
-    margin_initial: float = 0.0
-    margin_maintenance: float = 0.0
-    assets: float = 0.0
-    liabilities: float = 0.0
-    commission_blocked: float = 0.0
-    name: str = "Demo Account"
-    server: str = "MockServer-Demo"
-    currency: str = "USD"
-    company: str = "Mock Broker Ltd"
-
-
-class MockSymbolInfo(NamedTuple):
+    _DEFAULTS = {
+        'login': 12345678,
+        'trade_mode': 0,
+        'leverage': 100,
+        'limit_orders': 200,
+        'margin_so_mode': 0,
+        'trade_allowed': True,
+        'trade_expert': True,
+        'margin_mode': 0,
+        'currency_digits': 2,
+        'fifo_close': False,
+        'balance': 10000.0,
+        'credit': 0.0,
+        'profit': 0.0,
+        'equity': 10000.0,
+        'margin': 0.0,
+        'margin_free': 10000.0,
+        'margin_level': 0.0,
+        'margin_so_call': 50.0,
+        'margin_so_so': 30.0,
+        'margin_initial': 0.0,
+        'margin_maintenance': 0.0,
+        'assets': 0.0,
+        'liabilities': 0.0,
+        'commission_blocked': 0.0,
+        'name': "Demo Account",
+        'server': "MockServer-Demo",
+        'currency': "USD",
+        'company': "Mock Broker Ltd"
+    }
+    __slots__ = tuple(_DEFAULTS)
+
+
+class MockSymbolInfo(_MockStruct):
     """Mock symbol information structure."""
-    custom: bool = False
-    chart_mode: int = 0
-    select: bool = True
-    visible: bool = True
-    session_deals: int = 0
-    session_buy_orders: int = 0
-    session_sell_orders: int = 0
-    volume: int = 0
-    volumehigh: int = 0
-    volumelow: int = 0
-    time: int = int(time.time())
-    digits: int = 5
-    spread: int = 20
-    spread_float: bool = True
-    ticks_bookdepth: int = 10
-    trade_calc_mode: int = 0
-    trade_mode: int = 0
-    start_time: int = 0
-    expiration_time: int = 0
-    trade_stops_level: int = 0
-    trade_freeze_level: int = 0
-    trade_exemode: int = 0
-    swap_mode: int = 0
-    swap_rollover3days: int = 3
-    margin_hedged_use_leg: bool = False
-    expiration_mode: int = 0
-    filling_mode: int = 0
-    order_mode: int = 0
-    order_gtc_mode: int = 0
-    option_mode: int = 0
-    option_right: int = 0
-    bid: float = 1.08500
-    bidhigh: float = 1.08600
-    bidlow: float = 1.08400
-    ask: float = 1.08520
-    askhigh: float = 1.08620
-    asklow: float = 1.08420
-    last: float = 1.08510
-    lasthigh: float = 1.08610
-    lastlow: float = 1.08410
-    volume_real: float = 0.0
-    volumehigh_real: float = 0.0
-    volumelow_real: float = 0.0
-    option_strike: float = 0.0
-    point: float = 0.00001
-    trade_tick_value: float = 1.0
-    trade_tick_value_profit: float = 1.0
-    trade_tick_value_loss: float = 1.0
-    trade_tick_size: float = 0.00001
-    trade_contract_size: float = 100000.0
-    trade_accrued_interest: float = 0.0
-    trade_face_value: float = 0.0
-    trade_liquidity_rate: float = 0.0
-    volume_min: float = 0.01
-    volume_max: float = 500.0
-    volume_step: float = 0.01
-    volume_limit: float = 0.0
-    swap_long: float = -0.76
-    swap_short: float = 0.24
-    margin_initial: float = 0.0
-    margin_maintenance: float = 0.0
-    session_volume: float = 0.0
-    session_turnover: float = 0.0
-    session_interest: float = 0.0
-    session_buy_orders_volume: float = 0.0
-    session_sell_orders_volume: float = 0.0
-    session_open: float = 1.08500
-    session_close: float = 1.08510
-    session_aw: float = 0.0
-    session_price_settlement: float = 0.0
-    session_price_limit_min: float = 0.0
-    session_price_limit_max: float = 0.0
-    margin_hedged: float = 50000.0
-    price_change: float = 0.0001
-    price_volatility: float = 0.0
-    price_theoretical: float = 0.0
-    price_greeks_delta: float = 0.0
-    price_greeks_theta: float = 0.0
-    price_greeks_gamma: float = 0.0
-    price_greeks_vega: float = 0.0
-    price_greeks_rho: float = 0.0
-    price_greeks_omega: float = 0.0
-    price_sensitivity: float = 0.0
-    basis: str = ""
-    category: str = ""
-    currency_base: str = "EUR"
-    currency_profit: str = "USD"
-    currency_margin: str = "EUR"
-    bank: str = ""
-    description: str = "Euro vs US Dollar"
-    exchange: str = ""
-    formula: str = ""
-    isin: str = ""
-    name: str = "EURUSD"
-    page: str = ""
-    path: str = ""
-
-
-class MockTick(NamedTuple):
+    _DEFAULTS = {
+        'custom': False,
+        'chart_mode': 0,
+        'select': True,
+        'visible': True,
+        'session_deals': 0,
+        'session_buy_orders': 0,
+        'session_sell_orders': 0,
+        'volume': 0,
+        'volumehigh': 0,
+        'volumelow': 0,
+        'time': int(time.time()),
+        'digits': 5,
+        'spread': 20,
+        'spread_float': True,
+        'ticks_bookdepth': 10,
+        'trade_calc_mode': 0,
+        'trade_mode': 0,
+        'start_time': 0,
+        'expiration_time': 0,
+        'trade_stops_level': 0,
+        'trade_freeze_level': 0,
+        'trade_exemode': 0,
+        'swap_mode': 0,
+        'swap_rollover3days': 3,
+        'margin_hedged_use_leg': False,
+        'expiration_mode': 0,
+        'filling_mode': 0,
+        'order_mode': 0,
+        'order_gtc_mode': 0,
+        'option_mode': 0,
+        'option_right': 0,
+        'bid': 1.08500,
+        'bidhigh': 1.08600,
+        'bidlow': 1.08400,
+        'ask': 1.08520,
+        'askhigh': 1.08620,
+        'asklow': 1.08420,
+        'last': 1.08510,
+        'lasthigh': 1.08610,
+        'lastlow': 1.08410,
+        'volume_real': 0.0,
+        'volumehigh_real': 0.0,
+        'volumelow_real': 0.0,
+        'option_strike': 0.0,
+        'point': 0.00001,
+        'trade_tick_value': 1.0,
+        'trade_tick_value_profit': 1.0,
+        'trade_tick_value_loss': 1.0,
+        'trade_tick_size': 0.00001,
+        'trade_contract_size': 100000.0,
+        'trade_accrued_interest': 0.0,
+        'trade_face_value': 0.0,
+        'trade_liquidity_rate': 0.0,
+        'volume_min': 0.01,
+        'volume_max': 500.0,
+        'volume_step': 0.01,
+        'volume_limit': 0.0,
+        'swap_long': -0.76,
+        'swap_short': 0.24,
+        'margin_initial': 0.0,
+        'margin_maintenance': 0.0,
+        'session_volume': 0.0,
+        'session_turnover': 0.0,
+        'session_interest': 0.0,
+        'session_buy_orders_volume': 0.0,
+        'session_sell_orders_volume': 0.0,
+        'session_open': 1.08500,
+        'session_close': 1.08510,
+        'session_aw': 0.0,
+        'session_price_settlement': 0.0,
+        'session_price_limit_min': 0.0,
+        'session_price_limit_max': 0.0,
+        'margin_hedged': 50000.0,
+        'price_change': 0.0001,
+        'price_volatility': 0.0,
+        'price_theoretical': 0.0,
+        'price_greeks_delta': 0.0,
+        'price_greeks_theta': 0.0,
+        'price_greeks_gamma': 0.0,
+        'price_greeks_vega': 0.0,
+        'price_greeks_rho': 0.0,
+        'price_greeks_omega': 0.0,
+        'price_sensitivity': 0.0,
+        'basis': "",
+        'category': "",
+        'currency_base': "EUR",
+        'currency_profit': "USD",
+        'currency_margin': "EUR",
+        'bank': "",
+        'description': "Euro vs US Dollar",
+        'exchange': "",
+        'formula': "",
+        'isin': "",
+        'name': "EURUSD",
+        'page': "",
+        'path': ""
+    }
+    __slots__ = tuple(_DEFAULTS)
+
+
+class MockTick(_MockStruct):
     """Mock tick data structure."""
-    time: int
-    bid: float
-    ask: float
-    last: float
-    volume: int
-    time_msc: int
-    flags: int = 0
-    volume_real: float = 100.0
-
-
-class MockTradeResult(NamedTuple):
+    _DEFAULTS = {
+        'time': _REQUIRED,
+        'bid': _REQUIRED,
+        'ask': _REQUIRED,
+        'last': _REQUIRED,
+        'volume': _REQUIRED,
+        'time_msc': _REQUIRED,
+        'flags': 0,
+        'volume_real': 100.0
+    }
+    __slots__ = tuple(_DEFAULTS)
+
+
+class MockTradeResult(_MockStruct):
     """Mock trade result structure."""
-    retcode: int = 10009  # TRADE_RETCODE_DONE
-    deal: Optional[int] = None
-    order: Optional[int] = None
-    volume: float = 0.0
-    price: float = 0.0
-    bid: float = 0.0
-    ask: float = 0.0
-    comment: str = ""
-    request_id: int = 0
-    retcode_external: int = 0
-
-
-class MockPosition(NamedTuple):
+    _DEFAULTS = {
+        'retcode': _TRADE_RETCODE_DONE,
+        'deal': None,
+        'order': None,
+        'volume': 0.0,
+        'price': 0.0,
+        'bid': 0.0,
+        'ask': 0.0,
+        'comment': "",
+        'request_id': 0,
+        'retcode_external': 0
+    }
+    __slots__ = tuple(_DEFAULTS)
+
+
+class MockPosition(_MockStruct):
     """Mock position structure."""
-    ticket: int
-    time: int
-    time_msc: int
-    time_update: int
-    time_update_msc: int
-    type: int = 0  # POSITION_TYPE_BUY
-    magic: int = 0
-    identifier: int = 0
-    reason: int = 0
-    volume: float = 0.01
-    price_open: float = 1.08500
-    sl: float = 0.0
-    tp: float = 0.0
-    price_current: float = 1.08520
-    swap: float = 0.0
-    profit: float = 2.0
-    symbol: str = "EURUSD"
-    comment: str = "AutoBotCuan"
-    external_id: str = ""
-
-
-class MockDeal(NamedTuple):
+    _DEFAULTS = {
+        'ticket': _REQUIRED,
+        'time': _REQUIRED,
+        'time_msc': _REQUIRED,
+        'time_update': _REQUIRED,
+        'time_update_msc': _REQUIRED,
+        'type': 0,  # POSITION_TYPE_BUY
+        'magic': 0,
+        'identifier': 0,
+        'reason': 0,
+        'volume': 0.01,
+        'price_open': 1.08500,
+        'sl': 0.0,
+        'tp': 0.0,
+        'price_current': 1.08520,
+        'swap': 0.0,
+        'profit': 2.0,
+        'symbol': "EURUSD",
+        'comment': "AutoBotCuan",
+        'external_id': ""
+    }
+    __slots__ = tuple(_DEFAULTS)
+
+
+class MockDeal(_MockStruct):
     """Mock deal structure."""
-    ticket: int
-    order: int
-    time: int
-    time_msc: int
-    type: int = 0  # DEAL_TYPE_BUY
-    entry: int = 0  # DEAL_ENTRY_IN
-    magic: int = 0
-    position_id: int = 0
-    reason: int = 0
-    volume: float = 0.01
-    price: float = 1.08500
-    commission: float = 0.0
-    swap: float = 0.0
-    profit: float = 0.0
-    fee: float = 0.0
-    symbol: str = "EURUSD"
-    comment: str = "AutoBotCuan"
-    external_id: str = ""
+    _DEFAULTS = {
+        'ticket': _REQUIRED,
+        'order': _REQUIRED,
+        'time': _REQUIRED,
+        'time_msc': _REQUIRED,
+        'type': 0,  # DEAL_TYPE_BUY
+        'entry': 0,  # DEAL_ENTRY_IN
+        'magic': 0,
+        'position_id': 0,
+        'reason': 0,
+        'volume': 0.01,
+        'price': 1.08500,
+        'commission': 0.0,
+        'swap': 0.0,
+        'profit': 0.0,
+        'fee': 0.0,
+        'symbol': "EURUSD",
+        'comment': "AutoBotCuan",
+        'external_id': ""
+    }
+    __slots__ = tuple(_DEFAULTS)
 
 
 class MockMT5:
     """Mock MetaTrader 5 API implementation for testing."""
     
     # Constants
-    TRADE_RETCODE_DONE = 10009
-    TRADE_RETCODE_ERROR = 10013
+    TRADE_RETCODE_DONE = _TRADE_RETCODE_DONE
+    TRADE_RETCODE_ERROR = _TRADE_RETCODE_ERROR
     TRADE_RETCODE_TIMEOUT = 10012
-    TRADE_RETCODE_INVALID = 10014
+    TRADE_RETCODE_INVALID = _TRADE_RETCODE_INVALID
     TRADE_RETCODE_INVALID_VOLUME = 10015
     TRADE_RETCODE_INVALID_PRICE = 10016
     TRADE_RETCODE_INVALID_STOPS = 10017
@@ -238,7 +421,7 @@ class MockMT5:
     TRADE_RETCODE_LOCKED = 10029
     TRADE_RETCODE_FROZEN = 10030
     TRADE_RETCODE_INVALID_FILL = 10031
-    TRADE_RETCODE_CONNECTION = 10032
+    TRADE_RETCODE_CONNECTION = _TRADE_RETCODE_CONNECTION
     TRADE_RETCODE_ONLY_REAL = 10033
     TRADE_RETCODE_LIMIT_ORDERS = 10034
     TRADE_RETCODE_LIMIT_VOLUME = 10035
@@ -253,7 +436,7 @@ class MockMT5:
     TRADE_RETCODE_CLOSE_ONLY = 10044
     TRADE_RETCODE_FIFO_CLOSE = 10045
     
-    ORDER_TYPE_BUY = 0
+    ORDER_TYPE_BUY = _ORDER_TYPE_BUY
     ORDER_TYPE_SELL = 1
     ORDER_TYPE_BUY_LIMIT = 2
     ORDER_TYPE_SELL_LIMIT = 3
@@ -263,15 +446,15 @@ class MockMT5:
     ORDER_TYPE_SELL_STOP_LIMIT = 7
     ORDER_TYPE_CLOSE_BY = 8
     
-    TRADE_ACTION_DEAL = 1
+    TRADE_ACTION_DEAL = _TRADE_ACTION_DEAL
     TRADE_ACTION_PENDING = 5
-    TRADE_ACTION_SLTP = 2
+    TRADE_ACTION_SLTP = _TRADE_ACTION_SLTP
     TRADE_ACTION_MODIFY = 3
     TRADE_ACTION_REMOVE = 4
     TRADE_ACTION_CLOSE_BY = 10
     
-    POSITION_TYPE_BUY = 0
-    POSITION_TYPE_SELL = 1
+    POSITION_TYPE_BUY = _POSITION_TYPE_BUY
+    POSITION_TYPE_SELL = _POSITION_TYPE_SELL
     
     ORDER_TIME_GTC = 0
     ORDER_TIME_DAY = 1
@@ -286,6 +469,7 @@ class MockMT5:
         self.initialized = False
         self.connected = False
         self.account_info_data = MockAccountInfo()
+        self._account_cache = None  # (account_info_data, snapshot); cleared when position profits change
         self.symbols = {
             'EURUSD': MockSymbolInfo(name='EURUSD', digits=5, point=0.00001, 
                                    currency_base='EUR', currency_profit='USD', 
@@ -311,26 +495,71 @@ class MockMT5:
         }
         self.positions = {}
         self.orders = {}
-        self.deals = []
-        self.next_ticket = 100000
+        # Deals as a growable structured array, ascending by time since they are appended in order
+        self._deals_arr = np.empty(1024, dtype=DEAL_DTYPE)
+        self._deal_count = 0
+        self._tickets = itertools.count(100000)  # Shared by orders and deals
         self._last_error_code = 0
+        self.init_latency = MOCK_LATENCY
+        self.order_latency = MOCK_LATENCY
+        self._rng = np.random.default_rng()
+        self._unit_noise = self._rng.uniform(-1.0, 1.0, _TICK_NOISE_SIZE)  # Shared by every symbol's buffer
+        self._tick_noise = {name: self._build_tick_noise(name) for name in self.symbols}
+        self._pip_factor = {name: info.trade_contract_size / info.point for name, info in self.symbols.items()}
+        
+        # Numeric position fields as parallel arrays (SoA) for vectorized profit updates
+        self._symbol_names = []
+        self._symbol_index = {}
+        self._pos_count = 0
+        self._pos_rows = {}
+        self._pos_by_symbol = {}
+        self._pos_arrays = {
+            'ticket': np.empty(64, dtype=np.int64),
+            'symbol': np.empty(64, dtype=np.int16),
+            'type': np.empty(64, dtype=np.int8),
+            'volume': np.empty(64),
+            'price_open': np.empty(64),
+            'price_current': np.empty(64),
+            'profit': np.empty(64)  # Last priced profit per position, summed by account_info
+        }
+        self._tick_volumes = (self._rng.integers(10, 1001, _TICK_NOISE_SIZE).tolist(), itertools.count())
     
     def initialize(self, path: str = "", login: Optional[int] = None, password: str = "", 
                   server: str = "", timeout: int = 60000, portable: bool = False) -> bool:
         """Mock MT5 initialization."""
-        print("🔄 Mock MT5: Initializing connection...")
-        time.sleep(0.5)  # Simulate connection time
+        debug = _log.isEnabledFor(logging.DEBUG)
+        if debug:
+            _log.debug("🔄 Mock MT5: Initializing connection...")
+        if self.init_latency:
+            time.sleep(self.init_latency)  # Simulate connection time
         self.initialized = True
         self.connected = True
-        print("✅ Mock MT5: Connected successfully!")
+        if debug:
+            _log.debug("✅ Mock MT5: Connected successfully!")
         return True
     
+    def set_latency(self, init: Optional[float] = None, order: Optional[float] = None) -> None:
+        """
+        Set simulated delays for initialize() and order_send().
+        
+        Args:
+            init: Seconds initialize() sleeps (None leaves it unchanged)
+            order: Seconds order_send() sleeps (None leaves it unchanged)
+        """
+        if init is not None:
+            self.init_latency = init
+        if order is not None:
+            self.order_latency = order
+    
     def shutdown(self) -> None:
         """Mock MT5 shutdown."""
-        print("🔄 Mock MT5: Shutting down...")
+        debug = _log.isEnabledFor(logging.DEBUG)
+        if debug:
+            _log.debug("🔄 Mock MT5: Shutting down...")
         self.initialized = False
         self.connected = False
-        print("✅ Mock MT5: Disconnected successfully!")
+        if debug:
+            _log.debug("✅ Mock MT5: Disconnected successfully!")
     
     def version(self) -> tuple:
         """Mock version information."""
@@ -341,41 +570,33 @@ class MockMT5:
         if not self.connected:
             return None
         
+        cache = self._account_cache
+        if cache is not None and cache[0] is self.account_info_data:
+            return cache[1]
+        
         # Simulate balance changes from open positions
-        total_profit = sum(pos.profit for pos in self.positions.values())
+        total_profit = float(self._pos_arrays['profit'][:self._pos_count].sum())
         balance = self.account_info_data.balance
         equity = balance + total_profit
         
-        return self.account_info_data._replace(
+        account = self.account_info_data._replace(
             equity=equity,
             profit=total_profit,
             margin_free=equity
         )
+        self._account_cache = (self.account_info_data, account)
+        return account
     
-    def terminal_info(self) -> dict:
-        """Mock terminal information."""
-        return {
-            'community_account': False,
-            'community_connection': False,
-            'connected': self.connected,
-            'dlls_allowed': True,
-            'trade_allowed': True,
-            'tradeapi_disabled': False,
-            'email_enabled': False,
-            'ftp_enabled': False,
-            'notifications_enabled': False,
-            'mqid': False,
-            'build': 4815,
-            'maxbars': 100000,
-            'codepage': 1252,
-            'ping_last': 15,
-            'community_balance': 0.0,
-            'retransmission': 0.0,
-            'company': "Mock Broker Ltd",
-            'name': "MetaTrader 5 Mock",
-            'language': 1033,
-            'path': "/mock/mt5/path"
-        }
+    def terminal_info(self) -> MappingProxyType:
+        """Mock terminal information (shared read-only mapping)."""
+        return _TERMINAL_INFO[bool(self.connected)]
+    
+    def _lookup_symbol(self, symbol: str) -> Optional[MockSymbolInfo]:
+        """Find a symbol by name; keys are uppercase, so only non-canonical names get uppercased."""
+        symbol_info = self.symbols.get(symbol)
+        if symbol_info is None:
+            symbol_info = self.symbols.get(_upper(symbol))
+        return symbol_info
     
     def symbols_total(self) -> int:
         """Mock total symbols count."""
@@ -389,107 +610,104 @@ class MockMT5:
         # Filter symbols based on group pattern
         if group == "*":
             return list(self.symbols.values())
-        else:
-            # Simple pattern matching
-            filtered = []
-            for symbol in self.symbols.values():
-                if group.upper() in symbol.name.upper():
-                    filtered.append(symbol)
-            return filtered
+        
+        # Simple pattern matching; keys are the canonical uppercase names
+        pattern = group.upper()
+        return [symbol for name, symbol in self.symbols.items() if pattern in name]
     
     def symbol_info(self, symbol: str) -> Optional[MockSymbolInfo]:
         """Mock symbol information."""
         if not self.connected:
             return None
         
-        return self.symbols.get(symbol.upper())
+        return self._lookup_symbol(symbol)
     
     def symbol_info_tick(self, symbol: str) -> Optional[MockTick]:
         """Mock tick information."""
         if not self.connected:
             return None
         
-        symbol_info = self.symbols.get(symbol.upper())
+        symbol_info = self._lookup_symbol(symbol)
         if not symbol_info:
             return None
         
-        # Simulate price movement
-        base_bid = symbol_info.bid
-        base_ask = symbol_info.ask
+        # Simulate price movement from the symbol's precomputed noise
+        price_change = self._next_price_move(symbol_info.name)
         
-        # Add small random movement
-        price_change = random.uniform(-0.0001, 0.0001)
-        if symbol == 'XAUUSD':
-            price_change *= 100  # Gold moves more
-        elif symbol == 'BTCUSD':
-            price_change *= 1000  # Bitcoin moves much more
-        elif symbol == 'SPX500':
-            price_change *= 10  # Index moves more
+        volumes, volume_counter = self._tick_volumes
+        new_bid = symbol_info.bid + price_change
+        new_ask = symbol_info.ask + price_change
         
-        new_bid = base_bid + price_change
-        new_ask = base_ask + price_change
-        
-        current_time = int(time.time())
+        current_time_msc = time.time_ns() // 1_000_000
         return MockTick(
-            time=current_time,
+            time=current_time_msc // 1000,
             bid=new_bid,
             ask=new_ask,
             last=(new_bid + new_ask) / 2,
-            volume=random.randint(10, 1000),
-            time_msc=current_time * 1000
+            volume=volumes[next(volume_counter) & _TICK_NOISE_MASK],
+            time_msc=current_time_msc
         )
     
+    def _next_price_move(self, name: str) -> float:
+        """Next sample from the symbol's noise ring buffer."""
+        noise = self._tick_noise.get(name)
+        if noise is None:
+            noise = self._tick_noise[name] = self._build_tick_noise(name)
+        samples, counter = noise
+        return samples[next(counter) & _TICK_NOISE_MASK]
+    
+    def _build_tick_noise(self, name: str) -> tuple:
+        """Scale the shared unit noise for the symbol, read from a random phase so symbols don't move in lockstep."""
+        scale = _TICK_NOISE_BASE * _TICK_NOISE_SCALE.get(name, 1)
+        return (self._unit_noise * scale).tolist(), itertools.count(int(self._rng.integers(_TICK_NOISE_SIZE)))
+    
     def symbol_select(self, symbol: str, enable: bool = True) -> bool:
         """Mock symbol selection."""
         if not self.connected:
             return False
         
-        if symbol.upper() in self.symbols:
-            return True
-        return False
+        return self._lookup_symbol(symbol) is not None
     
     def order_send(self, request: dict) -> MockTradeResult:
         """Mock order sending."""
         if not self.connected:
-            return MockTradeResult(retcode=self.TRADE_RETCODE_CONNECTION)
+            return MockTradeResult(retcode=_TRADE_RETCODE_CONNECTION)
         
         # Simulate processing time
-        time.sleep(0.1)
-        
-        # Basic validation
-        if not request.get('symbol') or request.get('volume', 0) <= 0:
-            return MockTradeResult(retcode=self.TRADE_RETCODE_INVALID)
+        if self.order_latency:
+            time.sleep(self.order_latency)
         
-        symbol = request['symbol']
-        if symbol not in self.symbols:
-            return MockTradeResult(retcode=self.TRADE_RETCODE_INVALID)
+        # Basic validation (one probe resolves the symbol for pricing too)
+        symbol = request.get('symbol')
+        symbol_info = self.symbols.get(symbol) if symbol else None
+        if symbol_info is None or request.get('volume', 0) <= 0:
+            return MockTradeResult(retcode=_TRADE_RETCODE_INVALID)
         
         action = request.get('action')
         
-        if action == self.TRADE_ACTION_DEAL:
+        if action == _TRADE_ACTION_DEAL:
             # Market order
-            ticket = self.next_ticket
-            self.next_ticket += 1
+            ticket = next(self._tickets)
             
             order_type = request.get('type')
             volume = request['volume']
             
-            # Get current price
-            tick = self.symbol_info_tick(symbol)
-            if not tick:
-                return MockTradeResult(retcode=self.TRADE_RETCODE_INVALID)
-            
-            price = tick.ask if order_type == self.ORDER_TYPE_BUY else tick.bid
+            # Current price: one noise sample on the resolved symbol, no full tick
+            price_change = self._next_price_move(symbol_info.name)
+            bid = symbol_info.bid + price_change
+            ask = symbol_info.ask + price_change
+            price = ask if order_type == _ORDER_TYPE_BUY else bid
             
             # Create position
-            current_time = int(time.time())
+            current_time_msc = time.time_ns() // 1_000_000
+            current_time = current_time_msc // 1000
             position = MockPosition(
                 ticket=ticket,
                 time=current_time,
-                time_msc=current_time * 1000,
+                time_msc=current_time_msc,
                 time_update=current_time,
-                time_update_msc=current_time * 1000,
-                type=self.POSITION_TYPE_BUY if order_type == self.ORDER_TYPE_BUY else self.POSITION_TYPE_SELL,
+                time_update_msc=current_time_msc,
+                type=_POSITION_TYPE_BUY if order_type == _ORDER_TYPE_BUY else _POSITION_TYPE_SELL,
                 volume=volume,
                 price_open=price,
                 symbol=symbol,
@@ -499,32 +717,25 @@ class MockMT5:
             )
             
             self.positions[ticket] = position
+            self._add_position_row(position)
+            self._account_cache = None
             
-            # Create deal
-            deal = MockDeal(
-                ticket=self.next_ticket,
-                order=ticket,
-                time=current_time,
-                time_msc=current_time * 1000,
-                position_id=ticket,
-                volume=volume,
-                price=price,
-                symbol=symbol
-            )
-            self.next_ticket += 1
-            self.deals.append(deal)
+            # Record deal
+            deal_ticket = next(self._tickets)
+            self._add_deal_row((deal_ticket, ticket, current_time, current_time_msc, ticket,
+                                volume, price, self._symbol_row(symbol)))
             
             return MockTradeResult(
-                retcode=self.TRADE_RETCODE_DONE,
+                retcode=_TRADE_RETCODE_DONE,
                 order=ticket,
-                deal=deal.ticket,
+                deal=deal_ticket,
                 volume=volume,
                 price=price,
-                bid=tick.bid,
-                ask=tick.ask
+                bid=bid,
+                ask=ask
             )
         
-        elif action == self.TRADE_ACTION_SLTP:
+        elif action == _TRADE_ACTION_SLTP:
             # Modify position TP/SL
             position_ticket = request.get('position')
             if position_ticket and position_ticket in self.positions:
@@ -534,9 +745,9 @@ class MockMT5:
                 
                 self.positions[position_ticket] = position._replace(sl=new_sl, tp=new_tp)
                 
-                return MockTradeResult(retcode=self.TRADE_RETCODE_DONE)
+                return MockTradeResult(retcode=_TRADE_RETCODE_DONE)
         
-        return MockTradeResult(retcode=self.TRADE_RETCODE_ERROR)
+        return MockTradeResult(retcode=_TRADE_RETCODE_ERROR)
     
     def positions_total(self) -> int:
         """Mock total positions count."""
@@ -547,34 +758,88 @@ class MockMT5:
         if not self.connected:
             return None
         
-        positions = list(self.positions.values())
-        
+        # Ticket and symbol filters are index lookups, not scans
         if ticket is not None:
-            positions = [pos for pos in positions if pos.ticket == ticket]
+            row = self._pos_rows.get(ticket)
+            rows = np.arange(row, row + 1) if row is not None else np.arange(0)
         elif symbol is not None:
-            positions = [pos for pos in positions if pos.symbol == symbol]
+            rows = np.array(self._pos_by_symbol.get(symbol, ()), dtype=np.intp)
+        else:
+            rows = np.arange(self._pos_count)
+        
+        if not rows.size:
+            return []
         
-        # Update position profits
-        updated_positions = []
-        for pos in positions:
-            tick = self.symbol_info_tick(pos.symbol)
+        # One tick per distinct symbol, then price every selected position at once
+        arrays = self._pos_arrays
+        symbols = arrays['symbol'][rows]
+        bid = np.full(len(self._symbol_names), np.nan)
+        ask = np.full(len(self._symbol_names), np.nan)
+        pip_factor = np.full(len(self._symbol_names), np.nan)
+        for index in np.unique(symbols).tolist():
+            name = self._symbol_names[index]
+            tick = self.symbol_info_tick(name)
             if tick:
-                # Calculate profit
-                current_price = tick.bid if pos.type == self.POSITION_TYPE_BUY else tick.ask
-                price_diff = current_price - pos.price_open if pos.type == self.POSITION_TYPE_BUY else pos.price_open - current_price
-                
-                symbol_info = self.symbols.get(pos.symbol)
-                if symbol_info:
-                    profit = price_diff * pos.volume * symbol_info.trade_contract_size / symbol_info.point
-                    updated_pos = pos._replace(price_current=current_price, profit=profit)
-                    self.positions[pos.ticket] = updated_pos
-                    updated_positions.append(updated_pos)
-                else:
-                    updated_positions.append(pos)
-            else:
-                updated_positions.append(pos)
-        
-        return updated_positions
+                bid[index], ask[index] = tick.bid, tick.ask
+                pip_factor[index] = self._pip_factor_for(name)
+        
+        is_buy = arrays['type'][rows] == _POSITION_TYPE_BUY
+        price_open = arrays['price_open'][rows]
+        current_price = np.where(is_buy, bid[symbols], ask[symbols])
+        price_diff = np.where(is_buy, current_price - price_open, price_open - current_price)
+        profit = price_diff * arrays['volume'][rows] * pip_factor[symbols]
+        
+        # Keep the last price/profit for positions whose symbol has no tick (NaN)
+        priced = ~np.isnan(profit)
+        arrays['price_current'][rows[priced]] = current_price[priced]
+        arrays['profit'][rows[priced]] = profit[priced]
+        self._account_cache = None
+        
+        # Stored positions stay as opened; callers get repriced snapshots
+        positions = self.positions
+        return [
+            positions[pos_ticket]._replace(price_current=price, profit=pos_profit)
+            for pos_ticket, price, pos_profit in zip(arrays['ticket'][rows].tolist(),
+                                                     arrays['price_current'][rows].tolist(),
+                                                     arrays['profit'][rows].tolist())
+        ]
+    
+    def _symbol_row(self, name: str) -> int:
+        """Index of a symbol in the position arrays, registering it on first use."""
+        index = self._symbol_index.get(name)
+        if index is None:
+            index = self._symbol_index[name] = len(self._symbol_names)
+            self._symbol_names.append(name)
+        return index
+    
+    def _pip_factor_for(self, name: str) -> float:
+        """Cached contract_size / point for a symbol (NaN if it is no longer listed)."""
+        pip_factor = self._pip_factor.get(name)
+        if pip_factor is None:
+            symbol_info = self.symbols.get(name)
+            if symbol_info is None:
+                return float('nan')
+            pip_factor = self._pip_factor[name] = symbol_info.trade_contract_size / symbol_info.point
+        return pip_factor
+    
+    def _add_position_row(self, position: MockPosition) -> None:
+        """Append a position's numeric fields to the arrays, doubling capacity when full."""
+        row = self._pos_count
+        if row == len(self._pos_arrays['ticket']):
+            for name, column in self._pos_arrays.items():
+                self._pos_arrays[name] = np.resize(column, 2 * len(column))
+        
+        arrays = self._pos_arrays
+        arrays['ticket'][row] = position.ticket
+        arrays['symbol'][row] = self._symbol_row(position.symbol)
+        arrays['type'][row] = position.type
+        arrays['volume'][row] = position.volume
+        arrays['price_open'][row] = position.price_open
+        arrays['price_current'][row] = position.price_current
+        arrays['profit'][row] = position.profit
+        self._pos_rows[position.ticket] = row
+        self._pos_by_symbol.setdefault(position.symbol, []).append(row)
+        self._pos_count = row + 1
     
     def history_deals_get(self, date_from: datetime.datetime, date_to: datetime.datetime,
                          group: str = "*") -> Optional[List[MockDeal]]:
@@ -586,13 +851,39 @@ class MockMT5:
         from_timestamp = date_from.timestamp() if date_from else 0
         to_timestamp = date_to.timestamp() if date_to else time.time()
         
-        filtered_deals = []
-        for deal in self.deals:
-            if from_timestamp <= deal.time <= to_timestamp:
-                if group == "*" or group.upper() in deal.symbol.upper():
-                    filtered_deals.append(deal)
+        times = self._deals_arr['time'][:self._deal_count]
+        lo = int(np.searchsorted(times, from_timestamp, side='left'))
+        hi = int(np.searchsorted(times, to_timestamp, side='right'))
+        rows = self._deals_arr[lo:hi]
+        
+        if group != "*":
+            # Match the pattern once per distinct symbol name (already canonical uppercase)
+            pattern = group.upper()
+            matching = [index for index, name in enumerate(self._symbol_names) if pattern in name]
+            rows = rows[np.isin(rows['symbol'], matching)]
         
-        return filtered_deals
+        return self._materialize_deals(rows)
+    
+    @property
+    def deals(self) -> List[MockDeal]:
+        """All recorded deals, oldest first."""
+        return self._materialize_deals(self._deals_arr[:self._deal_count])
+    
+    def _add_deal_row(self, row: tuple) -> None:
+        """Append a deal record, doubling capacity when full."""
+        if self._deal_count == len(self._deals_arr):
+            self._deals_arr = np.resize(self._deals_arr, 2 * len(self._deals_arr))
+        self._deals_arr[self._deal_count] = row
+        self._deal_count += 1
+    
+    def _materialize_deals(self, rows: np.ndarray) -> List[MockDeal]:
+        """Build MockDeal objects for the selected deal records."""
+        names = self._symbol_names
+        return [
+            MockDeal(ticket=ticket, order=order, time=deal_time, time_msc=time_msc,
+                     position_id=position_id, volume=volume, price=price, symbol=names[symbol])
+            for ticket, order, deal_time, time_msc, position_id, volume, price, symbol in rows.tolist()
+        ]
     
     def last_error(self) -> int:
         """Mock last error."""
@@ -603,36 +894,43 @@ class MockMT5:
         if not self.connected:
             return None
         
-        # Generate mock OHLCV data
-        rates = []
-        current_time = int(date_from.timestamp())
+        symbol_info = self._lookup_symbol(symbol)
+        if not symbol_info:
+            return None
         
-        symbol_info = self.symbols.get(symbol.upper())
+        return self._generate_rates(symbol_info, int(date_from.timestamp()), 60 * timeframe, count)
+    
+    def copy_rates_from_pos(self, symbol: str, timeframe: int, start_pos: int, count: int):
+        """Mock rates data ending start_pos bars before the current bar."""
+        if not self.connected:
+            return None
+        
+        symbol_info = self._lookup_symbol(symbol)
         if not symbol_info:
             return None
         
-        base_price = symbol_info.bid
+        step = 60 * timeframe
+        last_bar = time.time_ns() // 1_000_000_000 // step * step - start_pos * step
+        return self._generate_rates(symbol_info, last_bar - (count - 1) * step, step, count)
+    
+    def _generate_rates(self, symbol_info: MockSymbolInfo, start: int, step: int, count: int) -> np.ndarray:
+        """Build count chained OHLCV bars from start in MT5's rates dtype."""
+        # Generate mock OHLCV data in one pass: each bar opens near the previous close
+        rng = self._rng
+        open_moves = rng.uniform(-0.001, 0.001, count)
+        close_moves = rng.uniform(-0.0015, 0.0015, count)
+        close = symbol_info.bid + np.cumsum(open_moves + close_moves)
+        open_ = close - close_moves
         
-        for i in range(count):
-            # Generate realistic OHLCV data
-            open_price = base_price + random.uniform(-0.001, 0.001)
-            high_price = open_price + random.uniform(0, 0.002)
-            low_price = open_price - random.uniform(0, 0.002)
-            close_price = open_price + random.uniform(-0.0015, 0.0015)
-            
-            rates.append({
-                'time': current_time,
-                'open': open_price,
-                'high': high_price,
-                'low': low_price,
-                'close': close_price,
-                'tick_volume': random.randint(100, 1000),
-                'spread': random.randint(10, 30),
-                'real_volume': 0
-            })
-            
-            current_time += 60 * timeframe  # Add minutes based on timeframe
-            base_price = close_price  # Use previous close as base for next candle
+        rates = np.empty(count, dtype=RATES_DTYPE)
+        rates['time'] = start + np.arange(count) * step
+        rates['open'] = open_
+        rates['high'] = open_ + rng.uniform(0, 0.002, count)
+        rates['low'] = open_ - rng.uniform(0, 0.002, count)
+        rates['close'] = close
+        rates['tick_volume'] = rng.integers(100, 1001, count)
+        rates['spread'] = rng.integers(10, 31, count)
+        rates['real_volume'] = 0
         
         return rates
 
@@ -647,6 +945,9 @@ def initialize(*args, **kwargs):
 def shutdown():
     return mock_mt5.shutdown()
 
+def set_latency(init=None, order=None):
+    return mock_mt5.set_latency(init, order)
+
 def version():
     return mock_mt5.version()
 
@@ -689,71 +990,20 @@ def last_error():
 def copy_rates_from(symbol, timeframe, date_from, count):
     return mock_mt5.copy_rates_from(symbol, timeframe, date_from, count)
 
-# Constants
-TRADE_RETCODE_DONE = mock_mt5.TRADE_RETCODE_DONE
-TRADE_RETCODE_ERROR = mock_mt5.TRADE_RETCODE_ERROR
-TRADE_RETCODE_TIMEOUT = mock_mt5.TRADE_RETCODE_TIMEOUT
-TRADE_RETCODE_INVALID = mock_mt5.TRADE_RETCODE_INVALID
-TRADE_RETCODE_INVALID_VOLUME = mock_mt5.TRADE_RETCODE_INVALID_VOLUME
-TRADE_RETCODE_INVALID_PRICE = mock_mt5.TRADE_RETCODE_INVALID_PRICE
-TRADE_RETCODE_INVALID_STOPS = mock_mt5.TRADE_RETCODE_INVALID_STOPS
-TRADE_RETCODE_TRADE_DISABLED = mock_mt5.TRADE_RETCODE_TRADE_DISABLED
-TRADE_RETCODE_MARKET_CLOSED = mock_mt5.TRADE_RETCODE_MARKET_CLOSED
-TRADE_RETCODE_NO_MONEY = mock_mt5.TRADE_RETCODE_NO_MONEY
-TRADE_RETCODE_PRICE_CHANGED = mock_mt5.TRADE_RETCODE_PRICE_CHANGED
-TRADE_RETCODE_PRICE_OFF = mock_mt5.TRADE_RETCODE_PRICE_OFF
-TRADE_RETCODE_INVALID_EXPIRATION = mock_mt5.TRADE_RETCODE_INVALID_EXPIRATION
-TRADE_RETCODE_ORDER_CHANGED = mock_mt5.TRADE_RETCODE_ORDER_CHANGED
-TRADE_RETCODE_TOO_MANY_REQUESTS = mock_mt5.TRADE_RETCODE_TOO_MANY_REQUESTS
-TRADE_RETCODE_NO_CHANGES = mock_mt5.TRADE_RETCODE_NO_CHANGES
-TRADE_RETCODE_SERVER_DISABLES_AT = mock_mt5.TRADE_RETCODE_SERVER_DISABLES_AT
-TRADE_RETCODE_CLIENT_DISABLES_AT = mock_mt5.TRADE_RETCODE_CLIENT_DISABLES_AT
-TRADE_RETCODE_LOCKED = mock_mt5.TRADE_RETCODE_LOCKED
-TRADE_RETCODE_FROZEN = mock_mt5.TRADE_RETCODE_FROZEN
-TRADE_RETCODE_INVALID_FILL = mock_mt5.TRADE_RETCODE_INVALID_FILL
-TRADE_RETCODE_CONNECTION = mock_mt5.TRADE_RETCODE_CONNECTION
-TRADE_RETCODE_ONLY_REAL = mock_mt5.TRADE_RETCODE_ONLY_REAL
-TRADE_RETCODE_LIMIT_ORDERS = mock_mt5.TRADE_RETCODE_LIMIT_ORDERS
-TRADE_RETCODE_LIMIT_VOLUME = mock_mt5.TRADE_RETCODE_LIMIT_VOLUME
-TRADE_RETCODE_INVALID_ORDER = mock_mt5.TRADE_RETCODE_INVALID_ORDER
-TRADE_RETCODE_POSITION_CLOSED = mock_mt5.TRADE_RETCODE_POSITION_CLOSED
-TRADE_RETCODE_INVALID_CLOSE_VOLUME = mock_mt5.TRADE_RETCODE_INVALID_CLOSE_VOLUME
-TRADE_RETCODE_CLOSE_ORDER_EXIST = mock_mt5.TRADE_RETCODE_CLOSE_ORDER_EXIST
-TRADE_RETCODE_LIMIT_POSITIONS = mock_mt5.TRADE_RETCODE_LIMIT_POSITIONS
-TRADE_RETCODE_REJECT_CANCEL = mock_mt5.TRADE_RETCODE_REJECT_CANCEL
-TRADE_RETCODE_LONG_ONLY = mock_mt5.TRADE_RETCODE_LONG_ONLY
-TRADE_RETCODE_SHORT_ONLY = mock_mt5.TRADE_RETCODE_SHORT_ONLY
-TRADE_RETCODE_CLOSE_ONLY = mock_mt5.TRADE_RETCODE_CLOSE_ONLY
-TRADE_RETCODE_FIFO_CLOSE = mock_mt5.TRADE_RETCODE_FIFO_CLOSE
-
-ORDER_TYPE_BUY = mock_mt5.ORDER_TYPE_BUY
-ORDER_TYPE_SELL = mock_mt5.ORDER_TYPE_SELL
-ORDER_TYPE_BUY_LIMIT = mock_mt5.ORDER_TYPE_BUY_LIMIT
-ORDER_TYPE_SELL_LIMIT = mock_mt5.ORDER_TYPE_SELL_LIMIT
-ORDER_TYPE_BUY_STOP = mock_mt5.ORDER_TYPE_BUY_STOP
-ORDER_TYPE_SELL_STOP = mock_mt5.ORDER_TYPE_SELL_STOP
-ORDER_TYPE_BUY_STOP_LIMIT = mock_mt5.ORDER_TYPE_BUY_STOP_LIMIT
-ORDER_TYPE_SELL_STOP_LIMIT = mock_mt5.ORDER_TYPE_SELL_STOP_LIMIT
-ORDER_TYPE_CLOSE_BY = mock_mt5.ORDER_TYPE_CLOSE_BY
-
-TRADE_ACTION_DEAL = mock_mt5.TRADE_ACTION_DEAL
-TRADE_ACTION_PENDING = mock_mt5.TRADE_ACTION_PENDING
-TRADE_ACTION_SLTP = mock_mt5.TRADE_ACTION_SLTP
-TRADE_ACTION_MODIFY = mock_mt5.TRADE_ACTION_MODIFY
-TRADE_ACTION_REMOVE = mock_mt5.TRADE_ACTION_REMOVE
-TRADE_ACTION_CLOSE_BY = mock_mt5.TRADE_ACTION_CLOSE_BY
-
-POSITION_TYPE_BUY = mock_mt5.POSITION_TYPE_BUY
-POSITION_TYPE_SELL = mock_mt5.POSITION_TYPE_SELL
-
-ORDER_TIME_GTC = mock_mt5.ORDER_TIME_GTC
-ORDER_TIME_DAY = mock_mt5.ORDER_TIME_DAY
-ORDER_TIME_SPECIFIED = mock_mt5.ORDER_TIME_SPECIFIED
-ORDER_TIME_SPECIFIED_DAY = mock_mt5.ORDER_TIME_SPECIFIED_DAY
-
-ORDER_FILLING_FOK = mock_mt5.ORDER_FILLING_FOK
-ORDER_FILLING_IOC = mock_mt5.ORDER_FILLING_IOC
-ORDER_FILLING_RETURN = mock_mt5.ORDER_FILLING_RETURN
+def copy_rates_from_pos(symbol, timeframe, start_pos, count):
+    return mock_mt5.copy_rates_from_pos(symbol, timeframe, start_pos, count)
+
+# Constants: MT5 enum values are resolved from MockMT5 on first access (PEP 562)
+def __getattr__(name):
+    if name.isupper():
+        value = getattr(MockMT5, name, None)
+        if value is not None:
+            globals()[name] = value  # Later lookups hit the module dict directly
+            return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(set(globals()) | {name for name in vars(MockMT5) if name.isupper()})
 
 # Timeframes
 TIMEFRAME_M1 = 1
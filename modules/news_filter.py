@@ -4,13 +4,46 @@ Filters high-impact news events to avoid trading during volatile periods.
 """
 
 import datetime
+import bisect
+from collections import defaultdict
 from typing import List, Dict, Any, Optional, Tuple
 import requests
 import time
+import random
 
 import os
+import numpy as np
 from config import *
 
+# Descriptive names for weekly events, keyed by (weekday, start hour)
+_WEEKLY_EVENT_NAMES = {
+    (2, 13): "FOMC Minutes Release",                     # Wednesday
+    (4, 12): "Non-Farm Payrolls & Major Economic Data",  # Friday
+}
+
+_EPOCH_DATE = datetime.date(1970, 1, 1)
+
+# Currencies whose pairs are treated as news-sensitive
+_MAJOR_CCYS = frozenset({"USD", "EUR", "GBP"})
+
+
+def _utc_timestamp(event_time: datetime.datetime) -> float:
+    """Unix timestamp of a UTC datetime; naive datetimes are taken as UTC."""
+    if event_time.tzinfo is None:
+        event_time = event_time.replace(tzinfo=datetime.timezone.utc)
+    return event_time.timestamp()
+
+
+def _utc_minute_parts(timestamp: float) -> Tuple[int, int, int]:
+    """
+    Split a Unix timestamp into UTC calendar fields without building a datetime.
+    
+    Returns:
+        Tuple of (epoch_minute, minute_of_day, weekday) with weekday 0=Monday
+    """
+    epoch_minute = int(timestamp) // 60
+    return epoch_minute, epoch_minute % 1440, (epoch_minute // 1440 + 3) % 7  # 1970-01-01 was a Thursday
+
 
 class NewsFilter:
     """Filters high-impact news events for trading decisions."""
@@ -19,10 +52,72 @@ class NewsFilter:
         """Initialize news filter."""
         self.logger = logger
         self.news_cache = {}
+        # Custom events as parallel arrays sorted by time: Unix seconds and (key, event)
+        self._custom_ts = np.empty(0, dtype=np.int64)
+        self._custom_events: List[Tuple[str, Dict[str, Any]]] = []
+        self.CUSTOM_EVENT_SWEEP_EVERY = 32  # add_custom_news_event clears expired events at this cache size multiple
         self.cache_duration = 3600  # Cache for 1 hour
         self.last_api_call = 0
         self.api_rate_limit = 60  # Minimum seconds between API calls
+        self.API_MAX_BACKOFF = 900  # Failures back off exponentially up to 15 minutes
+        self._api_backoff = self.api_rate_limit
+        self._api_next_call = 0.0
+        
+        # Session "HH:MM" bounds parsed once
+        self._session_hours = {name: self._parse_session_hours(config)
+                               for name, config in TRADING_SESSIONS.items()}
         
+        # Results memoized per UTC epoch minute; both roll over with the minute
+        self._news_flag_cache: Tuple[int, bool] = (-1, False)
+        self._last_news_log_minute = -1  # Epoch minute of the last news-window log line
+        self._upcoming_cache: Dict[int, Tuple[int, List[Dict[str, Any]]]] = {}
+        
+        # Scheduled events for the coming days, sorted by time (see _build_event_index)
+        self.EVENT_INDEX_DAYS = 8  # Today plus a full week ahead
+        self._event_times: List[datetime.datetime] = []
+        self._event_records: List[Dict[str, Any]] = []
+        self._event_index_day = -1  # First UTC epoch day covered
+        self._event_index_end_ts = 0.0  # Unix time the index runs up to
+        
+        # Scheduled events bucketed by epoch hour for short window queries
+        self._event_hour_buckets: Dict[int, List[Tuple[float, Dict[str, Any]]]] = defaultdict(list)
+        
+        # News windows as sorted, merged (start, end) minute-of-day bounds for bisect lookups
+        self._daily_starts, self._daily_ends = self._build_intervals(HIGH_IMPACT_NEWS_TIMES)
+        self._weekly_starts = {}
+        self._weekly_ends = {}
+        for day, times in WEEKLY_NEWS_TIMES.items():
+            self._weekly_starts[day], self._weekly_ends[day] = self._build_intervals(times)
+        self._active_weekdays = sum(1 << day for day, times in WEEKLY_NEWS_TIMES.items() if times)
+        
+        # Event start offsets from midnight (and weekly titles) for building the event index
+        self._daily_offsets = [datetime.timedelta(hours=start_h, minutes=start_m)
+                               for start_h, start_m, end_h, end_m in HIGH_IMPACT_NEWS_TIMES]
+        self._weekly_offsets = {
+            day: [(datetime.timedelta(hours=start_h, minutes=start_m), self._get_weekly_event_name(day, start_h))
+                  for start_h, start_m, end_h, end_m in times]
+            for day, times in WEEKLY_NEWS_TIMES.items()
+        }
+        
+    @staticmethod
+    def _build_intervals(times: List[Tuple[int, int, int, int]]) -> Tuple[List[int], List[int]]:
+        """Convert (start_h, start_m, end_h, end_m) windows to sorted, non-overlapping minute bounds."""
+        starts, ends = [], []
+        for start, end in sorted((start_h * 60 + start_m, end_h * 60 + end_m)
+                                 for start_h, start_m, end_h, end_m in times):
+            if ends and start <= ends[-1]:
+                ends[-1] = max(ends[-1], end)
+            else:
+                starts.append(start)
+                ends.append(end)
+        return starts, ends
+    
+    @staticmethod
+    def _in_intervals(starts: List[int], ends: List[int], minutes: int) -> bool:
+        """Check whether minutes falls in one of the merged windows."""
+        i = bisect.bisect_right(starts, minutes) - 1
+        return i >= 0 and minutes <= ends[i]
+    
     def is_high_impact_news_time(self) -> bool:
         """
         Check if current time is during high-impact news.
@@ -31,56 +126,51 @@ class NewsFilter:
             bool: True if high-impact news time
         """
         try:
-            utc_now = datetime.datetime.utcnow()
+            minute_key, current_time_minutes, day_of_week = _utc_minute_parts(time.time())
+            cached_minute, cached_flag = self._news_flag_cache
+            if minute_key == cached_minute:
+                return cached_flag
             
-            # Check time-based news schedule
-            if self._is_scheduled_news_time(utc_now):
-                return True
+            # Minute rollover: also drop expired custom events (a no-op search when none are due)
+            self.clear_expired_events()
             
-            # Check API-based news if available
-            if self._is_api_news_time(utc_now):
-                return True
+            # Check time-based news schedule, then API-based news if available
+            is_news_time = (self._is_scheduled_news_time(current_time_minutes, day_of_week)
+                            or self._is_api_news_time(datetime.datetime.utcnow()))
             
-            return False
+            self._news_flag_cache = (minute_key, is_news_time)
+            return is_news_time
             
         except Exception as e:
             self.logger.log(f"❌ Error checking news time: {str(e)}")
             return False  # Default to allow trading if check fails
     
-    def _is_scheduled_news_time(self, utc_time: datetime.datetime) -> bool:
+    def _is_scheduled_news_time(self, current_time_minutes: int, day_of_week: int) -> bool:
         """
         Check against pre-configured news schedule.
         
         Args:
-            utc_time: Current UTC time
+            current_time_minutes: Current UTC minute of the day
+            day_of_week: Current UTC weekday (0=Monday, 6=Sunday)
             
         Returns:
             bool: True if scheduled news time
         """
         try:
-            current_hour = utc_time.hour
-            current_minute = utc_time.minute
-            current_time_minutes = current_hour * 60 + current_minute
-            day_of_week = utc_time.weekday()  # 0=Monday, 6=Sunday
+            current_hour, current_minute = divmod(current_time_minutes, 60)
             
             # Check daily critical times
-            for start_h, start_m, end_h, end_m in HIGH_IMPACT_NEWS_TIMES:
-                start_minutes = start_h * 60 + start_m
-                end_minutes = end_h * 60 + end_m
-                
-                if start_minutes <= current_time_minutes <= end_minutes:
+            if self._in_intervals(self._daily_starts, self._daily_ends, current_time_minutes):
+                if self._should_log_news_minute():
                     self.logger.log(f"⚠️ High-impact news time detected: {current_hour:02d}:{current_minute:02d} UTC")
-                    return True
+                return True
             
             # Check weekly specific times
-            weekly_times = WEEKLY_NEWS_TIMES.get(day_of_week, [])
-            for start_h, start_m, end_h, end_m in weekly_times:
-                start_minutes = start_h * 60 + start_m
-                end_minutes = end_h * 60 + end_m
-                
-                if start_minutes <= current_time_minutes <= end_minutes:
+            weekly_starts = self._weekly_starts.get(day_of_week)
+            if weekly_starts and self._in_intervals(weekly_starts, self._weekly_ends[day_of_week], current_time_minutes):
+                if self._should_log_news_minute():
                     self.logger.log(f"⚠️ Weekly high-impact news time detected: {current_hour:02d}:{current_minute:02d} UTC")
-                    return True
+                return True
             
             return False
             
@@ -88,6 +178,14 @@ class NewsFilter:
             self.logger.log(f"❌ Error checking scheduled news: {str(e)}")
             return False
     
+    def _should_log_news_minute(self) -> bool:
+        """Allow one news-window log line per epoch minute."""
+        minute_key = int(time.time()) // 60
+        if minute_key == self._last_news_log_minute:
+            return False
+        self._last_news_log_minute = minute_key
+        return True
+    
     def _is_api_news_time(self, utc_time: datetime.datetime) -> bool:
         """
         Check high-impact news via API (if configured).
@@ -99,9 +197,9 @@ class NewsFilter:
             bool: True if API indicates news time
         """
         try:
-            # Rate limiting for API calls
+            # Rate limiting for API calls (backoff + jitter, see _schedule_next_api_call)
             current_time = time.time()
-            if current_time - self.last_api_call < self.api_rate_limit:
+            if current_time < self._api_next_call:
                 return False
             
             # Implement economic calendar API integration
@@ -129,6 +227,7 @@ class NewsFilter:
                 if response.status_code == 200:
                     news_data = response.json()
                     self.last_api_call = current_time
+                    self._schedule_next_api_call(current_time, True)
                     
                     # Check if any high-impact news is happening now
                     for event in news_data.get('events', []):
@@ -142,19 +241,36 @@ class NewsFilter:
                     return False
                 else:
                     self.logger.log(f"⚠️ News API request failed: {response.status_code}")
+                    self._schedule_next_api_call(current_time, False)
                     return False
                     
             except requests.exceptions.RequestException as e:
                 self.logger.log(f"⚠️ News API connection error: {str(e)}")
+                self._schedule_next_api_call(current_time, False)
                 return False
             except Exception as api_e:
                 self.logger.log(f"⚠️ News API processing error: {str(api_e)}")
+                self._schedule_next_api_call(current_time, False)
                 return False
             
         except Exception as e:
             self.logger.log(f"❌ Error checking API news: {str(e)}")
             return False
     
+    def _schedule_next_api_call(self, current_time: float, success: bool) -> None:
+        """
+        Set the earliest time for the next news API request.
+        
+        Success resets the interval to api_rate_limit; failures double it up to
+        API_MAX_BACKOFF. Up to 10% random jitter keeps several bot instances from
+        polling the endpoint in lockstep.
+        """
+        if success:
+            self._api_backoff = self.api_rate_limit
+        else:
+            self._api_backoff = min(self._api_backoff * 2, self.API_MAX_BACKOFF)
+        self._api_next_call = current_time + self._api_backoff + random.uniform(0, self._api_backoff * 0.1)
+    
     def get_upcoming_news_events(self, hours_ahead: int = 24) -> List[Dict[str, Any]]:
         """
         Get upcoming high-impact news events.
@@ -166,65 +282,118 @@ class NewsFilter:
             List of news event dictionaries
         """
         try:
-            events = []
-            utc_now = datetime.datetime.utcnow()
+            now_ts = time.time()
+            minute_key = int(now_ts) // 60
+            cached = self._upcoming_cache.get(hours_ahead)
+            if cached is not None and cached[0] == minute_key:
+                return list(cached[1])
             
-            # Generate schedule-based events for the next period
-            for day_offset in range(hours_ahead // 24 + 1):
-                check_date = utc_now + datetime.timedelta(days=day_offset)
-                
-                # Daily events
-                for start_h, start_m, end_h, end_m in HIGH_IMPACT_NEWS_TIMES:
-                    event_time = datetime.datetime(
-                        check_date.year, check_date.month, check_date.day,
-                        start_h, start_m, 0
-                    )
-                    
-                    if utc_now <= event_time <= utc_now + datetime.timedelta(hours=hours_ahead):
-                        events.append({
-                            'time': event_time,
-                            'title': 'High-Impact News Period',
-                            'impact': 'HIGH',
-                            'currency': 'Multiple',
-                            'type': 'Scheduled'
-                        })
-                
-                # Weekly events
-                day_of_week = check_date.weekday()
-                weekly_times = WEEKLY_NEWS_TIMES.get(day_of_week, [])
-                for start_h, start_m, end_h, end_m in weekly_times:
-                    event_time = datetime.datetime(
-                        check_date.year, check_date.month, check_date.day,
-                        start_h, start_m, 0
-                    )
-                    
-                    if utc_now <= event_time <= utc_now + datetime.timedelta(hours=hours_ahead):
-                        event_name = self._get_weekly_event_name(day_of_week, start_h)
-                        events.append({
-                            'time': event_time,
-                            'title': event_name,
-                            'impact': 'HIGH',
-                            'currency': 'USD',
-                            'type': 'Weekly'
-                        })
+            utc_now = datetime.datetime.fromtimestamp(now_ts, datetime.timezone.utc).replace(tzinfo=None)
+            horizon = utc_now + datetime.timedelta(hours=hours_ahead)
+            
+            # Schedule-based events come from the index, rebuilt once per UTC date
+            self._ensure_event_index(now_ts, hours_ahead)
             
-            # Sort by time
-            events.sort(key=lambda x: x['time'])
+            lo = bisect.bisect_left(self._event_times, utc_now)
+            hi = bisect.bisect_right(self._event_times, horizon)
+            events = self._event_records[lo:hi]
             
-            return events
+            self._upcoming_cache[hours_ahead] = (minute_key, events)
+            return list(events)
             
         except Exception as e:
             self.logger.log(f"❌ Error getting upcoming news: {str(e)}")
             return []
     
+    def _ensure_event_index(self, now_ts: float, hours_ahead: int) -> None:
+        """Rebuild the event index on UTC date rollover or when it ends before now + hours_ahead."""
+        day = int(now_ts) // 86400
+        if day != self._event_index_day or now_ts + hours_ahead * 3600 > self._event_index_end_ts:
+            self._build_event_index(_EPOCH_DATE + datetime.timedelta(days=day),
+                                    max(self.EVENT_INDEX_DAYS, hours_ahead // 24 + 2))
+    
+    def _build_event_index(self, start_date: datetime.date, days: int) -> None:
+        """
+        Materialize scheduled events from start_date for the given number of days.
+        
+        Args:
+            start_date: First UTC date covered
+            days: Number of days covered
+        """
+        events = []
+        first_midnight = datetime.datetime.combine(start_date, datetime.time())
+        for day_offset in range(days):
+            midnight = first_midnight + datetime.timedelta(days=day_offset)
+            
+            # Daily events
+            for offset in self._daily_offsets:
+                events.append({
+                    'time': midnight + offset,
+                    'title': 'High-Impact News Period',
+                    'impact': 'HIGH',
+                    'currency': 'Multiple',
+                    'type': 'Scheduled'
+                })
+            
+            # Weekly events (most weekdays have none)
+            day_of_week = midnight.weekday()
+            if not (self._active_weekdays >> day_of_week) & 1:
+                continue
+            for offset, title in self._weekly_offsets[day_of_week]:
+                events.append({
+                    'time': midnight + offset,
+                    'title': title,
+                    'impact': 'HIGH',
+                    'currency': 'USD',
+                    'type': 'Weekly'
+                })
+        
+        # Sort by time
+        events.sort(key=lambda x: x['time'])
+        
+        self._event_records = events
+        self._event_times = [event['time'] for event in events]
+        self._event_index_day = (start_date - _EPOCH_DATE).days
+        self._event_index_end_ts = (self._event_index_day + days) * 86400.0
+        
+        # Bucket the new schedule by epoch hour
+        buckets = self._event_hour_buckets = defaultdict(list)
+        for event in events:
+            ts = _utc_timestamp(event['time'])
+            buckets[int(ts // 3600)].append((ts, event))
+    
+    def _events_in_window(self, start_ts: float, end_ts: float) -> List[Dict[str, Any]]:
+        """
+        Events with start_ts <= time <= end_ts.
+        
+        Scheduled events come from the covering hour buckets only; custom
+        events are sliced from their sorted timestamp array.
+        """
+        buckets = self._event_hour_buckets
+        events = []
+        for hour in range(int(start_ts // 3600), int(end_ts // 3600) + 1):
+            bucket = buckets.get(hour)
+            if bucket:
+                events.extend(event for ts, event in bucket if start_ts <= ts <= end_ts)
+        
+        lo = int(np.searchsorted(self._custom_ts, start_ts, side='left'))
+        hi = int(np.searchsorted(self._custom_ts, end_ts, side='right'))
+        events.extend(event for key, event in self._custom_events[lo:hi])
+        return events
+    
+    def _remove_custom_event(self, event: Dict[str, Any]) -> None:
+        """Drop a custom event from the sorted arrays."""
+        ts = int(_utc_timestamp(event['time']))
+        lo, hi = np.searchsorted(self._custom_ts, [ts, ts + 1])
+        for i in range(lo, hi):
+            if self._custom_events[i][1] is event:
+                self._custom_ts = np.delete(self._custom_ts, i)
+                del self._custom_events[i]
+                return
+    
     def _get_weekly_event_name(self, day_of_week: int, hour: int) -> str:
         """Get descriptive name for weekly events."""
-        if day_of_week == 2 and hour == 13:  # Wednesday
-            return "FOMC Minutes Release"
-        elif day_of_week == 4 and hour == 12:  # Friday
-            return "Non-Farm Payrolls & Major Economic Data"
-        else:
-            return "Weekly High-Impact Event"
+        return _WEEKLY_EVENT_NAMES.get((day_of_week, hour), "Weekly High-Impact Event")
     
     def should_avoid_trading(self, symbol: str = None, strategy: str = None) -> Tuple[bool, str]:
         """
@@ -242,18 +411,22 @@ class NewsFilter:
             if self.is_high_impact_news_time():
                 return True, "High-impact news period"
             
+            now_ts = time.time()
+            self._ensure_event_index(now_ts, 2)
+            
             # Strategy-specific checks
             if strategy == "HFT":
                 # HFT is more sensitive to news
-                upcoming_events = self.get_upcoming_news_events(hours_ahead=2)
+                upcoming_events = self._events_in_window(now_ts, now_ts + 2 * 3600)
                 if upcoming_events:
                     return True, "Upcoming high-impact news (HFT sensitivity)"
             
             # Symbol-specific checks
             if symbol:
-                if any(currency in symbol.upper() for currency in ["USD", "EUR", "GBP"]):
+                pair = symbol.upper()
+                if pair[:3] in _MAJOR_CCYS or pair[3:6] in _MAJOR_CCYS:
                     # Major currencies are more affected by news
-                    upcoming_events = self.get_upcoming_news_events(hours_ahead=1)
+                    upcoming_events = self._events_in_window(now_ts, now_ts + 3600)
                     major_events = [e for e in upcoming_events if e['impact'] == 'HIGH']
                     if major_events:
                         return True, f"Upcoming major currency news in 1 hour"
@@ -272,14 +445,17 @@ class NewsFilter:
             Dict with news filter status
         """
         try:
-            utc_now = datetime.datetime.utcnow()
+            now_ts = time.time()
+            utc_now = datetime.datetime.fromtimestamp(now_ts, datetime.timezone.utc).replace(tzinfo=None)
             
-            # Current status
+            # Current status (memoized per minute)
             is_news_time = self.is_high_impact_news_time()
             
-            # Upcoming events
-            upcoming_events = self.get_upcoming_news_events(hours_ahead=24)
-            next_event = upcoming_events[0] if upcoming_events else None
+            # Upcoming events: count and next event straight from the event index
+            self._ensure_event_index(now_ts, 24)
+            lo = bisect.bisect_left(self._event_times, utc_now)
+            hi = bisect.bisect_right(self._event_times, utc_now + datetime.timedelta(hours=24))
+            next_event = self._event_records[lo] if lo < hi else None
             
             # Time until next event
             time_to_next = None
@@ -291,7 +467,7 @@ class NewsFilter:
             return {
                 'current_time_utc': utc_now.strftime('%Y-%m-%d %H:%M:%S'),
                 'is_news_time': is_news_time,
-                'upcoming_events_24h': len(upcoming_events),
+                'upcoming_events_24h': hi - lo,
                 'next_event': next_event,
                 'time_to_next_event': time_to_next,
                 'cache_size': len(self.news_cache)
@@ -318,7 +494,11 @@ class NewsFilter:
         try:
             event_key = f"custom_{int(event_time.timestamp())}"
             
-            self.news_cache[event_key] = {
+            replaced = self.news_cache.get(event_key)
+            if replaced is not None:
+                self._remove_custom_event(replaced)
+            
+            event = self.news_cache[event_key] = {
                 'time': event_time,
                 'title': title,
                 'impact': impact,
@@ -326,6 +506,14 @@ class NewsFilter:
                 'type': 'Custom',
                 'added_at': datetime.datetime.utcnow()
             }
+            ts = int(_utc_timestamp(event_time))
+            i = int(np.searchsorted(self._custom_ts, ts, side='right'))
+            self._custom_ts = np.insert(self._custom_ts, i, ts)
+            self._custom_events.insert(i, (event_key, event))
+            
+            # Bound the cache even if nothing is polling the news flag
+            if len(self.news_cache) % self.CUSTOM_EVENT_SWEEP_EVERY == 0:
+                self.clear_expired_events()
             
             self.logger.log(f"📰 Custom news event added: {title} at {event_time}")
             return True
@@ -337,18 +525,15 @@ class NewsFilter:
     def clear_expired_events(self) -> None:
         """Clear expired news events from cache."""
         try:
-            current_time = datetime.datetime.utcnow()
-            expired_keys = []
-            
-            for key, event in self.news_cache.items():
-                if 'time' in event and event['time'] < current_time:
-                    expired_keys.append(key)
-            
-            for key in expired_keys:
-                del self.news_cache[key]
-            
-            if expired_keys:
-                self.logger.log(f"🧹 Cleared {len(expired_keys)} expired news events")
+            # Events are sorted by time, so the expired ones are a prefix
+            cut = int(np.searchsorted(self._custom_ts, time.time(), side='left'))
+            for key, event in self._custom_events[:cut]:
+                self.news_cache.pop(key, None)
+            self._custom_ts = self._custom_ts[cut:]
+            del self._custom_events[:cut]
+            
+            if cut:
+                self.logger.log(f"🧹 Cleared {cut} expired news events")
                 
         except Exception as e:
             self.logger.log(f"❌ Error clearing expired events: {str(e)}")
@@ -361,15 +546,13 @@ class NewsFilter:
             Dict with market hours information
         """
         try:
-            utc_now = datetime.datetime.utcnow()
-            current_hour = utc_now.hour
-            current_minute = utc_now.minute
-            current_time_minutes = current_hour * 60 + current_minute
+            _, current_time_minutes, _ = _utc_minute_parts(time.time())
             
             sessions_status = {}
             
             for session_name, session_config in TRADING_SESSIONS.items():
-                is_active = self._is_time_in_session_hours(current_time_minutes, session_config)
+                is_active = self._is_time_in_session_hours(current_time_minutes,
+                                                           self._session_hours.get(session_name))
                 sessions_status[session_name] = {
                     'active': is_active,
                     'start': session_config['start'],
@@ -378,7 +561,7 @@ class NewsFilter:
                 }
             
             return {
-                'current_time_utc': utc_now.strftime('%H:%M'),
+                'current_time_utc': f"{current_time_minutes // 60:02d}:{current_time_minutes % 60:02d}",
                 'sessions': sessions_status
             }
             
@@ -386,22 +569,28 @@ class NewsFilter:
             self.logger.log(f"❌ Error getting market hours: {str(e)}")
             return {}
     
-    def _is_time_in_session_hours(self, current_time_minutes: int, session_config: Dict[str, Any]) -> bool:
-        """Check if time is within session hours."""
+    @staticmethod
+    def _parse_session_hours(session_config: Dict[str, Any]) -> Optional[Tuple[int, int, bool]]:
+        """Parse a session's "HH:MM" bounds into (start_minutes, end_minutes, wraps_midnight)."""
         try:
-            start_time = session_config["start"]
-            end_time = session_config["end"]
-            
-            start_hour, start_minute = map(int, start_time.split(":"))
-            end_hour, end_minute = map(int, end_time.split(":"))
+            start_hour, start_minute = map(int, session_config["start"].split(":"))
+            end_hour, end_minute = map(int, session_config["end"].split(":"))
             
             start_minutes = start_hour * 60 + start_minute
             end_minutes = end_hour * 60 + end_minute
+            return start_minutes, end_minutes, start_minutes > end_minutes
             
-            if start_minutes > end_minutes:
-                return current_time_minutes >= start_minutes or current_time_minutes <= end_minutes
-            else:
-                return start_minutes <= current_time_minutes <= end_minutes
-                
         except Exception as e:
+            return None
+    
+    def _is_time_in_session_hours(self, current_time_minutes: int,
+                                  session_hours: Optional[Tuple[int, int, bool]]) -> bool:
+        """Check if time is within pre-parsed session hours."""
+        if session_hours is None:
             return False
+        
+        start_minutes, end_minutes, wraps = session_hours
+        if wraps:
+            return current_time_minutes >= start_minutes or current_time_minutes <= end_minutes
+        else:
+            return start_minutes <= current_time_minutes <= end_minutes
@@ -4,12 +4,50 @@ Handles order execution, modification, and position management.
 """
 
 import time
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 import threading
+import concurrent.futures
+from collections import defaultdict
+from types import MappingProxyType
 
 from config import *
 
 
+# Human-readable descriptions for MT5 trade server return codes
+RETCODE_DESCRIPTIONS = MappingProxyType({
+    10004: "Requote",
+    10006: "Request rejected",
+    10007: "Request canceled by trader",
+    10008: "Order placed",
+    10009: "Request completed",
+    10010: "Only part of the request was completed",
+    10011: "Request processing error",
+    10012: "Request canceled by timeout",
+    10013: "Invalid request",
+    10014: "Invalid volume in the request",
+    10015: "Invalid price in the request",
+    10016: "Invalid stops in the request",
+    10017: "Trade is disabled",
+    10018: "Market is closed",
+    10019: "There is not enough money to complete the request",
+    10020: "Prices changed",
+    10021: "There are no quotes to process the request",
+    10022: "Invalid order expiration date in the request",
+    10023: "Order state changed",
+    10024: "Too frequent requests",
+    10025: "No changes in request",
+    10026: "Autotrading disabled by server",
+    10027: "Autotrading disabled by client terminal",
+    10028: "Request locked for processing",
+    10029: "Order or position frozen",
+    10030: "Invalid order filling type",
+    10031: "No connection with the trade server"
+})
+
+# Retcode the trade server answers with when requests arrive too quickly
+RETCODE_TOO_MANY_REQUESTS = 10024
+
+
 class OrderManager:
     """Manages order execution and position operations."""
     
@@ -21,9 +59,48 @@ class OrderManager:
         self.risk_manager = risk_manager
         self.account_manager = account_manager
         
+        # order_lock only guards the per-symbol tables; each symbol's lock is
+        # held through order_send so unrelated symbols no longer serialize
         self.order_lock = threading.Lock()
-        self.last_order_time = {}
-        self.rate_limit_window = 3  # seconds
+        self._symbol_locks = defaultdict(threading.Lock)
+        self._buckets: Dict[str, Tuple[float, float]] = {}  # symbol -> (tokens, last refill)
+        self.rate_limit_window = 3  # seconds per token, bucket holds one
+        
+        # Orders between the position-count check and order_send completing;
+        # counted against MAX_POSITIONS so concurrent symbols can't overshoot it
+        self._positions_lock = threading.Lock()
+        self._pending_opens = 0
+        
+        # MT5 constants resolved once; requests are built from copied templates
+        self._TRADE_ACTION_DEAL = mt5_instance.TRADE_ACTION_DEAL
+        self._TRADE_ACTION_SLTP = mt5_instance.TRADE_ACTION_SLTP
+        self._ORDER_TIME_GTC = mt5_instance.ORDER_TIME_GTC
+        self._ORDER_FILLING_IOC = mt5_instance.ORDER_FILLING_IOC
+        self._order_template = {
+            "action": self._TRADE_ACTION_DEAL,
+            "deviation": DEFAULT_DEVIATION,
+            "magic": DEFAULT_MAGIC_NUMBER,
+            "comment": "AutoBotCuan",
+            "type_time": self._ORDER_TIME_GTC,
+            "type_filling": self._ORDER_FILLING_IOC,
+        }
+        self._close_template = dict(self._order_template, comment="Close position")
+        self._modify_template = {"action": self._TRADE_ACTION_SLTP}
+        
+        # Bulk closes fan out over a small pool, created on first use and
+        # again after shutdown() so a stopped bot can still close positions.
+        # Closes are unpaced until the server answers "Too frequent requests";
+        # each such answer doubles the spacing between close sends and each
+        # successful close halves it
+        self.CLOSE_POOL_WORKERS = 8
+        self._close_pool = None
+        self._close_pool_lock = threading.Lock()
+        self.CLOSE_MAX_RETRIES = 3
+        self.CLOSE_PACING_MIN = 0.1  # seconds
+        self.CLOSE_PACING_MAX = 2.0  # seconds
+        self.close_pacing_interval = 0.0  # seconds, 0 = unpaced
+        self._close_pacing_lock = threading.Lock()
+        self._next_close_slot = 0.0
         
     def open_order(self, symbol: str, lot_size: float, action: str, 
                    sl_input: str = "", tp_input: str = "", 
@@ -44,19 +121,22 @@ class OrderManager:
             bool: True if order executed successfully
         """
         with self.order_lock:
+            symbol_lock = self._symbol_locks[symbol]
+        
+        with symbol_lock:
+            reserved = False
             try:
                 # Rate limiting
-                current_time = time.time()
-                last_trade_time = self.last_order_time.get(symbol, 0)
-                if current_time - last_trade_time < self.rate_limit_window:
+                current_time = time.monotonic()
+                tokens = self._available_tokens(symbol, current_time)
+                if tokens < 1.0:
                     self.logger.log(f"⚠️ Rate limit: Too soon to trade {symbol}")
                     return False
                 
-                # Validate position count
-                position_count = self.account_manager.get_position_count()
-                if position_count >= MAX_POSITIONS:
-                    self.logger.log(f"⚠️ Maximum positions reached: {position_count}")
+                # Validate position count and reserve a slot for this order
+                if not self._reserve_position_slot():
                     return False
+                reserved = True
                 
                 # Validate and activate symbol
                 if not self.symbol_manager.validate_and_activate_symbol(symbol):
@@ -103,7 +183,7 @@ class OrderManager:
                 result = self.mt5.order_send(request)
                 
                 if self._process_order_result(result, symbol, action):
-                    self.last_order_time[symbol] = current_time
+                    self._buckets[symbol] = (tokens - 1.0, current_time)
                     return True
                 else:
                     return False
@@ -111,6 +191,32 @@ class OrderManager:
             except Exception as e:
                 self.logger.log(f"❌ Error opening order for {symbol}: {str(e)}")
                 return False
+            finally:
+                if reserved:
+                    self._release_position_slot()
+    
+    def _reserve_position_slot(self) -> bool:
+        """Atomically check the position cap, counting in-flight orders, and take a slot."""
+        with self._positions_lock:
+            position_count = self.account_manager.get_position_count() + self._pending_opens
+            if position_count >= MAX_POSITIONS:
+                self.logger.log(f"⚠️ Maximum positions reached: {position_count}")
+                return False
+            self._pending_opens += 1
+            return True
+    
+    def _release_position_slot(self):
+        """Release a reserved slot once its order has been sent or abandoned."""
+        with self._positions_lock:
+            self._pending_opens -= 1
+    
+    def _available_tokens(self, symbol: str, now: float) -> float:
+        """Refill the symbol's token bucket up to one token and return its level."""
+        bucket = self._buckets.get(symbol)
+        if bucket is None:
+            return 1.0
+        tokens, last_ts = bucket
+        return min(1.0, tokens + (now - last_ts) / self.rate_limit_window)
     
     def _calculate_tp_sl_levels(self, symbol: str, lot_size: float, current_price: float, 
                                action: str, tp_input: str, sl_input: str, 
@@ -154,18 +260,11 @@ class OrderManager:
     def _create_order_request(self, symbol: str, lot_size: float, order_type: int, 
                              price: float, tp_price: float, sl_price: float) -> Dict[str, Any]:
         """Create MT5 order request dictionary."""
-        request = {
-            "action": self.mt5.TRADE_ACTION_DEAL,
-            "symbol": symbol,
-            "volume": lot_size,
-            "type": order_type,
-            "price": price,
-            "deviation": DEFAULT_DEVIATION,
-            "magic": DEFAULT_MAGIC_NUMBER,
-            "comment": "AutoBotCuan",
-            "type_time": self.mt5.ORDER_TIME_GTC,
-            "type_filling": self.mt5.ORDER_FILLING_IOC,
-        }
+        request = self._order_template.copy()
+        request["symbol"] = symbol
+        request["volume"] = lot_size
+        request["type"] = order_type
+        request["price"] = price
         
         # Add TP/SL if specified
         if tp_price > 0:
@@ -204,37 +303,7 @@ class OrderManager:
     
     def _get_retcode_description(self, retcode: int) -> str:
         """Get human-readable description for MT5 return codes."""
-        retcode_descriptions = {
-            10004: "Requote",
-            10006: "Request rejected",
-            10007: "Request canceled by trader", 
-            10008: "Order placed",
-            10009: "Request completed",
-            10010: "Only part of the request was completed",
-            10011: "Request processing error",
-            10012: "Request canceled by timeout",
-            10013: "Invalid request",
-            10014: "Invalid volume in the request",
-            10015: "Invalid price in the request",
-            10016: "Invalid stops in the request",
-            10017: "Trade is disabled",
-            10018: "Market is closed",
-            10019: "There is not enough money to complete the request",
-            10020: "Prices changed",
-            10021: "There are no quotes to process the request",
-            10022: "Invalid order expiration date in the request",
-            10023: "Order state changed",
-            10024: "Too frequent requests",
-            10025: "No changes in request",
-            10026: "Autotrading disabled by server",
-            10027: "Autotrading disabled by client terminal",
-            10028: "Request locked for processing",
-            10029: "Order or position frozen",
-            10030: "Invalid order filling type",
-            10031: "No connection with the trade server"
-        }
-        
-        return retcode_descriptions.get(retcode, f"Unknown error code: {retcode}")
+        return RETCODE_DESCRIPTIONS.get(retcode, f"Unknown error code: {retcode}")
     
     def close_position(self, ticket: int) -> bool:
         """
@@ -256,32 +325,29 @@ class OrderManager:
             position = positions[0]
             
             # Determine close order type
-            if position.type == self.mt5.POSITION_TYPE_BUY:
-                order_type = self.mt5.ORDER_TYPE_SELL
-                price = self.mt5.symbol_info_tick(position.symbol).bid
-            else:
-                order_type = self.mt5.ORDER_TYPE_BUY
-                price = self.mt5.symbol_info_tick(position.symbol).ask
+            close_buy = position.type == self.mt5.POSITION_TYPE_BUY
+            order_type = self.mt5.ORDER_TYPE_SELL if close_buy else self.mt5.ORDER_TYPE_BUY
             
             # Create close request
-            request = {
-                "action": self.mt5.TRADE_ACTION_DEAL,
-                "symbol": position.symbol,
-                "volume": position.volume,
-                "type": order_type,
-                "position": ticket,
-                "price": price,
-                "deviation": DEFAULT_DEVIATION,
-                "magic": position.magic,
-                "comment": "Close position",
-                "type_time": self.mt5.ORDER_TIME_GTC,
-                "type_filling": self.mt5.ORDER_FILLING_IOC,
-            }
+            request = self._close_template.copy()
+            request["symbol"] = position.symbol
+            request["volume"] = position.volume
+            request["type"] = order_type
+            request["position"] = ticket
+            request["magic"] = position.magic
             
-            # Send close request
-            result = self.mt5.order_send(request)
+            # Send close request, backing off while the server reports throttling
+            for _ in range(self.CLOSE_MAX_RETRIES + 1):
+                self._wait_close_slot()
+                tick = self.mt5.symbol_info_tick(position.symbol)
+                request["price"] = tick.bid if close_buy else tick.ask
+                result = self.mt5.order_send(request)
+                if result is None or result.retcode != RETCODE_TOO_MANY_REQUESTS:
+                    break
+                self._throttle_closes()
             
             if result and result.retcode == self.mt5.TRADE_RETCODE_DONE:
+                self._relax_closes()
                 self.logger.log(f"✅ Position {ticket} closed successfully")
                 return True
             else:
@@ -295,7 +361,7 @@ class OrderManager:
     
     def close_all_positions(self) -> bool:
         """
-        Close all open positions.
+        Close all open positions in parallel on the close pool.
         
         Returns:
             bool: True if all positions closed successfully
@@ -306,13 +372,11 @@ class OrderManager:
                 self.logger.log("ℹ️ No positions to close")
                 return True
             
-            success_count = 0
             total_positions = len(positions)
-            
-            for position in positions:
-                if self.close_position(position['ticket']):
-                    success_count += 1
-                time.sleep(0.1)  # Brief pause between closes
+            pool = self._get_close_pool()
+            futures = [pool.submit(self.close_position, position['ticket'])
+                       for position in positions]
+            success_count = sum(1 for future in futures if future.result())
             
             self.logger.log(f"📊 Closed {success_count}/{total_positions} positions")
             return success_count == total_positions
@@ -321,6 +385,48 @@ class OrderManager:
             self.logger.log(f"❌ Error closing all positions: {str(e)}")
             return False
     
+    def _wait_close_slot(self):
+        """Wait for the next close slot while closes are being paced."""
+        if self.close_pacing_interval <= 0:
+            return
+        with self._close_pacing_lock:
+            now = time.monotonic()
+            slot = max(now, self._next_close_slot)
+            self._next_close_slot = slot + self.close_pacing_interval
+        if slot > now:
+            time.sleep(slot - now)
+    
+    def _throttle_closes(self):
+        """Double the close spacing after a 'Too frequent requests' answer."""
+        with self._close_pacing_lock:
+            interval = min(self.CLOSE_PACING_MAX, max(self.CLOSE_PACING_MIN, self.close_pacing_interval * 2))
+            self.close_pacing_interval = interval
+            self._next_close_slot = max(self._next_close_slot, time.monotonic() + interval)
+        self.logger.log(f"⚠️ Server throttling closes, pacing at {interval*1000:.0f}ms")
+    
+    def _relax_closes(self):
+        """Halve the close spacing after a successful close, dropping it below the minimum."""
+        if self.close_pacing_interval <= 0:
+            return
+        with self._close_pacing_lock:
+            interval = self.close_pacing_interval / 2
+            self.close_pacing_interval = interval if interval >= self.CLOSE_PACING_MIN else 0.0
+    
+    def _get_close_pool(self) -> concurrent.futures.ThreadPoolExecutor:
+        """Return the close pool, creating it if it was never started or was shut down."""
+        with self._close_pool_lock:
+            if self._close_pool is None:
+                self._close_pool = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=self.CLOSE_POOL_WORKERS, thread_name_prefix="OrderClose")
+            return self._close_pool
+    
+    def shutdown(self):
+        """Stop the close pool once in-flight closes finish; the next bulk close starts a new one."""
+        with self._close_pool_lock:
+            pool, self._close_pool = self._close_pool, None
+        if pool is not None:
+            pool.shutdown(wait=True)
+    
     def modify_position(self, ticket: int, new_sl: float = 0, new_tp: float = 0) -> bool:
         """
         Modify position stop loss and/or take profit.
@@ -343,13 +449,11 @@ class OrderManager:
             position = positions[0]
             
             # Create modification request
-            request = {
-                "action": self.mt5.TRADE_ACTION_SLTP,
-                "symbol": position.symbol,
-                "position": ticket,
-                "sl": new_sl,
-                "tp": new_tp
-            }
+            request = self._modify_template.copy()
+            request["symbol"] = position.symbol
+            request["position"] = ticket
+            request["sl"] = new_sl
+            request["tp"] = new_tp
             
             # Send modification request
             result = self.mt5.order_send(request)
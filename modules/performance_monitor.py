@@ -11,6 +11,10 @@ from collections import deque, defaultdict
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
 import json
+import itertools
+import concurrent.futures
+
+from modules.utils import RunningWindow
 
 
 class PerformanceMonitor:
@@ -22,18 +26,28 @@ class PerformanceMonitor:
         self.start_time = time.time()
         self.process = psutil.Process(os.getpid())
         
-        # Performance metrics storage
-        self.execution_times = deque(maxlen=1000)  # Last 1000 executions
-        self.memory_usage = deque(maxlen=100)      # Last 100 memory checks
-        self.cpu_usage = deque(maxlen=100)         # Last 100 CPU checks
+        # Performance metrics storage; windows keep running sums so averages
+        # never re-sum them, and the lock keeps them consistent across threads
+        self._stats_lock = threading.Lock()
+        self.execution_times = RunningWindow(maxlen=1000)  # Last 1000 executions
+        self.memory_usage = RunningWindow(maxlen=100)      # Last 100 memory checks
+        self.cpu_usage = RunningWindow(maxlen=100)         # Last 100 CPU checks
         
         # Signal performance tracking
-        self.signal_latencies = defaultdict(lambda: deque(maxlen=100))
+        self.signal_latencies = defaultdict(lambda: RunningWindow(maxlen=100))
         self.execution_latencies = deque(maxlen=100)
         self.strategy_performance = defaultdict(lambda: {
             'signals': 0, 'executed': 0, 'winrate': 0.0, 'avg_latency': 0.0
         })
         
+        # In-flight signals live in a fixed ring of slots addressed by sequence
+        # number; an abandoned signal is simply overwritten when its slot recycles
+        self.SIGNAL_SLOTS = 4096  # power of two
+        self._sig_mask = self.SIGNAL_SLOTS - 1
+        self._sig_ids = [-1] * self.SIGNAL_SLOTS
+        self._sig_starts = [0.0] * self.SIGNAL_SLOTS
+        self._sig_seq = itertools.count()
+        
         # Error tracking
         self.error_counts = defaultdict(int)
         self.error_history = deque(maxlen=50)
@@ -55,50 +69,50 @@ class PerformanceMonitor:
         
         self.logger.log("✅ Performance Monitor initialized")
     
-    def record_signal_detection(self, strategy: str, timestamp: float = None) -> str:
-        """Record signal detection time and return unique ID."""
+    def record_signal_detection(self, strategy: str, timestamp: float = None) -> int:
+        """Record signal detection time and return its integer ID."""
         if timestamp is None:
             timestamp = time.time()
         
-        signal_id = f"{strategy}_{int(timestamp * 1000)}"
-        self.signal_start_times = getattr(self, 'signal_start_times', {})
-        self.signal_start_times[signal_id] = timestamp
+        signal_id = next(self._sig_seq)
+        slot = signal_id & self._sig_mask
+        self._sig_starts[slot] = timestamp
+        self._sig_ids[slot] = signal_id
         
         return signal_id
     
-    def record_signal_completion(self, signal_id: str, strategy: str, executed: bool = False):
+    def record_signal_completion(self, signal_id: int, strategy: str, executed: bool = False):
         """Record signal processing completion."""
-        if not hasattr(self, 'signal_start_times') or signal_id not in self.signal_start_times:
-            return
+        slot = signal_id & self._sig_mask
+        if self._sig_ids[slot] != signal_id:
+            return  # Unknown, already completed or recycled
         
-        start_time = self.signal_start_times[signal_id]
+        self._sig_ids[slot] = -1
+        start_time = self._sig_starts[slot]
         completion_time = time.time()
         latency = completion_time - start_time
         
-        # Record latency
-        self.signal_latencies[strategy].append(latency)
-        self.execution_times.append(latency)
+        # Record latency and update strategy performance
+        latencies = self.signal_latencies[strategy]
+        stats = self.strategy_performance[strategy]
+        with self._stats_lock:
+            latencies.append(latency)
+            self.execution_times.append(latency)
+            stats['avg_latency'] = latencies.mean()
         
-        # Update strategy performance
-        self.strategy_performance[strategy]['signals'] += 1
+        stats['signals'] += 1
         if executed:
-            self.strategy_performance[strategy]['executed'] += 1
-        
-        # Calculate average latency
-        if self.signal_latencies[strategy]:
-            self.strategy_performance[strategy]['avg_latency'] = sum(self.signal_latencies[strategy]) / len(self.signal_latencies[strategy])
+            stats['executed'] += 1
         
         # Check latency threshold
         threshold = self.LATENCY_THRESHOLD_HFT if strategy == "HFT" else self.LATENCY_THRESHOLD_NORMAL
         if latency > threshold:
             self.logger.log(f"⚠️ High latency detected: {strategy} {latency*1000:.1f}ms (threshold: {threshold*1000:.1f}ms)")
-        
-        # Cleanup
-        del self.signal_start_times[signal_id]
     
     def record_execution_time(self, operation: str, duration: float):
         """Record execution time for specific operation."""
-        self.execution_times.append(duration)
+        with self._stats_lock:
+            self.execution_times.append(duration)
         
         # Log slow operations
         if duration > 0.1:  # 100ms
@@ -122,7 +136,8 @@ class PerformanceMonitor:
         current_memory = self.process.memory_info().rss / 1024 / 1024  # MB
         growth_percentage = ((current_memory - self.baseline_memory) / self.baseline_memory) * 100
         
-        self.memory_usage.append(current_memory)
+        with self._stats_lock:
+            self.memory_usage.append(current_memory)
         
         # Alert on excessive memory growth
         if growth_percentage > self.MEMORY_GROWTH_THRESHOLD * 100:
@@ -133,7 +148,8 @@ class PerformanceMonitor:
     def check_cpu_usage(self) -> float:
         """Check current CPU usage."""
         cpu_percent = self.process.cpu_percent(interval=None)
-        self.cpu_usage.append(cpu_percent)
+        with self._stats_lock:
+            self.cpu_usage.append(cpu_percent)
         
         # Alert on high CPU usage
         if cpu_percent > self.CPU_THRESHOLD:
@@ -148,9 +164,11 @@ class PerformanceMonitor:
         uptime = time.time() - self.start_time
         
         # Calculate averages
-        avg_execution_time = sum(self.execution_times) / len(self.execution_times) if self.execution_times else 0
-        avg_memory = sum(self.memory_usage) / len(self.memory_usage) if self.memory_usage else current_memory
-        avg_cpu = sum(self.cpu_usage) / len(self.cpu_usage) if self.cpu_usage else cpu_percent
+        with self._stats_lock:
+            total_operations = len(self.execution_times)
+            avg_execution_time = self.execution_times.mean()
+            avg_memory = self.memory_usage.mean(current_memory)
+            avg_cpu = self.cpu_usage.mean(cpu_percent)
         
         # Strategy performance
         strategy_stats = {}
@@ -176,17 +194,17 @@ class PerformanceMonitor:
             },
             'execution': {
                 'avg_time': f"{avg_execution_time*1000:.1f}ms",
-                'total_operations': len(self.execution_times)
+                'total_operations': total_operations
             },
             'strategies': strategy_stats,
             'errors': dict(self.error_counts),
-            'health_status': self._get_health_status()
+            'health_status': self._get_health_status(
+                (current_memory, memory_growth, cpu_percent, avg_execution_time))
         }
     
-    def _get_health_status(self) -> str:
-        """Determine overall health status."""
-        current_memory, memory_growth = self.check_memory_usage()
-        cpu_percent = self.check_cpu_usage()
+    def _get_health_status(self, snap: Tuple[float, float, float, float]) -> str:
+        """Determine overall health status from one summary snapshot."""
+        current_memory, memory_growth, cpu_percent, avg_latency = snap
         
         # Check for critical issues
         if memory_growth > self.MEMORY_GROWTH_THRESHOLD * 100:
@@ -201,10 +219,8 @@ class PerformanceMonitor:
             return "WARNING - High Error Rate"
         
         # Check latency
-        if self.execution_times:
-            avg_latency = sum(self.execution_times) / len(self.execution_times)
-            if avg_latency > self.LATENCY_THRESHOLD_NORMAL:
-                return "WARNING - High Latency"
+        if avg_latency > self.LATENCY_THRESHOLD_NORMAL:
+            return "WARNING - High Latency"
         
         return "HEALTHY"
     
@@ -251,10 +267,13 @@ class LatencyOptimizer:
     def __init__(self, logger):
         """Initialize latency optimizer."""
         self.logger = logger
-        self.symbol_cache = {}
-        self.price_cache = {}
-        self.cache_timestamps = {}
+        # symbol -> (expiry_ts, data); each entry is stored in one assignment,
+        # so prefetch workers can fill the caches without a lock
+        self._symbol_entries: Dict[str, Tuple[float, Dict]] = {}
+        self._price_entries: Dict[str, Tuple[float, float]] = {}
         self.CACHE_TIMEOUT = 1.0  # 1 second cache timeout
+        self.PRICE_CACHE_TIMEOUT = 0.5  # Shorter timeout for prices
+        self.PREFETCH_MAX_WORKERS = 16
         
         self.logger.log("✅ Latency Optimizer initialized")
     
@@ -263,10 +282,9 @@ class LatencyOptimizer:
         current_time = time.time()
         
         # Check cache
-        if (symbol in self.symbol_cache and 
-            symbol in self.cache_timestamps and 
-            current_time - self.cache_timestamps[symbol] < self.CACHE_TIMEOUT):
-            return self.symbol_cache[symbol]
+        entry = self._symbol_entries.get(symbol)
+        if entry and entry[0] > current_time:
+            return entry[1]
         
         # Fetch fresh data
         start_time = time.time()
@@ -274,8 +292,7 @@ class LatencyOptimizer:
         fetch_time = time.time() - start_time
         
         if symbol_info:
-            self.symbol_cache[symbol] = symbol_info
-            self.cache_timestamps[symbol] = current_time
+            self._symbol_entries[symbol] = (current_time + self.CACHE_TIMEOUT, symbol_info)
             
             if fetch_time > 0.050:  # 50ms
                 self.logger.log(f"⚠️ Slow symbol info fetch: {symbol} took {fetch_time*1000:.1f}ms")
@@ -285,13 +302,11 @@ class LatencyOptimizer:
     def get_cached_price(self, symbol: str, mt5_instance) -> Optional[float]:
         """Get current price with caching."""
         current_time = time.time()
-        cache_key = f"{symbol}_price"
         
-        # Check cache (shorter timeout for prices)
-        if (cache_key in self.price_cache and 
-            cache_key in self.cache_timestamps and 
-            current_time - self.cache_timestamps[cache_key] < 0.5):  # 500ms timeout
-            return self.price_cache[cache_key]
+        # Check cache
+        entry = self._price_entries.get(symbol)
+        if entry and entry[0] > current_time:
+            return entry[1]
         
         # Fetch fresh price
         start_time = time.time()
@@ -299,8 +314,7 @@ class LatencyOptimizer:
             tick = mt5_instance.symbol_info_tick(symbol)
             if tick:
                 price = (tick.bid + tick.ask) / 2
-                self.price_cache[cache_key] = price
-                self.cache_timestamps[cache_key] = current_time
+                self._price_entries[symbol] = (current_time + self.PRICE_CACHE_TIMEOUT, price)
                 
                 fetch_time = time.time() - start_time
                 if fetch_time > 0.020:  # 20ms
@@ -313,19 +327,23 @@ class LatencyOptimizer:
         return None
     
     def prefetch_symbol_data(self, symbols: List[str], symbol_manager, mt5_instance):
-        """Prefetch symbol data for multiple symbols."""
+        """Prefetch symbol data for multiple symbols in parallel."""
         start_time = time.time()
         
-        for symbol in symbols:
+        def fetch(symbol):
             self.get_cached_symbol_info(symbol, symbol_manager)
             self.get_cached_price(symbol, mt5_instance)
         
+        if symbols:
+            workers = min(self.PREFETCH_MAX_WORKERS, len(symbols))
+            with concurrent.futures.ThreadPoolExecutor(max_workers=workers, thread_name_prefix="Prefetch") as executor:
+                list(executor.map(fetch, symbols))
+        
         total_time = time.time() - start_time
         self.logger.log(f"✅ Prefetched data for {len(symbols)} symbols in {total_time*1000:.1f}ms")
     
     def clear_cache(self):
         """Clear all cached data."""
-        self.symbol_cache.clear()
-        self.price_cache.clear()
-        self.cache_timestamps.clear()
+        self._symbol_entries.clear()
+        self._price_entries.clear()
         self.logger.log("✅ Cache cleared")
\ No newline at end of file
@@ -58,6 +58,8 @@ class StrategyManager:
             self.symbol_manager = SymbolManager(self.logger, 
                                               type('Connection', (), {'mt5': mt5_instance, 'check_connection': lambda: True})())
             self.risk_manager = RiskManager(self.logger, self.symbol_manager, account_manager)
+            if self.order_manager:
+                self.order_manager.shutdown()  # Release the replaced manager's close pool
             self.order_manager = OrderManager(self.logger, mt5_instance, self.symbol_manager, 
                                             self.risk_manager, account_manager)
             self.indicator_calculator = IndicatorCalculator(self.logger, mt5_instance)
@@ -0,0 +1,287 @@
+"""
+Streaming Indicators Module
+Incremental indicator states updated one bar at a time in O(1).
+"""
+
+from collections import deque
+from typing import Dict, Any, Optional
+import math
+
+
+# Averages/ranges below this are treated as zero (flat market)
+PRICE_EPSILON = 1e-12
+
+
+def _bar_field(bar, name: str, default=None):
+    """Read a field from a rates record or a plain dict."""
+    try:
+        return bar[name]
+    except (KeyError, ValueError, IndexError):
+        return default
+
+
+class EMAState:
+    """Exponential Moving Average (matches ewm(span=period, adjust=False))."""
+
+    def __init__(self, period: int):
+        """Initialize EMA state."""
+        self.period = period
+        self.alpha = 2.0 / (period + 1)
+        self.value = None
+
+    def update(self, x: float) -> float:
+        """Fold one new value into the EMA and return it."""
+        if self.value is None:
+            self.value = x
+        else:
+            self.value = self.alpha * x + (1.0 - self.alpha) * self.value
+        return self.value
+
+
+class RSIState:
+    """
+    Relative Strength Index over a sliding window of gains/losses.
+
+    Uses the same simple-average smoothing as IndicatorCalculator.calculate_rsi
+    so streaming and batch values agree.
+    """
+
+    def __init__(self, period: int = 14):
+        """Initialize RSI state."""
+        self.period = period
+        self.gains = deque(maxlen=period)
+        self.losses = deque(maxlen=period)
+        self.gain_sum = 0.0
+        self.loss_sum = 0.0
+        self.prev_close = None
+        self.value = None
+
+    def update(self, close: float) -> Optional[float]:
+        """Fold one new close into the RSI and return it (None while warming up)."""
+        delta = 0.0 if self.prev_close is None else close - self.prev_close
+        self.prev_close = close
+
+        gain = delta if delta > 0 else 0.0
+        loss = -delta if delta < 0 else 0.0
+
+        if len(self.gains) == self.period:
+            self.gain_sum -= self.gains[0]
+            self.loss_sum -= self.losses[0]
+        self.gains.append(gain)
+        self.losses.append(loss)
+        self.gain_sum += gain
+        self.loss_sum += loss
+
+        if len(self.gains) < self.period:
+            return None
+
+        avg_gain = self.gain_sum / self.period
+        avg_loss = self.loss_sum / self.period
+        if avg_loss < PRICE_EPSILON:
+            self.value = 100.0 if avg_gain > PRICE_EPSILON else 50.0
+        else:
+            rs = avg_gain / avg_loss
+            self.value = 100.0 - (100.0 / (1.0 + rs))
+        return self.value
+
+
+class ATRState:
+    """Average True Range as a simple average of true range over the window."""
+
+    def __init__(self, period: int = 14):
+        """Initialize ATR state."""
+        self.period = period
+        self.ranges = deque(maxlen=period)
+        self.range_sum = 0.0
+        self.prev_close = None
+        self.value = None
+
+    def update(self, high: float, low: float, close: float) -> Optional[float]:
+        """Fold one new bar into the ATR and return it (None while warming up)."""
+        if self.prev_close is None:
+            true_range = high - low
+        else:
+            true_range = max(high - low, abs(high - self.prev_close), abs(low - self.prev_close))
+        self.prev_close = close
+
+        if len(self.ranges) == self.period:
+            self.range_sum -= self.ranges[0]
+        self.ranges.append(true_range)
+        self.range_sum += true_range
+
+        if len(self.ranges) < self.period:
+            return None
+
+        self.value = self.range_sum / self.period
+        return self.value
+
+
+class BBState:
+    """Bollinger Bands using a sliding-window Welford mean/variance."""
+
+    def __init__(self, period: int = 20, std_dev: float = 2.0):
+        """Initialize Bollinger Bands state."""
+        self.period = period
+        self.std_dev = std_dev
+        self.window = deque(maxlen=period)
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.value = None
+
+    def update(self, x: float) -> Optional[Dict[str, float]]:
+        """Fold one new value into the bands and return them (None while warming up)."""
+        if len(self.window) < self.period:
+            # Growing window: standard Welford step
+            self.window.append(x)
+            n = len(self.window)
+            delta = x - self.mean
+            self.mean += delta / n
+            self.m2 += delta * (x - self.mean)
+        else:
+            # Full window: replace the oldest value in place
+            old = self.window[0]
+            self.window.append(x)
+            old_mean = self.mean
+            self.mean += (x - old) / self.period
+            self.m2 += (x - old) * (x - self.mean + old - old_mean)
+
+        if len(self.window) < self.period:
+            return None
+
+        # Sample standard deviation (ddof=1) to match pandas rolling std
+        variance = max(self.m2, 0.0) / (self.period - 1) if self.period > 1 else 0.0
+        std = math.sqrt(variance)
+        self.value = {
+            'upper': self.mean + std * self.std_dev,
+            'middle': self.mean,
+            'lower': self.mean - std * self.std_dev
+        }
+        return self.value
+
+
+class StochState:
+    """Stochastic Oscillator using monotonic deques for the rolling high/low."""
+
+    def __init__(self, k_period: int = 14, d_period: int = 3):
+        """Initialize Stochastic state."""
+        self.k_period = k_period
+        self.d_period = d_period
+        self.max_high = deque()  # (index, high), highs decreasing
+        self.min_low = deque()   # (index, low), lows increasing
+        self.k_values = deque(maxlen=d_period)
+        self.k_sum = 0.0
+        self.index = 0
+        self.value = None
+
+    def update(self, high: float, low: float, close: float) -> Optional[Dict[str, float]]:
+        """Fold one new bar into %K/%D and return them (None while warming up)."""
+        i = self.index
+        self.index += 1
+
+        while self.max_high and self.max_high[-1][1] <= high:
+            self.max_high.pop()
+        self.max_high.append((i, high))
+        while self.min_low and self.min_low[-1][1] >= low:
+            self.min_low.pop()
+        self.min_low.append((i, low))
+
+        # Drop entries that slid out of the window
+        oldest = i - self.k_period + 1
+        if self.max_high[0][0] < oldest:
+            self.max_high.popleft()
+        if self.min_low[0][0] < oldest:
+            self.min_low.popleft()
+
+        if self.index < self.k_period:
+            return None
+
+        highest_high = self.max_high[0][1]
+        lowest_low = self.min_low[0][1]
+        price_range = highest_high - lowest_low
+        k = 100.0 * (close - lowest_low) / price_range if price_range >= PRICE_EPSILON else 50.0
+
+        if len(self.k_values) == self.d_period:
+            self.k_sum -= self.k_values[0]
+        self.k_values.append(k)
+        self.k_sum += k
+
+        d = self.k_sum / len(self.k_values) if len(self.k_values) == self.d_period else 50.0
+        self.value = {'k': k, 'd': d}
+        return self.value
+
+
+class StreamingIndicatorSet:
+    """All streaming indicator states for one symbol, keyed like calculate_all_indicators."""
+
+    EMA_PERIODS = (5, 8, 13, 20, 50, 100, 200)
+    RSI_PERIODS = {'RSI': 14, 'RSI7': 7, 'RSI21': 21}
+
+    def __init__(self, macd_fast: int = 12, macd_slow: int = 26, macd_signal: int = 9,
+                 bb_period: int = 20, atr_period: int = 14,
+                 stoch_k: int = 14, stoch_d: int = 3):
+        """Initialize the per-symbol state set."""
+        self.emas = {f'EMA{p}': EMAState(p) for p in self.EMA_PERIODS}
+        self.rsis = {name: RSIState(p) for name, p in self.RSI_PERIODS.items()}
+        self.macd_fast = EMAState(macd_fast)
+        self.macd_slow = EMAState(macd_slow)
+        self.macd_signal = EMAState(macd_signal)
+        self.bb = BBState(bb_period)
+        self.atr = ATRState(atr_period)
+        self.stoch = StochState(stoch_k, stoch_d)
+        self.bars_seen = 0
+        self.last_time = None
+        self.latest = {}
+
+    def update(self, bar) -> Dict[str, Any]:
+        """
+        Fold one closed bar into every state.
+
+        Args:
+            bar: Rates record or dict with open/high/low/close (and optionally time)
+
+        Returns:
+            Dict with latest indicator values
+        """
+        bar_time = _bar_field(bar, 'time')
+        if bar_time is not None:
+            bar_time = int(bar_time)
+            if self.last_time is not None and bar_time <= self.last_time:
+                # Bar already folded in
+                return self.latest
+            self.last_time = bar_time
+
+        high = float(bar['high'])
+        low = float(bar['low'])
+        close = float(bar['close'])
+        self.bars_seen += 1
+
+        latest = {}
+        for name, state in self.emas.items():
+            latest[name] = state.update(close)
+        for name, state in self.rsis.items():
+            value = state.update(close)
+            latest[name] = 50.0 if value is None else value
+
+        macd = self.macd_fast.update(close) - self.macd_slow.update(close)
+        signal = self.macd_signal.update(macd)
+        latest['MACD'] = macd
+        latest['MACD_signal'] = signal
+        latest['MACD_histogram'] = macd - signal
+
+        bands = self.bb.update(close)
+        if bands:
+            latest['BB_upper'] = bands['upper']
+            latest['BB_middle'] = bands['middle']
+            latest['BB_lower'] = bands['lower']
+
+        atr = self.atr.update(high, low, close)
+        if atr is not None:
+            latest['ATR'] = atr
+            latest['ATR_Ratio'] = atr / close if close else 0.0
+
+        stoch = self.stoch.update(high, low, close)
+        latest['Stoch_K'] = stoch['k'] if stoch else 50.0
+        latest['Stoch_D'] = stoch['d'] if stoch else 50.0
+
+        self.latest = latest
+        return latest
@@ -11,6 +11,7 @@ import datetime
 import threading
 from typing import List, Optional, Dict, Any, Union
 import json
+from collections import deque
 
 from config import *
 
@@ -557,3 +558,38 @@ class RateLimiter:
             current_time = time.time()
             oldest_call = min(self.calls)
             return max(0.0, self.time_window - (current_time - oldest_call))
+
+
+class RunningWindow(deque):
+    """
+    Bounded deque of numbers that keeps its own running sum.
+    
+    Only append/extend/clear keep the sum in step. Not thread-safe on its
+    own; callers that share a window guard it with their existing lock.
+    """
+    
+    def __init__(self, maxlen: int):
+        """Initialize an empty window holding at most maxlen values."""
+        super().__init__(maxlen=maxlen)
+        self.total = 0.0
+    
+    def append(self, value: float) -> None:
+        """Append a value, dropping the oldest one from the sum when full."""
+        if len(self) == self.maxlen:
+            self.total -= self[0]
+        super().append(value)
+        self.total += value
+    
+    def extend(self, values) -> None:
+        """Append each value in turn."""
+        for value in values:
+            self.append(value)
+    
+    def clear(self) -> None:
+        """Remove all values and reset the sum."""
+        super().clear()
+        self.total = 0.0
+    
+    def mean(self, default: float = 0.0) -> float:
+        """Return the average of the window, or default when it is empty."""
+        return self.total / len(self) if self else default
@@ -0,0 +1,248 @@
+"""
+Unit tests for Technical Indicators Module
+"""
+
+import unittest
+from unittest.mock import Mock
+import sys
+import os
+
+import numpy as np
+import pandas as pd
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modules.indicators import IndicatorCalculator, _ema_recurrence, _ema_ewm_into
+from modules.streaming_indicators import StreamingIndicatorSet, EMAState, RSIState, BBState
+from modules.logging_utils import BotLogger
+
+
+RATES_DTYPE = np.dtype([
+    ('time', '<i8'), ('open', '<f8'), ('high', '<f8'), ('low', '<f8'),
+    ('close', '<f8'), ('tick_volume', '<i8'), ('spread', '<i4'), ('real_volume', '<i8')
+])
+
+
+def make_rates(count: int = 300, seed: int = 7) -> np.ndarray:
+    """Build a deterministic random-walk rates array shaped like MT5 output."""
+    rng = np.random.default_rng(seed)
+    close = 1.085 + np.cumsum(rng.normal(0, 0.0004, count))
+    open_ = np.concatenate(([close[0]], close[:-1]))
+    spread = np.abs(rng.normal(0, 0.0003, count))
+    rates = np.zeros(count, dtype=RATES_DTYPE)
+    rates['time'] = 1640995200 + np.arange(count) * 60
+    rates['open'] = open_
+    rates['close'] = close
+    rates['high'] = np.maximum(open_, close) + spread
+    rates['low'] = np.minimum(open_, close) - spread
+    rates['tick_volume'] = 100
+    return rates
+
+
+class TestIndicatorCalculator(unittest.TestCase):
+    """Test cases for IndicatorCalculator class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.logger = Mock(spec=BotLogger)
+        self.mt5 = Mock()
+        self.mt5.TIMEFRAME_M1 = 1
+        self.rates = make_rates()
+        self.mt5.copy_rates_from_pos.return_value = self.rates
+
+        self.calculator = IndicatorCalculator(self.logger, self.mt5)
+
+        self.df = pd.DataFrame(self.rates)
+
+    def test_ema_state_matches_batch(self):
+        """Test streaming EMA matches pandas ewm."""
+        close = self.df['close']
+        expected = self.calculator.calculate_ema(close, 20)
+
+        state = EMAState(20)
+        values = [state.update(x) for x in close]
+
+        np.testing.assert_allclose(values, expected.values, rtol=1e-12)
+
+    def test_ema_recurrence_matches_pandas(self):
+        """Test calculate_ema matches ewm(adjust=False), including series with gaps."""
+        close = self.df['close']
+        expected = close.ewm(span=20, adjust=False).mean()
+        np.testing.assert_allclose(self.calculator.calculate_ema(close, 20).values, expected.values, rtol=1e-12)
+
+        gappy = close.copy()
+        gappy.iloc[5] = np.nan
+        np.testing.assert_allclose(self.calculator.calculate_ema(gappy, 20).values,
+                                   gappy.ewm(span=20, adjust=False).mean().values, rtol=1e-12)
+
+        # The pandas fallback used without numba matches the recurrence
+        values = close.to_numpy(dtype=np.float64)
+        np.testing.assert_allclose(_ema_ewm_into(values, 20, np.empty(len(values))),
+                                   _ema_recurrence(values, 20, np.empty(len(values))), rtol=1e-12)
+
+    def test_rsi_state_matches_batch(self):
+        """Test streaming RSI matches the batch RSI once warmed up."""
+        close = self.df['close']
+        expected = self.calculator.calculate_rsi(close, 14)
+
+        state = RSIState(14)
+        values = [state.update(x) for x in close]
+
+        np.testing.assert_allclose(values[20:], expected.values[20:], rtol=1e-9)
+
+    def test_bb_state_matches_batch(self):
+        """Test streaming Bollinger Bands match the batch bands."""
+        close = self.df['close']
+        expected = self.calculator.calculate_bollinger_bands(close, 20)
+
+        state = BBState(20)
+        values = [state.update(x) for x in close]
+
+        upper = [v['upper'] for v in values[19:]]
+        lower = [v['lower'] for v in values[19:]]
+        np.testing.assert_allclose(upper, expected['upper'].values[19:], rtol=1e-9)
+        np.testing.assert_allclose(lower, expected['lower'].values[19:], rtol=1e-9)
+
+    def test_streaming_set_matches_all_indicators(self):
+        """Test the streaming set agrees with calculate_all_indicators on the last bar."""
+        expected = self.calculator.calculate_all_indicators(self.df.copy()).iloc[-1]
+
+        states = StreamingIndicatorSet()
+        for bar in self.rates:
+            latest = states.update(bar)
+
+        for column in ['EMA5', 'EMA200', 'RSI', 'RSI7', 'MACD', 'MACD_signal',
+                       'BB_upper', 'BB_lower', 'ATR', 'Stoch_K', 'Stoch_D']:
+            self.assertAlmostEqual(latest[column], expected[column], places=9, msg=column)
+
+    def test_update_symbol_primes_then_updates(self):
+        """Test update_symbol primes from history and ignores repeated bars."""
+        history = self.rates[:-1]
+        self.mt5.copy_rates_from_pos.return_value = history
+
+        latest = self.calculator.update_symbol("EURUSD", self.rates[-1])
+        self.assertIn('EMA20', latest)
+
+        # Same bar again is a no-op
+        again = self.calculator.update_symbol("EURUSD", self.rates[-1])
+        self.assertEqual(latest, again)
+        self.mt5.copy_rates_from_pos.assert_called_once()
+
+    def test_legacy_indicators_match_series_methods(self):
+        """Test the buffer-based legacy path agrees with the pandas methods."""
+        indicators = self.calculator.calculate_legacy_indicators("EURUSD")
+        df = self.df
+        close = df['close']
+
+        np.testing.assert_allclose(indicators['EMA_12'], self.calculator.calculate_ema(close, 12).values, rtol=1e-12)
+        np.testing.assert_allclose(indicators['SMA_20'], self.calculator.calculate_sma(close, 20).values, rtol=1e-12)
+        np.testing.assert_allclose(indicators['RSI'], self.calculator.calculate_rsi(close, 14).values, rtol=1e-9)
+        np.testing.assert_allclose(indicators['ATR'], self.calculator.calculate_atr(df, 14).values, rtol=1e-9)
+        np.testing.assert_allclose(indicators['Momentum'], self.calculator.calculate_momentum(close, 14).values)
+        np.testing.assert_allclose(indicators['Momentum'], close.diff(14).values)
+        np.testing.assert_allclose(
+            indicators['WilliamsR'],
+            self.calculator.calculate_williams_r(df['high'], df['low'], close, 14).values, rtol=1e-9)
+
+        macd = self.calculator.calculate_macd(close)
+        np.testing.assert_allclose(indicators['MACD']['histogram'], macd['histogram'].values, atol=1e-12)
+
+        bands = self.calculator.calculate_bollinger_bands(close, 20)
+        np.testing.assert_allclose(indicators['Bollinger']['upper'], bands['upper'].values, rtol=1e-9)
+
+    def test_legacy_indicators_reuse_scratch_buffers(self):
+        """Test scratch buffers are allocated once per (symbol, timeframe)."""
+        self.calculator.calculate_legacy_indicators("EURUSD")
+        buffers = self.calculator._scratch[("EURUSD", None)]
+
+        self.calculator.indicator_cache.clear()
+        self.calculator.calculate_legacy_indicators("EURUSD")
+
+        self.assertIs(self.calculator._scratch[("EURUSD", None)], buffers)
+
+    def test_kernel_shared_across_calculators(self):
+        """Test the period-specialized kernel is built once per period set."""
+        other = IndicatorCalculator(self.logger, self.mt5)
+
+        self.assertIs(other._kernel, self.calculator._kernel)
+
+    def test_batch_indicators_match_single_symbol(self):
+        """Test the multi-symbol batch pass agrees with the per-series methods."""
+        series = {"EURUSD": make_rates(seed=1), "GBPUSD": make_rates(seed=2)}
+        self.mt5.copy_rates_from_pos.side_effect = lambda symbol, *args: series[symbol]
+
+        latest = self.calculator.calculate_batch_indicators(list(series))
+
+        for symbol, rates in series.items():
+            close = pd.Series(rates['close'])
+            self.assertAlmostEqual(latest[symbol]['EMA_fast'], self.calculator.calculate_ema(close, 12).iloc[-1], places=12)
+            self.assertAlmostEqual(latest[symbol]['RSI'], self.calculator.calculate_rsi(close, 14).iloc[-1], places=9)
+            bands = self.calculator.calculate_bollinger_bands(close, 20)
+            self.assertAlmostEqual(latest[symbol]['BB_upper'], bands['upper'].iloc[-1], places=12)
+
+    def test_stochastic_matches_pandas_rolling(self):
+        """Test the windowed max/min Stochastic and Williams %R match pandas rolling."""
+        df = self.df
+        lowest = df['low'].rolling(window=14).min()
+        highest = df['high'].rolling(window=14).max()
+        k_expected = 100 * ((df['close'] - lowest) / (highest - lowest))
+
+        stoch = self.calculator.calculate_stochastic(df['high'], df['low'], df['close'])
+        np.testing.assert_allclose(stoch['k'].values, k_expected.values, rtol=1e-12)
+        np.testing.assert_allclose(stoch['d'].values, k_expected.rolling(window=3).mean().values, rtol=1e-12)
+
+        williams = self.calculator.calculate_williams_r(df['high'], df['low'], df['close'])
+        expected = -100 * ((highest - df['close']) / (highest - lowest))
+        np.testing.assert_allclose(williams.values, expected.values, rtol=1e-12)
+
+        stoch_df = self.calculator.calculate_stochastic_df(df)
+        np.testing.assert_allclose(stoch_df['%K'].values, k_expected.fillna(50).values, rtol=1e-12)
+
+    def test_flat_market_guards(self):
+        """Test RSI/Stochastic/Williams %R stay finite when prices stop moving."""
+        flat = pd.Series(np.full(40, 1.1))
+        rising = pd.Series(1.1 + np.arange(40) * 0.0001)
+
+        self.assertTrue((self.calculator.calculate_rsi(flat, 14) == 50.0).all())
+        self.assertEqual(self.calculator.calculate_rsi(rising, 14).iloc[-1], 100.0)
+
+        stoch = self.calculator.calculate_stochastic(flat, flat, flat)
+        self.assertEqual(stoch['k'].iloc[-1], 50.0)
+        self.assertEqual(stoch['d'].iloc[-1], 50.0)
+        self.assertEqual(self.calculator.calculate_williams_r(flat, flat, flat).iloc[-1], -50.0)
+
+        state = RSIState(14)
+        for x in flat:
+            value = state.update(x)
+        self.assertEqual(value, 50.0)
+
+    def test_indicator_errors_surface_at_batch_boundary(self):
+        """Test per-indicator methods raise and calculate_all_indicators logs instead."""
+        with self.assertRaises(KeyError):
+            self.calculator.calculate_atr(self.df.drop(columns=['high']))
+
+        data = self.df.drop(columns=['high'])
+        result = self.calculator.calculate_all_indicators(data)
+
+        self.assertIs(result, data)
+        self.logger.log.assert_called()
+
+    def test_get_symbol_rates_raw(self):
+        """Test raw rates are returned as-is and get_symbol_data still builds a DataFrame."""
+        rates = self.calculator.get_symbol_rates_raw("EURUSD")
+        self.assertIs(rates, self.rates)
+
+        df = self.calculator.get_symbol_data("EURUSD")
+        self.assertIsInstance(df.index, pd.DatetimeIndex)
+        np.testing.assert_array_equal(df['close'].values, self.rates['close'])
+
+    def test_update_symbol_no_mt5(self):
+        """Test update_symbol without MT5 returns empty dict."""
+        calculator = IndicatorCalculator(self.logger, None)
+
+        self.assertEqual(calculator.update_symbol("EURUSD", self.rates[-1]), {})
+
+
+if __name__ == '__main__':
+    unittest.main()
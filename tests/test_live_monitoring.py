@@ -0,0 +1,308 @@
+"""
+Unit tests for Live Monitoring & Alerting Module
+"""
+
+import unittest
+from unittest.mock import Mock, patch
+import sys
+import os
+import json
+import tempfile
+import threading
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modules.live_monitoring import LiveMonitoringDashboard, TelegramAlerting
+from modules.logging_utils import BotLogger
+
+
+PERFORMANCE_SUMMARY = {
+    'memory': {'current': '120.0MB'},
+    'cpu': {'current': '5.0%'},
+    'uptime': '0:10:00',
+    'health_status': 'HEALTHY'
+}
+
+
+class TestLiveMonitoringDashboard(unittest.TestCase):
+    """Test cases for LiveMonitoringDashboard class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.logger = Mock(spec=BotLogger)
+        self.performance_monitor = Mock()
+        self.performance_monitor.get_performance_summary.return_value = PERFORMANCE_SUMMARY
+
+        self.dashboard = LiveMonitoringDashboard(self.logger, self.performance_monitor)
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self.dashboard.stop_monitoring()
+
+    def test_running_sums_track_window(self):
+        """Test running sums match the deque contents after eviction."""
+        for i in range(150):
+            self.dashboard.record_trade_execution("HFT", "EURUSD", "BUY", 0.01, i * 0.001)
+            self.dashboard.record_signal("HFT", "EURUSD", "BUY", 0.8, latency=i * 0.002)
+        self.dashboard._drain_events()
+
+        self.assertEqual(len(self.dashboard.execution_times), 100)
+        self.assertAlmostEqual(self.dashboard.execution_times.total, sum(self.dashboard.execution_times))
+        self.assertAlmostEqual(self.dashboard.signal_latencies.total, sum(self.dashboard.signal_latencies))
+
+    def test_dashboard_data_averages(self):
+        """Test dashboard averages come from the running sums."""
+        self.dashboard.record_trade_execution("HFT", "EURUSD", "BUY", 0.01, 0.010)
+        self.dashboard.record_trade_execution("HFT", "EURUSD", "SELL", 0.01, 0.020)
+
+        data = self.dashboard.get_dashboard_data()
+
+        self.assertAlmostEqual(data['performance_metrics']['avg_execution_time'], 15.0)
+        self.assertEqual(data['trading_summary']['executed_trades'], 2)
+
+        formatted = self.dashboard.get_formatted_dashboard_data()
+        self.assertEqual(formatted['performance_metrics']['avg_execution_time'], "15.0ms")
+        self.assertEqual(formatted['trading_summary']['overall_winrate'], "0.0%")
+
+    def test_performance_summary_cached(self):
+        """Test back-to-back dashboard reads share one performance summary."""
+        self.dashboard.get_dashboard_data()
+        self.dashboard.get_dashboard_data()
+
+        self.performance_monitor.get_performance_summary.assert_called_once()
+
+    def test_strategy_metrics_columns(self):
+        """Test per-strategy columns assemble into the dashboard's per-strategy dicts."""
+        self.dashboard.record_signal("HFT", "EURUSD", "BUY", 0.9)
+        self.dashboard.record_signal("HFT", "EURUSD", "SELL", 0.7)
+        self.dashboard.record_trade_execution("HFT", "EURUSD", "BUY", 0.01, 0.005)
+        self.dashboard.record_trade_result("HFT", 12.5, True)
+
+        metrics = self.dashboard.get_dashboard_data()['strategy_performance']['HFT']
+
+        self.assertEqual(metrics['signals'], 2)
+        self.assertEqual(metrics['executed'], 1)
+        self.assertEqual(metrics['winrate'], 50.0)
+        self.assertEqual(metrics['pnl'], 12.5)
+
+    def test_strategy_count_is_bounded(self):
+        """Test the least recently used strategy is evicted past MAX_STRATEGIES."""
+        self.dashboard.MAX_STRATEGIES = 3
+        for name in ["HFT", "Scalping", "Intraday"]:
+            self.dashboard.record_signal(name, "EURUSD", "BUY", 0.5)
+        self.dashboard.record_signal("HFT", "EURUSD", "BUY", 0.5)
+        self.dashboard.record_signal("Scalpnig", "EURUSD", "BUY", 0.5)
+
+        metrics = self.dashboard.get_dashboard_data()['strategy_performance']
+
+        self.assertEqual(set(metrics), {"Intraday", "HFT", "Scalpnig"})
+        self.assertNotIn("Scalping", self.dashboard._signals)
+        self.assertEqual(metrics["HFT"]['signals'], 2)
+
+    def test_recent_errors_render_timestamps(self):
+        """Test error timestamps are stored raw and formatted on read."""
+        self.dashboard.record_error("ORDER", "order rejected", "HFT")
+        self.dashboard._drain_events()
+        self.assertIsInstance(self.dashboard.error_log[-1]['timestamp'], float)
+
+        error = self.dashboard.get_dashboard_data()['recent_errors'][-1]
+        self.assertRegex(error['timestamp'], r'^\d{2}:\d{2}:\d{2}$')
+        self.assertEqual(error['message'], "order rejected")
+
+    def test_long_error_messages_truncated_on_record(self):
+        """Test error messages are bounded when recorded, not when rendered."""
+        self.dashboard.record_error("ORDER", "x" * 1000)
+        self.dashboard._drain_events()
+
+        self.assertEqual(len(self.dashboard.error_log[-1]['message']), 200)
+
+    def test_error_message_exceptions_recorded(self):
+        """Test non-string error messages such as exceptions are recorded as text."""
+        self.dashboard.record_error("ORDER", ValueError("bad volume"))
+        self.dashboard._drain_events()
+
+        self.assertEqual(self.dashboard.error_log[-1]['message'], "bad volume")
+
+    def test_record_calls_only_queue_events(self):
+        """Test record_* stay off the metrics until the events are drained."""
+        self.dashboard.record_signal("HFT", "EURUSD", "BUY", 0.9)
+        self.dashboard.record_trade_result("HFT", -5.0, False)
+
+        self.assertEqual(len(self.dashboard._events), 2)
+        self.assertEqual(self.dashboard.trading_metrics['total_signals'], 0)
+        self.logger.log.reset_mock()
+
+        data = self.dashboard.get_dashboard_data()
+
+        self.assertEqual(len(self.dashboard._events), 0)
+        self.assertEqual(data['trading_summary']['total_signals'], 1)
+        self.assertEqual(data['trading_summary']['max_drawdown'], 5.0)
+        self.assertEqual(self.logger.log.call_count, 2)
+
+    def test_producers_drain_before_overflow(self):
+        """Test a burst past the queue size is folded in by the producer instead of dropped."""
+        for _ in range(self.dashboard.EVENT_QUEUE_SIZE + 500):
+            self.dashboard.record_trade_result("HFT", 1.0, True)
+
+        self.assertLess(len(self.dashboard._events), self.dashboard.EVENT_QUEUE_SIZE)
+        data = self.dashboard.get_dashboard_data()
+        self.assertEqual(data['trading_summary']['total_pnl'], self.dashboard.EVENT_QUEUE_SIZE + 500)
+        self.assertEqual(data['trading_summary']['dropped_events'], 0)
+
+    def test_dropped_events_counted_and_reported(self):
+        """Test events evicted while the drain lock is busy are counted and logged once."""
+        with self.dashboard._lock:
+            held = threading.Thread(target=lambda: [
+                self.dashboard.record_signal("HFT", "EURUSD", "BUY", 0.5)
+                for _ in range(self.dashboard.EVENT_QUEUE_SIZE + 10)])
+            held.start()
+            held.join()
+        self.logger.log.reset_mock()
+
+        data = self.dashboard.get_dashboard_data()
+
+        self.assertEqual(data['trading_summary']['dropped_events'], 10)
+        warnings = [call for call in self.logger.log.call_args_list if call.args[-1] == "WARNING"]
+        self.assertEqual(len(warnings), 1)
+        self.assertIn("10 events dropped", warnings[0].args[0])
+
+    def test_strategy_metrics_drains_pending_events(self):
+        """Test the per-strategy view folds in queued events before reading the columns."""
+        self.dashboard.record_signal("HFT", "EURUSD", "BUY", 0.9)
+
+        self.assertEqual(self.dashboard.strategy_metrics["HFT"]['signals'], 1)
+
+    def test_suppressed_log_lines_are_not_built(self):
+        """Test event log lines are skipped when the logger filters INFO."""
+        self.logger.is_enabled_for.return_value = False
+        self.logger.log.reset_mock()
+
+        self.dashboard.record_trade_result("HFT", 3.0, True)
+        self.dashboard.get_dashboard_data()
+
+        self.logger.log.assert_not_called()
+        self.assertEqual(self.dashboard.trading_metrics['successful_trades'], 1)
+
+    def test_export_dashboard_data(self):
+        """Test dashboard export writes readable JSON."""
+        self.dashboard.record_signal("HFT", "EURUSD", "BUY", 0.9)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            filepath = os.path.join(tmp, "dashboard.json")
+            self.assertTrue(self.dashboard.export_dashboard_data(filepath))
+
+            with open(filepath) as f:
+                exported = json.load(f)
+
+        self.assertEqual(exported['trading_summary']['total_signals'], 1)
+        self.assertEqual(exported['health_status'], 'HEALTHY')
+
+    def test_stop_monitoring_wakes_loop(self):
+        """Test stop_monitoring returns promptly instead of waiting out the interval."""
+        self.dashboard.stop_monitoring()
+
+        self.assertFalse(self.dashboard.update_thread.is_alive())
+
+
+class TestTelegramAlerting(unittest.TestCase):
+    """Test cases for TelegramAlerting class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.logger = Mock(spec=BotLogger)
+        patcher = patch('modules.live_monitoring.requests.Session')
+        self.session = patcher.start().return_value
+        self.session.post.return_value = Mock(status_code=200)
+        self.addCleanup(patcher.stop)
+
+        self.alerting = TelegramAlerting(self.logger, "token", "chat")
+        self.addCleanup(self.alerting.stop)
+
+    def test_send_alert_is_queued_and_posted(self):
+        """Test alerts are handed to the worker and posted on the shared session."""
+        self.assertTrue(self.alerting.send_alert("hello", "INFO"))
+        self.alerting._alert_queue.join()
+
+        self.session.post.assert_called_once()
+        payload = self.session.post.call_args.kwargs['json']
+        self.assertIn("hello", payload['text'])
+        self.assertEqual(payload['chat_id'], "chat")
+        self.assertEqual(payload['parse_mode'], "Markdown")
+        self.assertEqual(self.session.post.call_args.args[0], "https://api.telegram.org/bottoken/sendMessage")
+
+    def test_burst_is_batched_except_critical(self):
+        """Test alerts within the batch window share one request and CRITICAL goes alone."""
+        self.alerting.send_alert("first", "INFO")
+        self.alerting.send_alert("second", "WARNING")
+        self.alerting.send_alert("stop now", "CRITICAL")
+        self.alerting._alert_queue.join()
+
+        texts = [call.kwargs['json']['text'] for call in self.session.post.call_args_list]
+        self.assertEqual(len(texts), 2)
+        self.assertIn("stop now", texts[0])
+        self.assertIn("first", texts[1])
+        self.assertIn("second", texts[1])
+
+    def test_send_alert_cooldown(self):
+        """Test a second alert of the same type inside the cooldown is suppressed."""
+        self.assertTrue(self.alerting.send_alert("first", "WARNING"))
+        self.assertFalse(self.alerting.send_alert("second", "WARNING"))
+
+    def test_failed_send_does_not_start_cooldown(self):
+        """Test the cooldown starts only after Telegram accepts the alert."""
+        self.session.post.return_value = Mock(status_code=429)
+        self.assertTrue(self.alerting.send_alert("first", "CRITICAL"))
+        self.alerting._alert_queue.join()
+
+        self.session.post.return_value = Mock(status_code=200)
+        self.assertTrue(self.alerting.send_alert("retry", "CRITICAL"))
+        self.alerting._alert_queue.join()
+
+        self.assertEqual(self.session.post.call_count, 2)
+        self.assertFalse(self.alerting.send_alert("third", "CRITICAL"))
+
+    def test_repeated_errors_window(self):
+        """Test repeated-error alerts fire at the threshold and expire with the window."""
+        self.alerting.alert_repeated_errors = Mock()
+
+        for _ in range(4):
+            self.alerting.record_error_for_alerting("ORDER", "rejected")
+        self.alerting.alert_repeated_errors.assert_not_called()
+
+        self.alerting.record_error_for_alerting("ORDER", "rejected")
+        self.alerting.alert_repeated_errors.assert_called_once_with("ORDER", 5)
+
+        # Age everything out of the window
+        window = self.alerting._error_windows["ORDER"]
+        for i in range(len(window)):
+            window[i] -= self.alerting.ERROR_WINDOW_SECONDS + 1
+        self.alerting.record_error_for_alerting("ORDER", "rejected")
+        self.assertEqual(len(window), 1)
+
+    def test_daily_summary_message(self):
+        """Test the daily summary is rendered from numeric dashboard data."""
+        self.alerting.send_alert = Mock()
+        dashboard_data = {
+            'trading_summary': {'total_signals': 10, 'executed_trades': 4,
+                                'overall_winrate': 75.0, 'daily_pnl': 12.345},
+            'performance_metrics': {'memory_usage': '120.0MB', 'cpu_usage': '5.0%', 'uptime': '0:10:00'},
+            'health_status': 'HEALTHY'
+        }
+
+        self.alerting.alert_daily_summary(dashboard_data)
+
+        message = self.alerting.send_alert.call_args.args[0]
+        self.assertIn("Winrate: 75.0%", message)
+        self.assertIn("Daily PnL: 12.35", message)
+        self.assertTrue(message.endswith("Health: HEALTHY"))
+
+    def test_disabled_without_credentials(self):
+        """Test alerting is a no-op without token/chat_id."""
+        alerting = TelegramAlerting(self.logger)
+
+        self.assertFalse(alerting.send_alert("hello"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,296 @@
+"""
+Unit tests for Logging Utilities Module
+"""
+
+import unittest
+from unittest.mock import Mock, patch
+import sys
+import os
+import tempfile
+import threading
+import queue
+import csv
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modules.logging_utils import BotLogger
+
+
+class TestBotLogger(unittest.TestCase):
+    """Test cases for BotLogger class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        for name, value in (('LOG_DIR', self.tmp.name), ('TELEGRAM_TOKEN', "")):
+            patcher = patch(f'modules.logging_utils.{name}', value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        self.logger = BotLogger()
+        self.addCleanup(self.logger.close)
+
+    def test_buffer_is_bounded(self):
+        """Test the buffer keeps only the newest max_buffer_size entries."""
+        for i in range(self.logger.max_buffer_size + 50):
+            self.logger.log(f"message {i}")
+
+        buffer = self.logger.get_log_buffer()
+
+        self.assertEqual(len(buffer), self.logger.max_buffer_size)
+        self.assertTrue(buffer[0].endswith("message 50"))
+        self.assertTrue(buffer[-1].endswith(f"message {self.logger.max_buffer_size + 49}"))
+        self.assertIsInstance(buffer, list)
+
+    def test_timestamp_cached_per_second(self):
+        """Test the timestamp string is only re-rendered when the second changes."""
+        with patch('modules.logging_utils.time.time', side_effect=[100.1, 100.9, 101.2]), \
+                patch('modules.logging_utils.time.strftime', side_effect=["first", "second"]) as strftime:
+            stamps = [self.logger._timestamp() for _ in range(3)]
+
+        self.assertEqual(stamps, ["first", "first", "second"])
+        self.assertEqual(strftime.call_count, 2)
+
+    def test_console_output_gated(self):
+        """Test console echo is skipped unless enabled and uses one write when it is."""
+        with patch('modules.logging_utils.sys.stdout') as stdout:
+            self.logger._console_enabled = False
+            self.logger.log("quiet")
+            stdout.write.assert_not_called()
+
+            self.logger._console_enabled = True
+            self.logger.log("loud")
+            stdout.write.assert_called_once()
+            self.assertTrue(stdout.write.call_args.args[0].endswith("INFO: loud\n"))
+
+    def test_level_threshold_specializes_log(self):
+        """Test set_level filters below the threshold and binds the unfiltered path at DEBUG."""
+        self.assertEqual(self.logger.log, self.logger._emit)
+
+        self.logger.set_level("WARNING")
+        self.logger.log("hidden")
+        self.logger.log("shown", "WARNING")
+
+        self.assertEqual(self.logger.log, self.logger._log_filtered)
+        self.assertFalse(self.logger.is_enabled_for("INFO"))
+        self.assertTrue(self.logger.is_enabled_for("ERROR"))
+        self.assertEqual([record[2] for record in self.logger.log_buffer], ["shown"])
+
+    def test_file_output_written_by_writer_thread(self):
+        """Test queued messages reach the log file once the writer drains them."""
+        self.logger.log("first")
+        self.logger.log("second", "WARNING")
+        self.logger._file_q.join()
+
+        with open(self.logger.log_file_path, encoding='utf-8') as f:
+            lines = f.read().splitlines()
+
+        self.assertEqual(len(lines), 2)
+        self.assertTrue(lines[0].endswith("INFO: first"))
+        self.assertTrue(lines[1].endswith("WARNING: second"))
+        self.assertEqual(os.path.dirname(self.logger.log_file_path), self.tmp.name)
+
+    def test_writer_batches_queued_messages(self):
+        """Test a burst already in the queue is written as one batch of encoded lines."""
+        self.logger.close()
+        lines = [f"line {i} ✅\n".encode('utf-8') for i in range(10)]
+        for line in lines:
+            self.logger._file_q.put_nowait(line)
+        self.logger._file_q.put_nowait(None)
+
+        with patch.object(self.logger, '_write_lines', wraps=self.logger._write_lines) as write_lines:
+            self.logger._file_writer()
+
+        write_lines.assert_called_once_with(lines)
+        self.assertIsNone(self.logger._fd)
+        with open(self.logger.log_file_path, 'rb') as f:
+            self.assertEqual(f.read(), b"".join(lines))
+
+    def test_dropped_lines_reported_once(self):
+        """Test a full file queue counts drops and the writer reports them in one line."""
+        self.logger.close()
+        self.logger._file_q = queue.Queue(maxsize=2)
+        for i in range(5):
+            self.logger._write_to_file(f"line {i}")
+        self.assertEqual(self.logger.dropped_file_lines, 3)
+
+        with patch('sys.stderr') as stderr:
+            self.logger._file_writer_thread = threading.Thread(target=self.logger._file_writer)
+            self.logger._file_writer_thread.start()
+            self.logger.close()
+
+        stderr.write.assert_called()
+        with open(self.logger.log_file_path, encoding='utf-8') as f:
+            lines = f.read().splitlines()
+        self.assertEqual(lines[:2], ["line 0", "line 1"])
+        self.assertTrue(lines[2].endswith("WARNING: File logging queue full, dropped 3 lines"))
+        self.assertIsNone(self.logger._dropped_file_notice())
+
+    def test_log_file_reopened_only_on_rollover(self):
+        """Test the writer keeps one descriptor open and reopens it after midnight."""
+        with patch.object(self.logger, '_open_log_file', wraps=self.logger._open_log_file) as reopen:
+            self.logger.log("first")
+            self.logger._file_q.join()
+            self.logger.log("second")
+            self.logger._file_q.join()
+            self.assertEqual(reopen.call_count, 1)
+
+            self.logger._rollover_at = 0.0
+            self.logger.log("third")
+            self.logger._file_q.join()
+            self.assertEqual(reopen.call_count, 2)
+
+        self.assertGreater(self.logger._rollover_at, 0.0)
+
+    def test_gui_callback_runs_on_pumping_thread(self):
+        """Test GUI updates wait for pump_gui and are delivered on the pumping thread in one call."""
+        calls = []
+        self.logger.set_gui_callback(lambda message: calls.append((threading.get_ident(), message)))
+
+        self.logger.log("first")
+        self.logger.log("second")
+        self.assertEqual(calls, [])
+
+        self.assertEqual(self.logger.pump_gui(), 2)
+        self.assertEqual(self.logger.pump_gui(), 0)
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(calls[0][0], threading.get_ident())
+        first, second = calls[0][1].split("\n")
+        self.assertTrue(first.endswith("INFO: first"))
+        self.assertTrue(second.endswith("INFO: second"))
+
+    def test_clear_logs_from_caller(self):
+        """Test clear_logs empties the buffer and records the clear without blocking."""
+        self.logger.log("old")
+        self.logger.clear_logs()
+
+        buffer = self.logger.get_log_buffer()
+        self.assertEqual(len(buffer), 1)
+        self.assertIn("Log buffer cleared", buffer[0])
+
+    def test_telegram_requests_share_session(self):
+        """Test Telegram sends go through the logger's pooled session."""
+        self.logger._session = Mock()
+        self.logger._session.post.return_value = Mock(status_code=200)
+
+        self.logger._send_telegram_request(self.logger._tg_url, {'text': "a"})
+        self.logger._send_telegram_request(self.logger._tg_url, {'text': "b"})
+
+        self.assertEqual(self.logger._session.post.call_count, 2)
+        self.assertTrue(self.logger._tg_url.endswith("/sendMessage"))
+
+    def test_telegram_notifications_use_worker_queue(self):
+        """Test notifications are queued for the single worker and rate limited."""
+        self.logger._send_telegram_request = Mock()
+
+        with patch('modules.logging_utils.TELEGRAM_TOKEN', "token"), \
+                patch('threading.Thread') as thread:
+            self.logger.log("❌ order failed", "ERROR")
+            self.logger.log("❌ order failed again", "ERROR")
+        self.logger._tg_q.join()
+
+        thread.assert_not_called()
+        self.logger._send_telegram_request.assert_called_once()
+        payload = self.logger._send_telegram_request.call_args.args[1]
+        self.assertIn("order failed", payload['text'])
+
+    def test_buffer_holds_structured_records(self):
+        """Test records export to CSV without re-parsing and stats count by level."""
+        self.logger.log("ratio: 1.5] spread: 2", "WARNING")
+        self.logger.log("ERROR in message text")
+        self.logger.log("failed", "ERROR")
+
+        self.assertEqual(self.logger.log_buffer[0][1:], ("WARNING", "ratio: 1.5] spread: 2"))
+
+        path = self.logger.export_logs_csv("export.csv")
+        with open(path, newline='', encoding='utf-8') as f:
+            rows = list(csv.reader(f))
+        self.assertEqual(rows[0], ['Timestamp', 'Level', 'Message'])
+        self.assertEqual(rows[1][1:], ["WARNING", "ratio: 1.5] spread: 2"])
+
+        stats = self.logger.get_log_stats()
+        self.assertEqual(stats['error_count'], 1)
+        self.assertEqual(stats['warning_count'], 1)
+
+    def test_export_txt_uses_snapshot(self):
+        """Test the text export reflects the buffer at export time."""
+        self.logger.log("one")
+        self.logger.log("two", "WARNING")
+
+        path = self.logger.export_logs_txt("export.txt")
+        with open(path, encoding='utf-8') as f:
+            content = f.read()
+
+        self.assertIn("Total Entries: 2\n", content)
+        self.assertTrue(content.endswith("WARNING: two\n"))
+        self.assertNotIn("Logs exported", content)
+
+    def test_telegram_text_bounded_in_bytes(self):
+        """Test long multibyte messages are cut to Telegram's byte limit on a character boundary."""
+        self.logger.close()
+        with patch('modules.logging_utils.TELEGRAM_TOKEN', "token"):
+            self.logger._send_telegram_notification("❌" * 2000)
+        payload = self.logger._tg_q.get_nowait()
+
+        text = payload['text']
+        self.assertLessEqual(len(text.encode('utf-8')), 4096)
+        self.assertTrue(text.startswith("🤖 Trading Bot: ❌"))
+        self.assertTrue(text.endswith("❌... (truncated)"))
+
+    def test_telegram_rate_limit_uses_monotonic_clock(self):
+        """Test the rate limit reopens after the interval on the monotonic clock."""
+        self.logger.close()
+        with patch('modules.logging_utils.TELEGRAM_TOKEN', "token"), \
+                patch('modules.logging_utils.time.monotonic', side_effect=[100.0, 105.0, 110.5]):
+            for text in ("a", "b", "c"):
+                self.logger._send_telegram_notification(text)
+
+        self.assertEqual(self.logger._tg_q.qsize(), 2)
+        self.assertEqual(self.logger._tg_last_send, 110.5)
+
+    def test_performance_report(self):
+        """Test the report renders session figures and log counts."""
+        self.logger.log("failed", "ERROR")
+
+        report = self.logger.generate_performance_report(
+            {'total_trades': 4, 'winning_trades': 3, 'losing_trades': 1, 'total_profit': 12.345})
+
+        self.assertIn("  Win Rate: 75.0%", report)
+        self.assertIn("  Total Profit: 12.35", report)
+        self.assertIn("  Error Count: 1", report)
+        self.assertTrue(report.endswith("=" * 50))
+
+    def test_log_many_batches_outputs(self):
+        """Test log_many shares one timestamp, one file write and one Telegram summary."""
+        self.logger.set_level("INFO")
+        self.logger._send_telegram_notification = Mock()
+
+        with patch.object(self.logger, '_write_to_file', wraps=self.logger._write_to_file) as write:
+            self.logger.log_many([("DEBUG", "skipped"), ("INFO", "replayed"),
+                                  ("ERROR", "rejected"), ("INFO", "✅ filled")])
+        self.logger._file_q.join()
+
+        write.assert_called_once()
+        self.assertEqual([record[1:] for record in self.logger.log_buffer],
+                         [("INFO", "replayed"), ("ERROR", "rejected"), ("INFO", "✅ filled")])
+        self.assertEqual(len({record[0] for record in self.logger.log_buffer}), 1)
+        self.logger._send_telegram_notification.assert_called_once_with("rejected\n✅ filled")
+
+        with open(self.logger.log_file_path, encoding='utf-8') as f:
+            self.assertEqual(len(f.read().splitlines()), 3)
+
+    def test_close_stops_writer(self):
+        """Test close flushes and stops the writer thread."""
+        self.logger.log("bye")
+        self.logger.close()
+
+        self.assertFalse(self.logger._file_writer_thread.is_alive())
+        with open(self.logger.log_file_path, encoding='utf-8') as f:
+            self.assertIn("bye", f.read())
+
+
+if __name__ == '__main__':
+    unittest.main()
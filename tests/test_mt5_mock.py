@@ -0,0 +1,224 @@
+"""
+Unit tests for Mock MT5 Module
+"""
+
+import unittest
+from unittest.mock import patch
+import sys
+import os
+import datetime
+
+import numpy as np
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modules import mt5_mock
+from modules.mt5_mock import MockMT5, MockPosition, MockSymbolInfo, MockTick
+
+
+class TestMockMT5(unittest.TestCase):
+    """Test cases for MockMT5 class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.mt5 = MockMT5()
+        self.mt5.connected = True
+
+    def buy(self, symbol: str = "EURUSD", volume: float = 0.1):
+        """Open a market buy and return the trade result."""
+        return self.mt5.order_send({
+            'action': self.mt5.TRADE_ACTION_DEAL, 'symbol': symbol,
+            'volume': volume, 'type': self.mt5.ORDER_TYPE_BUY
+        })
+
+    def test_structs_are_slotted(self):
+        """Test mock structs keep the named-tuple helpers without a per-instance dict."""
+        info = MockSymbolInfo(name="TEST", digits=3)
+        self.assertFalse(hasattr(info, '__dict__'))
+        self.assertEqual(info.point, 0.00001)
+
+        changed = info._replace(digits=4)
+        self.assertEqual((info.digits, changed.digits, changed.name), (3, 4, "TEST"))
+        self.assertEqual(changed._asdict()['digits'], 4)
+        self.assertEqual(MockTick._fields[:3], ('time', 'bid', 'ask'))
+
+        with self.assertRaises(TypeError):
+            MockPosition(ticket=1)
+        with self.assertRaises(TypeError):
+            MockSymbolInfo(name="TEST", not_a_field=1)
+
+    def test_struct_defaults_are_lazy(self):
+        """Test only passed fields are stored and defaults are served from the class."""
+        info = MockSymbolInfo(name="TEST")
+        self.assertEqual(info._assigned, ('name',))
+        self.assertEqual(info.description, "Euro vs US Dollar")
+        self.assertEqual(info, MockSymbolInfo(**info._asdict()))
+
+        changed = info._replace(bid=1.2)
+        self.assertEqual(changed._assigned, ('name', 'bid'))
+        self.assertEqual((changed.name, changed.bid, changed.digits), ("TEST", 1.2, info.digits))
+        with self.assertRaises(AttributeError):
+            info.not_a_field
+
+    def test_structs_keep_tuple_behaviour(self):
+        """Test structs hash, index and unpack in field order like the named tuples they replace."""
+        info = MockSymbolInfo(name="TEST", digits=3)
+        self.assertEqual(hash(info), hash(MockSymbolInfo(**info._asdict())))
+        self.assertEqual(len({info, info._replace(digits=3), info._replace(digits=4)}), 2)
+
+        account = self.mt5.account_info()
+        self.assertEqual(account[0], account.login)
+        self.assertEqual(account[-1], getattr(account, account._fields[-1]))
+        self.assertEqual(account[:2], (account.login, account.trade_mode))
+        self.assertEqual(len(account), len(account._fields))
+
+        time_, bid, ask, *_ = self.mt5.symbol_info_tick("EURUSD")
+        self.assertLess(bid, ask)
+
+    def test_latency_defaults_off_and_configurable(self):
+        """Test initialize/order_send only sleep when a latency is configured."""
+        with patch('modules.mt5_mock.time.sleep') as sleep:
+            self.assertTrue(self.mt5.initialize())
+            self.buy()
+            sleep.assert_not_called()
+
+            self.mt5.set_latency(order=0.05)
+            self.buy()
+            sleep.assert_called_once_with(0.05)
+        self.assertEqual(self.mt5.init_latency, 0)
+
+    def test_terminal_info_shared_and_read_only(self):
+        """Test terminal info is a shared read-only mapping that tracks the connection."""
+        info = self.mt5.terminal_info()
+        self.assertTrue(info['connected'])
+        self.assertIs(info, self.mt5.terminal_info())
+        with self.assertRaises(TypeError):
+            info['connected'] = False
+
+        self.mt5.shutdown()
+        self.assertFalse(self.mt5.terminal_info()['connected'])
+        self.assertEqual(self.mt5.terminal_info()['build'], 4815)
+
+    def test_module_constants_resolve_from_class(self):
+        """Test module-level MT5 constants proxy the class values and unknown names still fail."""
+        self.assertEqual(mt5_mock.TRADE_RETCODE_DONE, MockMT5.TRADE_RETCODE_DONE)
+        self.assertEqual(mt5_mock.ORDER_FILLING_FOK, 0)
+        self.assertIn('TRADE_ACTION_SLTP', dir(mt5_mock))
+        with self.assertRaises(AttributeError):
+            mt5_mock.NOT_A_CONSTANT
+
+    def test_symbol_lookup_case_insensitive(self):
+        """Test symbol lookups accept any case and resolve to the same object."""
+        self.assertIs(self.mt5.symbol_info("eurusd"), self.mt5.symbol_info("EURUSD"))
+        self.assertTrue(self.mt5.symbol_select("XauUsd"))
+        self.assertIsNone(self.mt5.symbol_info("UNKNOWN"))
+        self.assertEqual([info.name for info in self.mt5.symbols_get("usd")][:2], ["EURUSD", "GBPUSD"])
+        self.assertEqual(len(self.mt5.symbols_get()), len(self.mt5.symbols))
+
+    def test_tick_noise_scaled_per_symbol(self):
+        """Test tick moves come from each symbol's noise buffer at its own scale."""
+        for symbol, scale in (("EURUSD", 0.0001), ("xauusd", 0.01), ("BTCUSD", 0.1)):
+            base = self.mt5.symbols[symbol.upper()].bid
+            moves = [self.mt5.symbol_info_tick(symbol).bid - base for _ in range(200)]
+            self.assertLessEqual(max(abs(move) for move in moves), scale + 1e-9, symbol)
+            self.assertGreater(max(abs(move) for move in moves), scale / 10, symbol)
+
+        tick = self.mt5.symbol_info_tick("EURUSD")
+        self.assertTrue(10 <= tick.volume <= 1000)
+        self.assertAlmostEqual(tick.ask - tick.bid, 0.0002)
+
+    def test_positions_profit_vectorized(self):
+        """Test batched profits match the per-position formula across symbols and sides."""
+        self.buy("EURUSD", 0.1)
+        self.buy("XAUUSD", 0.2)
+        self.mt5.order_send({'action': self.mt5.TRADE_ACTION_DEAL, 'symbol': "EURUSD",
+                             'volume': 0.3, 'type': self.mt5.ORDER_TYPE_SELL})
+        for _ in range(70):  # Grow past the initial array capacity
+            self.buy("GBPUSD", 0.01)
+
+        positions = self.mt5.positions_get()
+
+        self.assertEqual(len(positions), 73)
+        for pos in positions:
+            info = self.mt5.symbols[pos.symbol]
+            sign = 1 if pos.type == self.mt5.POSITION_TYPE_BUY else -1
+            expected = sign * (pos.price_current - pos.price_open) * pos.volume * info.trade_contract_size / info.point
+            self.assertAlmostEqual(pos.profit, expected, places=6)
+        self.assertEqual([pos.symbol for pos in self.mt5.positions_get(symbol="XAUUSD")], ["XAUUSD"])
+        self.assertEqual(self.mt5.positions_get(ticket=-1), [])
+
+    def test_history_deals_sliced_by_time(self):
+        """Test deal history is sliced by time range and filtered by group."""
+        self.mt5._deals_arr = self.mt5._deals_arr[:2]  # Force the deal store to grow
+        for ts, symbol in ((100, "EURUSD"), (200, "XAUUSD"), (300, "EURUSD")):
+            with patch('modules.mt5_mock.time.time_ns', return_value=ts * 10**9):
+                self.buy(symbol)
+
+        def at(ts):
+            return datetime.datetime.fromtimestamp(ts)
+
+        self.assertEqual([d.time for d in self.mt5.history_deals_get(at(150), at(300))], [200, 300])
+        self.assertEqual([d.time for d in self.mt5.history_deals_get(at(100), at(250), "eur")], [100])
+        self.assertEqual(self.mt5.history_deals_get(at(301), at(400)), [])
+        self.assertEqual([(d.symbol, d.order) for d in self.mt5.deals][1], ("XAUUSD", 100002))
+
+    def test_copy_rates_from_structured_array(self):
+        """Test rates come back as one MT5-shaped structured array of chained bars."""
+        start = datetime.datetime(2025, 1, 6, 9, 0)
+        rates = self.mt5.copy_rates_from("EURUSD", 5, start, 500)
+
+        self.assertIsInstance(rates, np.ndarray)
+        self.assertEqual(rates.dtype.names, ('time', 'open', 'high', 'low', 'close',
+                                             'tick_volume', 'spread', 'real_volume'))
+        self.assertEqual(len(rates), 500)
+        self.assertEqual(rates['time'][0], int(start.timestamp()))
+        self.assertTrue((np.diff(rates['time']) == 300).all())
+        self.assertTrue((np.abs(rates['open'][1:] - rates['close'][:-1]) <= 0.001 + 1e-12).all())
+        self.assertTrue((rates['high'] >= rates['open']).all() and (rates['low'] <= rates['open']).all())
+        self.assertTrue(((rates['tick_volume'] >= 100) & (rates['tick_volume'] <= 1000)).all())
+
+    def test_copy_rates_from_pos_ends_at_current_bar(self):
+        """Test positional rates end start_pos bars back from the current bar."""
+        with patch('modules.mt5_mock.time.time_ns', return_value=1_000_030 * 10**9):
+            rates = self.mt5.copy_rates_from_pos("EURUSD", 1, 2, 10)
+
+        self.assertEqual(rates.dtype, mt5_mock.RATES_DTYPE)
+        self.assertEqual(len(rates), 10)
+        self.assertEqual(rates['time'][-1], 1_000_020 - 2 * 60)
+        self.assertTrue((np.diff(rates['time']) == 60).all())
+
+    def test_account_info_cached_until_positions_change(self):
+        """Test account snapshots are reused until positions are opened or repriced."""
+        first = self.mt5.account_info()
+        self.assertIs(self.mt5.account_info(), first)
+
+        self.buy()
+        positions = self.mt5.positions_get()
+        account = self.mt5.account_info()
+        self.assertIsNot(account, first)
+        self.assertAlmostEqual(account.profit, positions[0].profit)
+        self.assertEqual(self.mt5.positions[positions[0].ticket].profit, 0.0)  # Reads do not write back
+        self.assertAlmostEqual(account.equity, account.balance + account.profit)
+
+        self.mt5.account_info_data = self.mt5.account_info_data._replace(balance=500.0)
+        self.assertEqual(self.mt5.account_info().balance, 500.0)
+
+    def test_order_send_opens_position(self):
+        """Test a market order creates a position, a deal and an SL/TP update path."""
+        result = self.buy()
+
+        self.assertEqual(result.retcode, self.mt5.TRADE_RETCODE_DONE)
+        position = self.mt5.positions_get(ticket=result.order)[0]
+        self.assertEqual(position.symbol, "EURUSD")
+        self.assertEqual(position.volume, 0.1)
+        self.assertEqual(len(self.mt5.deals), 1)
+
+        modify = self.mt5.order_send({'action': self.mt5.TRADE_ACTION_SLTP, 'symbol': "EURUSD",
+                                      'volume': 0.1, 'position': result.order, 'sl': 1.08})
+        self.assertEqual(modify.retcode, self.mt5.TRADE_RETCODE_DONE)
+        self.assertEqual(self.mt5.positions_get(ticket=result.order)[0].sl, 1.08)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,197 @@
+"""
+Unit tests for News Filter Module
+"""
+
+import unittest
+from unittest.mock import Mock, patch
+import sys
+import os
+import datetime
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modules.news_filter import NewsFilter, _utc_minute_parts
+from modules.logging_utils import BotLogger
+
+
+def utc(day: int, hour: int, minute: int) -> float:
+    """Unix timestamp in the UTC week of Monday 2025-01-06 (day 0 = Monday)."""
+    return datetime.datetime(2025, 1, 6 + day, hour, minute, tzinfo=datetime.timezone.utc).timestamp()
+
+
+class TestNewsFilter(unittest.TestCase):
+    """Test cases for NewsFilter class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.logger = Mock(spec=BotLogger)
+        self.news_filter = NewsFilter(self.logger)
+
+    def test_scheduled_news_windows(self):
+        """Test daily and weekly windows match inclusively at both ends."""
+        def check(timestamp):
+            _, minutes, weekday = _utc_minute_parts(timestamp)
+            return self.news_filter._is_scheduled_news_time(minutes, weekday)
+
+        self.assertTrue(check(utc(0, 8, 30)))
+        self.assertTrue(check(utc(0, 9, 30)))
+        self.assertFalse(check(utc(0, 9, 31)))
+        self.assertFalse(check(utc(0, 0, 0)))
+        self.assertTrue(check(utc(4, 14, 45)))   # Friday NFP window
+        self.assertFalse(check(utc(3, 14, 45)))  # Same time on Thursday
+        self.assertFalse(check(utc(5, 12, 0)))
+
+    def test_utc_minute_parts_match_datetime(self):
+        """Test the integer calendar split agrees with datetime across a week."""
+        for day in range(7):
+            timestamp = utc(day, 23, 59) + 30
+            when = datetime.datetime.fromtimestamp(timestamp, datetime.timezone.utc)
+            self.assertEqual(_utc_minute_parts(timestamp)[1:], (when.hour * 60 + when.minute, when.weekday()))
+
+    def test_news_window_logged_once_per_minute(self):
+        """Test repeated checks inside a news window log only once per minute."""
+        with patch('modules.news_filter.time.time', side_effect=[600.0, 630.0, 660.0]):
+            for _ in range(3):
+                self.assertTrue(self.news_filter._is_scheduled_news_time(9 * 60, 0))
+
+        self.assertEqual(self.logger.log.call_count, 2)
+
+    def test_overlapping_windows_merged(self):
+        """Test overlapping windows collapse into sorted, disjoint bounds."""
+        starts, ends = NewsFilter._build_intervals([(12, 0, 13, 0), (8, 0, 9, 0), (12, 30, 14, 0)])
+
+        self.assertEqual(starts, [480, 720])
+        self.assertEqual(ends, [540, 840])
+        self.assertTrue(NewsFilter._in_intervals(starts, ends, 800))
+        self.assertFalse(NewsFilter._in_intervals(starts, ends, 600))
+
+    def test_news_flag_memoized_per_minute(self):
+        """Test repeat checks within a minute reuse the result and recompute after rollover."""
+        self.news_filter._is_scheduled_news_time = Mock(return_value=True)
+        self.news_filter.clear_expired_events = Mock()
+
+        with patch('modules.news_filter.time.time', side_effect=[600.0, 659.9, 660.0]):
+            results = [self.news_filter.is_high_impact_news_time() for _ in range(3)]
+
+        self.assertEqual(results, [True, True, True])
+        self.assertEqual(self.news_filter._is_scheduled_news_time.call_count, 2)
+        self.assertEqual(self.news_filter.clear_expired_events.call_count, 2)
+
+    def test_upcoming_events_memoized_per_window(self):
+        """Test upcoming events are cached per hours_ahead and returned as fresh lists."""
+        with patch('modules.news_filter.time.time', return_value=600.0):
+            first = self.news_filter.get_upcoming_news_events(24)
+            first.clear()
+            again = self.news_filter.get_upcoming_news_events(24)
+            short = self.news_filter.get_upcoming_news_events(1)
+
+        self.assertTrue(again)
+        self.assertEqual(set(self.news_filter._upcoming_cache), {24, 1})
+        self.assertLessEqual(len(short), len(again))
+
+    def test_event_index_built_once_per_date(self):
+        """Test window queries slice the day's event index instead of regenerating it."""
+        with patch.object(self.news_filter, '_build_event_index',
+                          wraps=self.news_filter._build_event_index) as build:
+            week = self.news_filter.get_upcoming_news_events(24 * 7)
+            self.news_filter._upcoming_cache.clear()
+            day = self.news_filter.get_upcoming_news_events(24)
+
+        build.assert_called_once()
+        self.assertEqual(day, week[:len(day)])
+        self.assertLess(len(day), len(week))
+        self.assertEqual([e['time'] for e in week], sorted(e['time'] for e in week))
+        self.assertIn("Non-Farm Payrolls & Major Economic Data", {e['title'] for e in week})
+
+    def test_expired_events_swept_without_explicit_clear(self):
+        """Test expired custom events are dropped on add milestones and on the news-flag minute flip."""
+        past = datetime.datetime.utcnow() - datetime.timedelta(days=1)
+        for i in range(31):
+            self.news_filter.add_custom_news_event(past + datetime.timedelta(minutes=i), f"Old {i}")
+        self.assertEqual(len(self.news_filter.news_cache), 31)
+
+        self.news_filter.add_custom_news_event(past - datetime.timedelta(minutes=1), "Old 31")
+        self.assertEqual(len(self.news_filter.news_cache), 0)
+
+        self.news_filter.add_custom_news_event(past, "Old again")
+        self.news_filter.is_high_impact_news_time()
+        self.assertEqual(len(self.news_filter.news_cache), 0)
+
+    def test_news_summary_matches_upcoming_events(self):
+        """Test the summary's count and next event agree with the upcoming-events list."""
+        with patch('modules.news_filter.time.time', return_value=utc(4, 10, 0)):
+            summary = self.news_filter.get_news_summary()
+            upcoming = self.news_filter.get_upcoming_news_events(24)
+
+        self.assertEqual(summary['current_time_utc'], "2025-01-10 10:00:00")
+        self.assertEqual(summary['upcoming_events_24h'], len(upcoming))
+        self.assertIs(summary['next_event'], upcoming[0])
+        self.assertEqual(summary['time_to_next_event'], "2.5 hours")
+
+    def test_clear_expired_events_pops_only_expired(self):
+        """Test expiry removes past custom events, keeps future ones and follows replacements."""
+        now = datetime.datetime.utcnow()
+        self.news_filter.add_custom_news_event(now + datetime.timedelta(hours=2), "Future CPI draft")
+        self.news_filter.add_custom_news_event(now - datetime.timedelta(hours=2), "Past CPI")
+        self.news_filter.add_custom_news_event(now + datetime.timedelta(hours=2), "Future CPI")
+
+        self.news_filter.clear_expired_events()
+
+        self.assertEqual([e['title'] for e in self.news_filter.news_cache.values()], ["Future CPI"])
+        self.assertEqual(len(self.news_filter._custom_ts), 1)
+        self.assertEqual([key for key, _ in self.news_filter._custom_events], list(self.news_filter.news_cache))
+
+    def test_session_hours_parsed_once(self):
+        """Test session bounds are pre-parsed, including sessions that wrap midnight."""
+        asia = self.news_filter._session_hours["Asia"]
+        self.assertEqual(asia, (21 * 60, 6 * 60, True))
+
+        in_session = self.news_filter._is_time_in_session_hours
+        self.assertTrue(in_session(23 * 60, asia))
+        self.assertTrue(in_session(6 * 60, asia))
+        self.assertFalse(in_session(12 * 60, asia))
+        self.assertFalse(in_session(12 * 60, NewsFilter._parse_session_hours({'start': "bad", 'end': "06:00"})))
+
+        status = self.news_filter.get_market_hours_status()
+        self.assertRegex(status['current_time_utc'], r'^\d{2}:\d{2}$')
+        self.assertEqual(status['sessions']["Asia"]['start'], "21:00")
+
+    def test_should_avoid_trading_uses_hour_buckets(self):
+        """Test avoidance checks read only nearby buckets and see scheduled and custom events."""
+        with patch('modules.news_filter.time.time', return_value=utc(0, 11, 20)):
+            self.news_filter.is_high_impact_news_time = Mock(return_value=False)
+            avoid, _ = self.news_filter.should_avoid_trading("EURUSD", "HFT")
+            self.assertTrue(avoid)  # 12:30 window starts within 2 hours
+            self.assertEqual(self.news_filter.should_avoid_trading("EURUSD"),
+                             (False, "No news conflicts detected"))
+
+            self.news_filter.add_custom_news_event(datetime.datetime(2025, 1, 6, 12, 10), "Rate decision")
+            avoid, reason = self.news_filter.should_avoid_trading("eurusd")
+
+        self.assertTrue(avoid)
+        self.assertEqual(reason, "Upcoming major currency news in 1 hour")
+
+    @patch.dict(os.environ, {'NEWS_API_URL': "https://news.example", 'NEWS_API_KEY': "key"})
+    @patch('modules.news_filter.random.uniform', return_value=0.0)
+    @patch('modules.news_filter.requests.get')
+    def test_api_backoff_on_failure(self, get, uniform):
+        """Test failed API polls back off exponentially and a success resets the interval."""
+        get.return_value = Mock(status_code=503)
+        now = datetime.datetime.utcnow()
+
+        with patch('modules.news_filter.time.time', side_effect=[1000.0, 1050.0, 1120.0, 1400.0]):
+            for _ in range(3):
+                self.news_filter._is_api_news_time(now)
+            self.assertEqual(get.call_count, 2)  # 1050 falls inside the first 120s backoff
+            self.assertEqual(self.news_filter._api_next_call, 1120.0 + 240)
+
+            get.return_value = Mock(status_code=200, json=Mock(return_value={'events': []}))
+            self.assertFalse(self.news_filter._is_api_news_time(now))
+
+        self.assertEqual(self.news_filter._api_backoff, 60)
+        self.assertEqual(self.news_filter._api_next_call, 1460.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -7,11 +7,13 @@ from unittest.mock import Mock, patch, MagicMock
 import sys
 import os
 import time
+import threading
 
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from modules.orders import OrderManager
+from config import MAX_POSITIONS
 from modules.logging_utils import BotLogger
 from tests import MOCK_ACCOUNT_INFO, MOCK_SYMBOL_INFO, MOCK_TICK_DATA, TEST_SYMBOL, TEST_LOT_SIZE
 
@@ -129,6 +131,7 @@ class TestOrderManager(unittest.TestCase):
             self.logger, self.mt5, self.symbol_manager, 
             self.risk_manager, self.account_manager
         )
+        self.addCleanup(self.order_manager.shutdown)
     
     def test_open_order_success(self):
         """Test successful order opening."""
@@ -175,7 +178,62 @@ class TestOrderManager(unittest.TestCase):
         
         self.assertTrue(result1)
         self.assertFalse(result2)  # Should be rate limited
-    
+
+    def test_open_order_symbols_do_not_serialize(self):
+        """Test an in-flight send on one symbol does not block another symbol's order."""
+        in_flight, release = threading.Event(), threading.Event()
+
+        def order_send(request):
+            if request['symbol'] == TEST_SYMBOL:
+                in_flight.set()
+                release.wait(5)
+            return MockOrderResult(retcode=self.mt5.TRADE_RETCODE_DONE, order=1)
+
+        self.mt5.order_send.side_effect = order_send
+        first = threading.Thread(target=self.order_manager.open_order, args=(TEST_SYMBOL, TEST_LOT_SIZE, "BUY"))
+        first.start()
+        self.assertTrue(in_flight.wait(5))
+
+        self.assertTrue(self.order_manager.open_order("GBPUSD", TEST_LOT_SIZE, "BUY"))
+        release.set()
+        first.join(5)
+
+        self.assertFalse(self.order_manager.open_order(TEST_SYMBOL, TEST_LOT_SIZE, "BUY"))
+        self.assertLess(self.order_manager._buckets[TEST_SYMBOL][0], 1.0)
+
+    def test_open_order_position_cap_across_symbols(self):
+        """Test concurrent orders on two symbols at MAX_POSITIONS - 1 open only one position."""
+        self.account_manager.get_position_count.return_value = MAX_POSITIONS - 1
+        in_flight, release = threading.Event(), threading.Event()
+
+        def order_send(request):
+            in_flight.set()
+            release.wait(5)
+            return MockOrderResult(retcode=self.mt5.TRADE_RETCODE_DONE, order=1)
+
+        self.mt5.order_send.side_effect = order_send
+        first = threading.Thread(target=self.order_manager.open_order, args=(TEST_SYMBOL, TEST_LOT_SIZE, "BUY"))
+        first.start()
+        self.assertTrue(in_flight.wait(5))
+
+        self.assertFalse(self.order_manager.open_order("GBPUSD", TEST_LOT_SIZE, "BUY"))
+        release.set()
+        first.join(5)
+
+        self.mt5.order_send.assert_called_once()
+        self.assertEqual(self.order_manager._pending_opens, 0)
+
+    def test_open_order_releases_slot_on_failure(self):
+        """Test a rejected order gives its reserved position slot back."""
+        self.account_manager.get_position_count.return_value = MAX_POSITIONS - 1
+        self.mt5.order_send.return_value = MockOrderResult(retcode=self.mt5.TRADE_RETCODE_ERROR)
+
+        self.assertFalse(self.order_manager.open_order(TEST_SYMBOL, TEST_LOT_SIZE, "BUY"))
+        self.assertEqual(self.order_manager._pending_opens, 0)
+
+        self.mt5.order_send.return_value = MockOrderResult(retcode=self.mt5.TRADE_RETCODE_DONE, order=1)
+        self.assertTrue(self.order_manager.open_order("GBPUSD", TEST_LOT_SIZE, "BUY"))
+
     def test_open_order_max_positions(self):
         """Test order rejection when max positions reached."""
         # Mock max positions reached
@@ -451,7 +509,54 @@ class TestOrderManager(unittest.TestCase):
             result = self.order_manager.close_all_positions()
             
         self.assertFalse(result)  # Should fail if not all positions closed
-    
+
+    def test_close_all_positions_parallel(self):
+        """Test bulk closes run on the pool without fixed sleeps."""
+        self.account_manager.get_positions.return_value = [{'ticket': t} for t in range(4)]
+
+        with patch.object(self.order_manager, 'close_position', return_value=True) as close, \
+                patch('modules.orders.time.sleep') as sleep:
+            self.assertTrue(self.order_manager.close_all_positions())
+
+        sleep.assert_not_called()
+        self.assertEqual(sorted(call.args[0] for call in close.call_args_list), [0, 1, 2, 3])
+
+    def test_close_position_backs_off_when_throttled(self):
+        """Test 'Too frequent requests' retries the close and paces later closes until they succeed."""
+        position = MockPosition(ticket=123456, symbol=TEST_SYMBOL, volume=TEST_LOT_SIZE,
+                                type_pos=self.mt5.POSITION_TYPE_BUY, price_open=1.08500)
+        self.mt5.positions_get.return_value = [position]
+        self.mt5.symbol_info_tick.return_value = Mock(bid=1.08520, ask=1.08540)
+        throttled = MockOrderResult(retcode=10024)
+        done = MockOrderResult(retcode=self.mt5.TRADE_RETCODE_DONE)
+        self.mt5.order_send.side_effect = [throttled, throttled, done, done]
+
+        with patch('modules.orders.time.sleep') as sleep:
+            self.assertTrue(self.order_manager.close_position(123456))
+            self.assertEqual(self.mt5.order_send.call_count, 3)
+            self.assertEqual(sleep.call_count, 2)
+            self.assertEqual(self.order_manager.close_pacing_interval, 0.1)  # 0.2 halved by the success
+
+            self.assertTrue(self.order_manager.close_position(123456))
+        self.assertEqual(self.order_manager.close_pacing_interval, 0.0)
+
+    def test_close_all_positions_after_stop_and_restart(self):
+        """Test a bulk close after shutdown (bot stop, then start) runs on a fresh pool."""
+        self.account_manager.get_positions.return_value = [{'ticket': 1}, {'ticket': 2}]
+
+        with patch.object(self.order_manager, 'close_position', return_value=True) as close:
+            self.assertTrue(self.order_manager.close_all_positions())
+            first_pool = self.order_manager._close_pool
+
+            self.order_manager.shutdown()
+            self.assertIsNone(self.order_manager._close_pool)
+            self.order_manager.shutdown()  # Stopping twice is harmless
+
+            self.assertTrue(self.order_manager.close_all_positions())
+
+        self.assertEqual(close.call_count, 4)
+        self.assertIsNot(self.order_manager._close_pool, first_pool)
+
     def test_modify_position_success(self):
         """Test successful position modification."""
         position = MockPosition(
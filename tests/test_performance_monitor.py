@@ -0,0 +1,124 @@
+"""
+Unit tests for Performance Monitoring Module
+"""
+
+import unittest
+from unittest.mock import Mock, patch
+import sys
+import os
+import threading
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modules.performance_monitor import PerformanceMonitor, LatencyOptimizer
+from modules.logging_utils import BotLogger
+
+
+class TestPerformanceMonitor(unittest.TestCase):
+    """Test cases for PerformanceMonitor class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.logger = Mock(spec=BotLogger)
+        self.monitor = PerformanceMonitor(self.logger)
+        self.addCleanup(setattr, self.monitor, 'monitoring_active', False)
+
+    def test_running_sums_track_windows(self):
+        """Test running sums and the strategy average follow the bounded deques."""
+        for i in range(1100):
+            self.monitor.record_execution_time("tick", i * 0.0001)
+        for i in range(150):
+            signal_id = self.monitor.record_signal_detection("HFT")
+            self.monitor.record_signal_completion(signal_id, "HFT", executed=i % 2 == 0)
+        for _ in range(120):
+            self.monitor.check_cpu_usage()
+
+        latencies = self.monitor.signal_latencies["HFT"]
+        self.assertEqual(len(latencies), 100)
+        self.assertAlmostEqual(self.monitor.execution_times.total, sum(self.monitor.execution_times))
+        self.assertAlmostEqual(self.monitor.cpu_usage.total, sum(self.monitor.cpu_usage))
+        self.assertAlmostEqual(self.monitor.strategy_performance["HFT"]['avg_latency'],
+                               sum(latencies) / len(latencies))
+        self.assertEqual(self.monitor.strategy_performance["HFT"]['executed'], 75)
+
+    def test_signal_slots_recycled(self):
+        """Test signal IDs complete once and abandoned slots are reclaimed by newer signals."""
+        abandoned = self.monitor.record_signal_detection("Scalping", timestamp=1.0)
+        for _ in range(self.monitor.SIGNAL_SLOTS):
+            latest = self.monitor.record_signal_detection("HFT")
+
+        self.assertEqual(latest & self.monitor._sig_mask, abandoned & self.monitor._sig_mask)
+        self.monitor.record_signal_completion(abandoned, "Scalping")
+        self.assertNotIn("Scalping", self.monitor.strategy_performance)
+
+        self.monitor.record_signal_completion(latest, "HFT")
+        self.monitor.record_signal_completion(latest, "HFT")
+        self.assertEqual(self.monitor.strategy_performance["HFT"]['signals'], 1)
+
+    def test_summary_samples_system_once(self):
+        """Test one summary reads memory and CPU once and grades health from that snapshot."""
+        self.monitor.process = Mock()
+        self.monitor.process.memory_info.return_value = Mock(rss=self.monitor.baseline_memory * 1024 * 1024)
+        self.monitor.process.cpu_percent.return_value = 95.0
+
+        summary = self.monitor.get_performance_summary()
+
+        self.monitor.process.memory_info.assert_called_once()
+        self.monitor.process.cpu_percent.assert_called_once()
+        self.assertEqual(summary['health_status'], "WARNING - High CPU Usage")
+        self.assertEqual(summary['execution']['total_operations'], 0)
+
+
+class TestLatencyOptimizer(unittest.TestCase):
+    """Test cases for LatencyOptimizer class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.logger = Mock(spec=BotLogger)
+        self.optimizer = LatencyOptimizer(self.logger)
+
+    def test_prefetch_fetches_symbols_concurrently(self):
+        """Test prefetch issues the per-symbol fetches in parallel and fills both caches."""
+        symbols = ["EURUSD", "GBPUSD", "XAUUSD"]
+        barrier = threading.Barrier(len(symbols), timeout=5)
+
+        def get_symbol_info(symbol):
+            barrier.wait()  # Only passes if every symbol is in flight at once
+            return {'name': symbol}
+
+        symbol_manager = Mock()
+        symbol_manager.get_symbol_info.side_effect = get_symbol_info
+        mt5 = Mock()
+        mt5.symbol_info_tick.return_value = Mock(bid=1.0, ask=1.2)
+
+        self.optimizer.prefetch_symbol_data(symbols, symbol_manager, mt5)
+
+        self.assertEqual(self.optimizer.get_cached_symbol_info("GBPUSD", symbol_manager), {'name': "GBPUSD"})
+        self.assertAlmostEqual(self.optimizer.get_cached_price("XAUUSD", mt5), 1.1)
+        self.assertEqual(symbol_manager.get_symbol_info.call_count, 3)
+        self.assertEqual(mt5.symbol_info_tick.call_count, 3)
+
+    def test_cache_entries_expire(self):
+        """Test each cache entry carries its own expiry and is refetched once it lapses."""
+        mt5 = Mock()
+        mt5.symbol_info_tick.return_value = Mock(bid=1.0, ask=1.2)
+
+        with patch('modules.performance_monitor.time.time', return_value=100.0):
+            self.optimizer.get_cached_price("EURUSD", mt5)
+        self.assertEqual(self.optimizer._price_entries["EURUSD"][0], 100.5)
+
+        with patch('modules.performance_monitor.time.time', return_value=100.4):
+            self.optimizer.get_cached_price("EURUSD", mt5)
+        self.assertEqual(mt5.symbol_info_tick.call_count, 1)
+
+        with patch('modules.performance_monitor.time.time', return_value=100.5):
+            self.optimizer.get_cached_price("EURUSD", mt5)
+        self.assertEqual(mt5.symbol_info_tick.call_count, 2)
+
+        self.optimizer.clear_cache()
+        self.assertEqual(self.optimizer._price_entries, {})
+
+
+if __name__ == '__main__':
+    unittest.main()